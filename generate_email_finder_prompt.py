@@ -3,35 +3,28 @@
 Generate prompts specifically for finding missing email addresses
 """
 
-import csv
+import sys
 from pathlib import Path
 
+from university_catalog import get_catalog
+from progress_store import ProgressStore, EMAIL_PASS
+
+def load_university(idx):
+    """Return the row for university #idx (1-based) in universities_missing_emails.csv"""
+    return get_catalog(Path("universities_missing_emails.csv")).get(idx)
+
 def get_next_university():
-    # Read progress
-    progress_file = Path("email_finder_progress.txt")
-    try:
-        with open(progress_file, 'r') as f:
-            lines = f.readlines()
-            if len(lines) >= 1 and '=' in lines[0]:
-                last_processed = int(lines[0].split('=')[1].strip())
-            else:
-                last_processed = 0
-    except:
-        last_processed = 0
-    
-    # Read universities with missing emails
-    universities_file = Path("universities_missing_emails.csv")
-    with open(universities_file, 'r', encoding='utf-8') as f:
-        reader = list(csv.DictReader(f))
-    
-    # Get next university
-    if last_processed < len(reader):
-        return last_processed + 1, reader[last_processed]
-    
-    return None, None
+    """Atomically claim the next university from the progress store"""
+    job = ProgressStore().claim_next(EMAIL_PASS)
+    if not job:
+        return None, None
+    return job['idx'], load_university(job['idx'])
 
-def generate_prompt():
-    idx, uni = get_next_university()
+def generate_prompt(idx=None):
+    if idx is None:
+        idx, uni = get_next_university()
+    else:
+        uni = load_university(idx)
     
     if not uni:
         return "ALL UNIVERSITIES WITH MISSING EMAILS PROCESSED!"
@@ -105,7 +98,8 @@ This is a SECOND PASS - be extremely thorough!"""
     return prompt
 
 if __name__ == "__main__":
-    prompt = generate_prompt()
+    # Optional index of an already-claimed job (smart_email_finder.sh claims first)
+    prompt = generate_prompt(int(sys.argv[1]) if len(sys.argv) > 1 else None)
     
     # Save to file for Claude Desktop
     with open("current_prompt.txt", "w") as f:
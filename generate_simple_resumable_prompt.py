@@ -1,53 +1,58 @@
 #!/usr/bin/env python3
 """
 Simplified prompt generator with URL tracking for resume capability
+
+The instrument and its search terms come from instruments.toml
+(see instrument_profile.py).
 """
 
-import csv
+import sys
 from pathlib import Path
 
+from instrument_profile import current_profile
+from university_catalog import get_catalog
+from progress_store import ProgressStore, SCRAPE_PASS
+from url_log import last_url
+
+def load_university(idx):
+    """Return the row for university #idx (1-based)"""
+    return get_catalog(Path("music_schools_wikipedia.csv")).get(idx)
+
 def get_next_university():
-    # Read progress
-    progress_file = Path("progress_tracker.txt")
-    try:
-        with open(progress_file, 'r') as f:
-            lines = f.readlines()
-            if len(lines) >= 1 and '=' in lines[0]:
-                last_processed = int(lines[0].split('=')[1].strip())
-            else:
-                last_processed = int(lines[0].strip()) if lines else 0
-    except (ValueError, IndexError):
-        print("Warning: progress_tracker.txt format issue, resetting to 0")
-        last_processed = 0
-    
-    # Read universities CSV
-    universities_file = Path("music_schools_wikipedia.csv")
-    with open(universities_file, 'r', encoding='utf-8') as f:
-        reader = list(csv.DictReader(f))
-    
-    # Get next university with URL
-    for i in range(last_processed, len(reader)):
-        if reader[i]['URL']:
-            return i + 1, reader[i]  # Return 1-based index
-    
-    return None, None
+    """Atomically claim the next university from the progress store"""
+    job = ProgressStore().claim_next(SCRAPE_PASS)
+    if not job:
+        return None, None
+    return job['idx'], load_university(job['idx'])
 
 def check_for_resume(idx):
     """Check if we need to resume from a previous incomplete run"""
     url_log = Path(f"tmp/uni_{idx:03d}_urls.txt")
     if url_log.exists() and url_log.stat().st_size > 0:
-        with open(url_log, 'r') as f:
-            urls = f.readlines()
-            if urls:
-                return urls[-1].strip()  # Return last URL visited
+        return last_url(url_log)  # Return last URL visited
     return None
 
-def generate_prompt():
-    idx, uni = get_next_university()
+def generate_prompt(idx=None):
+    if idx is None:
+        idx, uni = get_next_university()
+    else:
+        uni = load_university(idx)
     
     if not uni:
         return "ALL UNIVERSITIES PROCESSED!"
     
+    return build_prompt(idx, uni)
+
+def build_prompt(idx, uni, progress_file="progress_tracker.txt", profile=None):
+    """Build the scraping prompt for university #idx (1-based)
+    
+    progress_file lets parallel workers give each job its own tracker
+    instead of sharing progress_tracker.txt.
+    """
+    profile = profile or current_profile()
+    instrument = profile.name
+    also_counts = f"\n   - Also counts: {', '.join(profile.aliases)}" if profile.aliases else ""
+    
     # Check if we're resuming
     last_url = check_for_resume(idx)
     
@@ -60,7 +65,7 @@ def generate_prompt():
         prompt = f"""RESUMING university #{idx}: {uni['University Name']}
 
 Last URL visited: {last_url}
-Continue from there and find remaining trombone faculty.
+Continue from there and find remaining {instrument} faculty.
 
 CRITICAL: EMAIL ADDRESSES ARE REQUIRED!
 - Only save faculty WITH email addresses
@@ -75,7 +80,7 @@ RESUME STEPS:
    - Individual faculty pages
    - Department contact pages
    - Directory listings
-4. Update progress_tracker.txt - REPLACE the entire file with exactly these 2 lines:
+4. Update {progress_file} - REPLACE the entire file with exactly these 2 lines:
    LAST_PROCESSED={idx}
    TOTAL_UNIVERSITIES=202
 5. Say only: "Done #{idx}"
@@ -90,8 +95,8 @@ CRITICAL: EMAIL ADDRESSES ARE REQUIRED - Without emails, the data is useless!
 STEPS:
 1. Navigate to URL
 2. IMMEDIATELY write this URL to: {url_log_file}
-3. SEARCH FOR TROMBONE:
-   - First: Look for search bar (usually upper right of page) - type "trombone faculty"
+3. SEARCH FOR {instrument.upper()}:
+   - First: Look for search bar (usually upper right of page) - type "{profile.search_phrase}"{also_counts}
    - If no search bar: Navigate to School of Music or Faculty pages
    - Click search results and explore thoroughly
 4. For EACH faculty member found:
@@ -109,24 +114,25 @@ ESSENTIAL:
 - If no email found after checking profile, mark as "NO EMAIL FOUND - SKIP"
 - Spend extra time searching for emails - they are often on separate contact pages
 
-7. Update progress_tracker.txt - REPLACE the entire file with exactly these 2 lines:
+7. Update {progress_file} - REPLACE the entire file with exactly these 2 lines:
    LAST_PROCESSED={idx}
    TOTAL_UNIVERSITIES=202
 8. Say only: "Done #{idx}"
 
 SEARCH PRIORITY:
-1. Use search bar in upper right (type "trombone faculty")
+1. Use search bar in upper right (type "{profile.search_phrase}")
 2. Try /faculty, /music, /directory, /contact pages
 3. School of Music page
 4. Faculty directory
 5. Music faculty list
 
-If NO trombone faculty WITH EMAILS: write to results/no_trombone_found.csv"""
+If NO {instrument} faculty WITH EMAILS: write to {profile.no_found_file}"""
     
     return prompt
 
 if __name__ == "__main__":
-    prompt = generate_prompt()
+    # Optional index of an already-claimed job (smart_automated_scraper_v2.sh claims first)
+    prompt = generate_prompt(int(sys.argv[1]) if len(sys.argv) > 1 else None)
     
     # Save to file for Claude Desktop
     with open("current_prompt.txt", "w") as f:
@@ -7,9 +7,15 @@ and create a new CSV for targeted second pass
 import csv
 from collections import defaultdict
 
+from instrument_profile import current_profile
+from university_catalog import get_catalog
+
 def analyze_missing_emails():
-    # Read the master file
-    master_file = "trombone_faculty_master_20250811.csv"
+    # Read the newest first-pass master for this instrument
+    master_file = current_profile().latest_master()
+    if not master_file:
+        print(f"No {current_profile().master_prefix}*.csv found - run merge_with_urls.py first")
+        return []
     
     # Track universities with missing emails
     missing_by_university = defaultdict(list)
@@ -59,12 +65,8 @@ def analyze_missing_emails():
             'Faculty_Names': '; '.join([f['name'] for f in missing_by_university[uni]])
         })
     
-    # Read original Wikipedia CSV to get URLs
-    wiki_data = {}
-    with open('music_schools_wikipedia.csv', 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            wiki_data[row['University Name']] = row['URL']
+    # Look up URLs in the indexed Wikipedia catalog
+    catalog = get_catalog('music_schools_wikipedia.csv')
     
     # Create new CSV for universities needing email updates
     output_file = 'universities_missing_emails.csv'
@@ -75,7 +77,7 @@ def analyze_missing_emails():
         
         for uni_data in universities_to_retry:
             uni_name = uni_data['University Name']
-            uni_data['URL'] = wiki_data.get(uni_name, '')
+            uni_data['URL'] = catalog.url_for(uni_name)
             writer.writerow(uni_data)
     
     print(f"\n{'=' * 60}")
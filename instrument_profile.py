@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Instrument profiles - which instrument a run is searching for, loaded from instruments.toml
+
+The scripts live once in the top-level folder and are run from inside an
+instrument's data folder (piano-faculty/, violin-faculty/, ...). The
+instrument comes from $INSTRUMENT, else from the folder name
+(<instrument>-faculty), else defaults to trombone. Instruments missing from
+instruments.toml still work with defaults derived from their name.
+
+Each profile's keywords and aliases compile to one case-insensitive regex,
+cached per set of terms, so matching "Bass Trombone" or "sackbut" in page
+text costs the same as matching a single word.
+
+Usage:
+  python3 instrument_profile.py [field]   # print a field of the current profile (default: title)
+  python3 instrument_profile.py list      # list configured instruments
+"""
+
+import os
+import re
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
+
+PROFILES_FILE = Path(__file__).resolve().parent / "instruments.toml"
+DEFAULT_INSTRUMENT = "trombone"
+FOLDER_SUFFIX = "-faculty"
+
+@lru_cache(maxsize=None)
+def compile_matcher(terms):
+    """One regex for a tuple of terms; longest first so "bass trombone" wins over "trombone" """
+    alternatives = sorted({term.lower() for term in terms if term}, key=len, reverse=True)
+    pattern = r'\b(?:' + '|'.join(re.escape(term).replace(r'\ ', r'\s+') for term in alternatives) + r')s?\b'
+    return re.compile(pattern, re.IGNORECASE)
+
+class InstrumentProfile:
+    def __init__(self, name, title=None, keywords=None, aliases=None, search_phrase=None, output_name=None):
+        self.name = name.lower()
+        self.title = title or self.name.title()
+        self.keywords = list(keywords or [self.name])
+        self.aliases = list(aliases or [])
+        self.search_phrase = search_phrase or f"{self.name} faculty"
+        self.output_name = output_name or f"{self.name}_faculty"
+
+    def __repr__(self):
+        return f"InstrumentProfile({self.name!r})"
+
+    @property
+    def terms(self):
+        return tuple(self.keywords + self.aliases)
+
+    @property
+    def matcher(self):
+        return compile_matcher(self.terms)
+
+    def matches(self, text):
+        """True if text mentions the instrument or one of its aliases"""
+        return bool(text) and self.matcher.search(text) is not None
+
+    @property
+    def folder(self):
+        return Path(f"{self.name}{FOLDER_SUFFIX}")
+
+    @property
+    def master_prefix(self):
+        return f"{self.output_name}_master_"
+
+    @property
+    def no_found_file(self):
+        return f"results/no_{self.name}_found.csv"
+
+    def master_file(self, date, final=False):
+        """<output_name>_master_[FINAL_]YYYYMMDD.csv"""
+        return f"{self.master_prefix}{'FINAL_' if final else ''}{date}.csv"
+
+    def latest_master(self, final=False, directory='.'):
+        """Newest first-pass (or FINAL) master in directory, or None"""
+        prefix = self.master_prefix + ('FINAL_' if final else '')
+        candidates = [p for p in Path(directory).glob(f"{prefix}*.csv") if p.stem[len(prefix):].isdigit()]
+        return str(max(candidates, key=lambda p: p.stem)) if candidates else None
+
+@lru_cache(maxsize=None)
+def load_profiles(profiles_file=PROFILES_FILE):
+    """{name: InstrumentProfile} from the TOML file (empty if it is missing)"""
+    try:
+        with open(profiles_file, 'rb') as f:
+            data = tomllib.load(f)
+    except FileNotFoundError:
+        return {}
+    return {name.lower(): InstrumentProfile(name, **fields) for name, fields in data.items()}
+
+def get_profile(name):
+    name = name.strip().lower()
+    return load_profiles().get(name) or InstrumentProfile(name)
+
+def current_instrument(cwd=None):
+    """Instrument for this run: $INSTRUMENT, the <instrument>-faculty folder name, or the default"""
+    if os.environ.get('INSTRUMENT'):
+        return os.environ['INSTRUMENT'].strip().lower()
+    folder = Path(cwd or os.getcwd()).name
+    if folder.endswith(FOLDER_SUFFIX) and len(folder) > len(FOLDER_SUFFIX):
+        return folder[:-len(FOLDER_SUFFIX)].lower()
+    return DEFAULT_INSTRUMENT
+
+def current_profile():
+    return get_profile(current_instrument())
+
+if __name__ == "__main__":
+    field = sys.argv[1] if len(sys.argv) > 1 else 'title'
+    if field == 'list':
+        for profile in load_profiles().values():
+            print(f"{profile.name}: {', '.join(profile.terms)}")
+    else:
+        profile = current_profile()
+        if not hasattr(profile, field):
+            print(f"Unknown field: {field}")
+            sys.exit(1)
+        print(getattr(profile, field))
@@ -4,12 +4,27 @@ Merge second pass email results with the original master file
 """
 
 import csv
+import sys
 from datetime import datetime
 from pathlib import Path
 
-def merge_results():
+from instrument_profile import current_profile
+
+def find_master_file():
+    """Newest first-pass master (<instrument>_faculty_master_YYYYMMDD.csv, not a FINAL one)"""
+    return current_profile().latest_master()
+
+def find_pass2_files(batch_dir=Path("results/batches")):
+    """Every email_pass2_NNN.csv present, in numeric order"""
+    files = [p for p in batch_dir.glob("email_pass2_*.csv") if p.stem.split('_')[-1].isdigit()]
+    return sorted(files, key=lambda p: int(p.stem.split('_')[-1]))
+
+def merge_results(master_file=None):
     # Read original master file
-    master_file = "trombone_faculty_master_20250811.csv"
+    master_file = master_file or find_master_file()
+    if not master_file:
+        print(f"No {current_profile().master_prefix}*.csv found - run merge_with_urls.py first")
+        return None
     print(f"Reading original master: {master_file}")
     
     master_data = []
@@ -30,55 +45,52 @@ def merge_results():
     updates_made = 0
     new_entries = []
     
-    for i in range(1, 32):
-        pass2_file = Path(f"results/batches/email_pass2_{i:03d}.csv")
-        if pass2_file.exists():
-            with open(pass2_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                if not content.strip():
-                    continue
-                
-                f.seek(0)
-                reader = csv.DictReader(f)
+    pass2_files = find_pass2_files()
+    print(f"Found {len(pass2_files)} pass 2 files")
+    
+    for pass2_file in pass2_files:
+        # Single streaming read - an empty file just yields no rows
+        with open(pass2_file, 'r', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            
+            for row in reader:
+                uni = row.get('University', '').strip()
+                name = row.get('Faculty Name', '').strip()
+                email = row.get('Email', '').strip()
                 
-                for row in reader:
-                    uni = row.get('University', '').strip()
-                    name = row.get('Faculty Name', '').strip()
-                    email = row.get('Email', '').strip()
+                if email and '@' in email:
+                    key = (uni, name)
                     
-                    if email and '@' in email:
-                        key = (uni, name)
+                    if key in master_lookup:
+                        # Update existing entry
+                        idx = master_lookup[key]
+                        old_email = master_data[idx].get('Email', '').strip()
                         
-                        if key in master_lookup:
-                            # Update existing entry
-                            idx = master_lookup[key]
-                            old_email = master_data[idx].get('Email', '').strip()
-                            
-                            if not old_email or old_email in ['NO EMAIL FOUND - SKIP', 'Not found', '']:
-                                master_data[idx]['Email'] = email
-                                master_data[idx]['Notes'] = master_data[idx].get('Notes', '') + ' [Email found in pass 2]'
-                                updates_made += 1
-                                print(f"  Updated: {name} ({uni}) -> {email}")
-                        else:
-                            # This is a new entry not in original master (shouldn't happen but just in case)
-                            new_entry = {
-                                'University': uni,
-                                'Faculty Name': name,
-                                'Title': row.get('Title', ''),
-                                'Email': email,
-                                'Phone': row.get('Phone', ''),
-                                'Profile URL': row.get('Profile URL', ''),
-                                'Source URL': f"Pass 2 search",
-                                'Notes': row.get('Notes', '') + ' [Added in pass 2]'
-                            }
-                            new_entries.append(new_entry)
-                            print(f"  New entry: {name} ({uni}) -> {email}")
-    
+                        if not old_email or old_email in ['NO EMAIL FOUND - SKIP', 'Not found', '']:
+                            master_data[idx]['Email'] = email
+                            master_data[idx]['Notes'] = master_data[idx].get('Notes', '') + ' [Email found in pass 2]'
+                            updates_made += 1
+                            print(f"  Updated: {name} ({uni}) -> {email}")
+                    else:
+                        # This is a new entry not in original master (shouldn't happen but just in case)
+                        new_entry = {
+                            'University': uni,
+                            'Faculty Name': name,
+                            'Title': row.get('Title', ''),
+                            'Email': email,
+                            'Phone': row.get('Phone', ''),
+                            'Profile URL': row.get('Profile URL', ''),
+                            'Source URL': f"Pass 2 search",
+                            'Notes': row.get('Notes', '') + ' [Added in pass 2]'
+                        }
+                        new_entries.append(new_entry)
+                        print(f"  New entry: {name} ({uni}) -> {email}")
+
     # Add any new entries to master data
     master_data.extend(new_entries)
     
     # Write updated master file
-    output_file = f"trombone_faculty_master_FINAL_{datetime.now().strftime('%Y%m%d')}.csv"
+    output_file = current_profile().master_file(datetime.now().strftime('%Y%m%d'), final=True)
     
     fieldnames = ['University', 'Faculty Name', 'Title', 'Email', 'Phone', 'Profile URL', 'Source URL', 'Notes']
     
@@ -102,12 +114,14 @@ def merge_results():
     print(f"Total faculty in final master: {len(master_data)}")
     
     # Count emails
-    with_emails = [r for r in master_data if r.get('Email', '').strip() and '@' in r.get('Email', '')]
-    without_emails = [r for r in master_data if not r.get('Email', '').strip() or '@' not in r.get('Email', '')]
+    def has_email(r):
+        return r.get('Email', '').strip() and '@' in r.get('Email', '')
+    with_emails = sum(1 for r in master_data if has_email(r))
+    without_emails = len(master_data) - with_emails
     
     print(f"\nEmail Statistics:")
-    print(f"  Faculty WITH emails: {len(with_emails)} ({len(with_emails)*100/len(master_data):.1f}%)")
-    print(f"  Faculty WITHOUT emails: {len(without_emails)} ({len(without_emails)*100/len(master_data):.1f}%)")
+    print(f"  Faculty WITH emails: {with_emails} ({with_emails*100/len(master_data):.1f}%)")
+    print(f"  Faculty WITHOUT emails: {without_emails} ({without_emails*100/len(master_data):.1f}%)")
     
     print(f"\nFinal master file: {output_file}")
     
@@ -117,10 +131,10 @@ def merge_results():
         with open(no_email_file, 'w', newline='', encoding='utf-8') as f:
             writer = csv.DictWriter(f, fieldnames=fieldnames)
             writer.writeheader()
-            writer.writerows(without_emails)
+            writer.writerows(r for r in master_data if not has_email(r))
         print(f"Faculty still without emails: {no_email_file}")
     
     return output_file
 
 if __name__ == "__main__":
-    merge_results()
\ No newline at end of file
+    merge_results(sys.argv[1] if len(sys.argv) > 1 else None)
\ No newline at end of file
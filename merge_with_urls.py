@@ -1,128 +1,335 @@
 #!/usr/bin/env python3
 """
 Merge all batch CSV files into a master file, including the source URL for each university
+
+Incremental mode (--incremental) keeps a manifest of every batch file's
+size, mtime and hash plus where its rows sit in the master file. Only new
+or changed batches are re-read: if the only changes are new batches after
+the last one merged, their rows are appended to the master; otherwise the
+master is rebuilt by copying unchanged batches' bytes straight from the
+old master and re-ingesting just the changed ones.
+
+Rows are streamed: each one is written to the master (and the no-email
+side file) as soon as it is read, and statistics are running counters, so
+memory stays flat however many rows are merged. As before, an output with
+no rows is not written.
+
+Every merge records the manifest, so the first --incremental run after a
+full merge already has something to reuse.
+
+Usage:
+  python3 merge_with_urls.py                 # full merge
+  python3 merge_with_urls.py --incremental   # only re-ingest changed batches
 """
 
 import csv
+import hashlib
+import io
+import json
 import os
+import sys
 from pathlib import Path
 from datetime import datetime
 
-def get_last_url_for_uni(uni_num):
-    """Get the last URL visited for a university from its URL log"""
-    # Check both permanent and temp locations
+from instrument_profile import current_profile
+from url_log import last_url
+
+FIELDNAMES = ['University', 'Faculty Name', 'Title', 'Email', 'Phone', 'Profile URL', 'Source URL', 'Notes']
+MANIFEST_FILE = Path("results/merge_manifest.json")
+
+def get_url_log_path(uni_num):
+    """Return the URL log for a university, checking permanent then temp locations"""
     url_log_paths = [
         f"results/url_logs/uni_{uni_num:03d}_urls.txt",
         f"tmp/uni_{uni_num:03d}_urls.txt"
     ]
-    
+
     for path in url_log_paths:
         if os.path.exists(path):
-            try:
-                with open(path, 'r') as f:
-                    lines = f.readlines()
-                    if lines:
-                        # Return the last non-empty line
-                        for line in reversed(lines):
-                            url = line.strip()
-                            if url and not url.startswith("No URL tracking"):
-                                return url
-            except Exception as e:
-                print(f"Error reading URL log {path}: {e}")
-    
+            return path
+    return None
+
+def get_last_url_for_uni(uni_num):
+    """Get the last URL visited for a university from its URL log"""
+    path = get_url_log_path(uni_num)
+
+    if path:
+        try:
+            # Seeks back from the end, so cost doesn't grow with the trail length
+            url = last_url(path)
+            if url:
+                return url
+        except Exception as e:
+            print(f"Error reading URL log {path}: {e}")
+
     return "URL not logged"
 
-def merge_batches():
+def file_stamp(path):
+    """(size, mtime_ns) of a file, or None if it doesn't exist"""
+    if not path or not os.path.exists(path):
+        return None
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+def file_hash(path):
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(65536), b''):
+            sha.update(block)
+    return sha.hexdigest()
+
+def standardize_row(row, source_url):
+    """Map the different batch column names onto the master columns"""
+    # Clean up row - remove None keys
+    cleaned_row = {k: v for k, v in row.items() if k is not None}
+
+    standardized = {}
+    standardized['University'] = cleaned_row.get('University', cleaned_row.get('Institution', ''))
+    standardized['Faculty Name'] = cleaned_row.get('Faculty Name', cleaned_row.get('Name', ''))
+    standardized['Title'] = cleaned_row.get('Title', '')
+    standardized['Email'] = cleaned_row.get('Email', '')
+    standardized['Phone'] = cleaned_row.get('Phone', '')
+    standardized['Profile URL'] = cleaned_row.get('Profile URL', cleaned_row.get('URL', ''))
+    standardized['Notes'] = cleaned_row.get('Notes', '')
+    standardized['Source URL'] = source_url
+    return standardized
+
+class RowWriter:
+    """Writes master rows one at a time to a binary file, encoded exactly as csv.DictWriter would
+
+    Working in bytes keeps f.tell() usable for the manifest's byte ranges.
+    """
+
+    def __init__(self, f):
+        self.f = f
+        self.buffer = io.StringIO()
+        self.writer = csv.DictWriter(self.buffer, fieldnames=FIELDNAMES, restval='')
+
+    def _flush(self):
+        self.f.write(self.buffer.getvalue().encode('utf-8'))
+        self.buffer.seek(0)
+        self.buffer.truncate()
+
+    def writeheader(self):
+        self.writer.writeheader()
+        self._flush()
+
+    def writerow(self, row):
+        self.writer.writerow(row)
+        self._flush()
+
+def load_manifest():
+    try:
+        with open(MANIFEST_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_manifest(manifest):
+    MANIFEST_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = MANIFEST_FILE.with_suffix('.tmp')
+    with open(tmp_file, 'w') as f:
+        json.dump(manifest, f, indent=1)
+    tmp_file.replace(MANIFEST_FILE)
+
+def ingest_batch(batch_file, uni_num, master, no_email):
+    """Stream one batch file's rows into the master and no-email writers
+
+    Returns the manifest entry with row counts; nothing is held in memory
+    beyond the current row.
+    """
+    url_log = get_url_log_path(uni_num)
+    source_url = get_last_url_for_uni(uni_num)
+    entry = {
+        'stamp': file_stamp(batch_file),
+        'sha256': file_hash(batch_file),
+        'url_log_stamp': file_stamp(url_log),
+        'rows': 0,
+        'with_emails': 0,
+    }
+
+    with open(batch_file, 'r', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            standardized = standardize_row(row, source_url)
+            master.writerow(standardized)
+            entry['rows'] += 1
+            if standardized.get('Email', '').strip():
+                entry['with_emails'] += 1
+            else:
+                no_email.writerow(standardized)
+
+    if entry['rows'] > 0:
+        print(f"  {batch_file.name}: {entry['rows']} faculty members - URL: {source_url[:50]}...")
+    return entry
+
+def batch_unchanged(batch_file, uni_num, entry):
+    """True if a batch (and its URL log) still match their manifest entry"""
+    if not entry or entry.get('url_log_stamp') != file_stamp(get_url_log_path(uni_num)):
+        return False
+    if entry.get('stamp') == file_stamp(batch_file):
+        return True
+    # Touched but identical content - just refresh the stamp
+    if entry.get('sha256') == file_hash(batch_file):
+        entry['stamp'] = file_stamp(batch_file)
+        return True
+    return False
+
+def merge_batches(incremental=False):
     batch_dir = Path("results/batches")
-    output_file = f"trombone_faculty_master_{datetime.now().strftime('%Y%m%d')}.csv"
-    
-    # Collect all data
-    all_faculty = []
-    universities_processed = 0
-    total_faculty = 0
-    
+    today = datetime.now().strftime('%Y%m%d')
+    output_file = current_profile().master_file(today)
+    no_email_file = f"faculty_without_emails_{today}.csv"
+
     print("Merging batch files with source URLs...")
     print("=" * 60)
-    
-    # Process each batch file
-    for batch_file in sorted(batch_dir.glob("uni_*.csv")):
+
+    old_manifest = load_manifest() if incremental else {}
+    old_batches = old_manifest.get('batches', {})
+    if incremental and (old_manifest.get('master') != output_file or not os.path.exists(output_file)
+                        or file_stamp(output_file) != old_manifest.get('master_stamp')
+                        or file_stamp(no_email_file) != old_manifest.get('no_email_stamp')):
+        # Different day or master edited by hand - nothing to reuse
+        print("No usable manifest for today's master - doing a full merge")
+        old_batches = {}
+
+    batch_files = sorted(batch_dir.glob("uni_*.csv"))
+    changed = []
+    batches = {}
+    for batch_file in batch_files:
         # Extract university number from filename
         uni_num = int(batch_file.stem.split('_')[1])
-        
-        # Get the last URL for this university
-        source_url = get_last_url_for_uni(uni_num)
-        
-        try:
-            with open(batch_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                faculty_count = 0
-                
-                for row in reader:
-                    # Clean up row - remove None keys
-                    cleaned_row = {k: v for k, v in row.items() if k is not None}
-                    
-                    # Standardize field names
-                    standardized = {}
-                    standardized['University'] = cleaned_row.get('University', cleaned_row.get('Institution', ''))
-                    standardized['Faculty Name'] = cleaned_row.get('Faculty Name', cleaned_row.get('Name', ''))
-                    standardized['Title'] = cleaned_row.get('Title', '')
-                    standardized['Email'] = cleaned_row.get('Email', '')
-                    standardized['Phone'] = cleaned_row.get('Phone', '')
-                    standardized['Profile URL'] = cleaned_row.get('Profile URL', cleaned_row.get('URL', ''))
-                    standardized['Notes'] = cleaned_row.get('Notes', '')
-                    standardized['Source URL'] = source_url
-                    
-                    all_faculty.append(standardized)
-                    faculty_count += 1
-                
-                if faculty_count > 0:
-                    universities_processed += 1
-                    total_faculty += faculty_count
-                    print(f"  {batch_file.name}: {faculty_count} faculty members - URL: {source_url[:50]}...")
-                
-        except Exception as e:
-            print(f"  Error reading {batch_file.name}: {e}")
-    
-    # Write master file with new column order
-    if all_faculty:
-        fieldnames = ['University', 'Faculty Name', 'Title', 'Email', 'Phone', 'Profile URL', 'Source URL', 'Notes']
-        
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for row in all_faculty:
-                # Ensure all fields exist
-                for field in fieldnames:
-                    if field not in row:
-                        row[field] = ''
-                writer.writerow(row)
-        
-        print("=" * 60)
-        print(f"MERGE COMPLETE!")
-        print(f"Universities with faculty: {universities_processed}")
-        print(f"Total faculty found: {total_faculty}")
-        print(f"Output file: {output_file}")
-        
-        # Also create a summary of faculty with emails
-        with_emails = [f for f in all_faculty if f.get('Email', '').strip()]
-        without_emails = [f for f in all_faculty if not f.get('Email', '').strip()]
-        
-        print(f"\nEmail Statistics:")
-        print(f"  Faculty WITH emails: {len(with_emails)}")
-        print(f"  Faculty WITHOUT emails: {len(without_emails)}")
-        
-        if without_emails:
-            # Create a separate file for faculty without emails
-            no_email_file = f"faculty_without_emails_{datetime.now().strftime('%Y%m%d')}.csv"
-            with open(no_email_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(without_emails)
-            print(f"  Faculty without emails saved to: {no_email_file}")
-            
+        entry = old_batches.get(batch_file.name)
+        if batch_unchanged(batch_file, uni_num, entry):
+            batches[batch_file.name] = entry
+        else:
+            changed.append(batch_file.name)
+    removed = set(old_batches) - {b.name for b in batch_files}
+
+    if incremental and old_batches and not changed and not removed:
+        print("Master is up to date - no batch files changed")
+        save_manifest({**old_manifest, 'batches': batches})
+        print_summary(batches, output_file, no_email_file)
+        return
+
+    last_merged = max(old_batches) if old_batches else ''
+    append_only = bool(old_batches) and not removed and all(name > last_merged for name in changed)
+
+    if append_only:
+        print(f"Appending {len(changed)} new batch file(s) to {output_file}")
+        with open(output_file, 'ab') as master, open(no_email_file, 'ab') as no_email:
+            master_writer, no_email_writer = RowWriter(master), RowWriter(no_email)
+            if no_email.tell() == 0:
+                no_email_writer.writeheader()  # no earlier batch had rows without emails
+            for name in changed:
+                batches[name] = write_batch(batch_dir / name, master_writer, no_email_writer)
+    else:
+        if old_batches:
+            print(f"Re-ingesting {len(changed)} changed batch file(s), copying the rest from the old master")
+        rebuild_master(batch_files, batches, output_file, no_email_file)
+
+    if not has_no_email_rows(batches) and os.path.exists(no_email_file):
+        # Header only, or left from an earlier merge today - derived from the batches either way
+        os.remove(no_email_file)
+    if not has_rows(batches):
+        print_summary(batches, output_file, no_email_file)
+        return
+
+    manifest = {
+        'master': output_file,
+        'batches': {name: batches[name] for name in sorted(batches)},
+        'master_stamp': file_stamp(output_file),
+        'no_email_stamp': file_stamp(no_email_file),
+    }
+    save_manifest(manifest)
+    print_summary(batches, output_file, no_email_file)
+
+def has_rows(batches):
+    return any(entry['rows'] for entry in batches.values())
+
+def has_no_email_rows(batches):
+    return any(entry['rows'] > entry['with_emails'] for entry in batches.values())
+
+def write_batch(batch_file, master, no_email):
+    """Ingest a batch and write its rows; records byte ranges in the manifest entry"""
+    uni_num = int(batch_file.stem.split('_')[1])
+    master_start, no_email_start = master.f.tell(), no_email.f.tell()
+    try:
+        entry = ingest_batch(batch_file, uni_num, master, no_email)
+    except Exception as e:
+        print(f"  Error reading {batch_file.name}: {e}")
+        # Rows written before the error stay, same as before; stamp None forces a retry next run
+        entry = {'stamp': None, 'rows': 0, 'with_emails': 0}
+    entry['master_range'] = [master_start, master.f.tell() - master_start]
+    entry['no_email_range'] = [no_email_start, no_email.f.tell() - no_email_start]
+    return entry
+
+def copy_range(src, dst, byte_range):
+    """Copy an unchanged batch's bytes from the old output file; returns the new range"""
+    offset, length = byte_range
+    new_offset = dst.tell()
+    src.seek(offset)
+    remaining = length
+    while remaining > 0:
+        block = src.read(min(65536, remaining))
+        if not block:
+            break
+        dst.write(block)
+        remaining -= len(block)
+    return [new_offset, length]
+
+def rebuild_master(batch_files, batches, output_file, no_email_file):
+    """Write a fresh master, reusing bytes for batches in `batches` and ingesting the rest"""
+    old_master = open(output_file, 'rb') if batches and os.path.exists(output_file) else None
+    old_no_email = open(no_email_file, 'rb') if batches and os.path.exists(no_email_file) else None
+    try:
+        with open(output_file + '.tmp', 'wb') as master, open(no_email_file + '.tmp', 'wb') as no_email:
+            master_writer, no_email_writer = RowWriter(master), RowWriter(no_email)
+            master_writer.writeheader()
+            no_email_writer.writeheader()
+            for batch_file in batch_files:
+                entry = batches.get(batch_file.name)
+                # An old master without a no-email file is fine if this batch had nothing in it
+                if entry and old_master and (old_no_email or not entry['no_email_range'][1]):
+                    entry['master_range'] = copy_range(old_master, master, entry['master_range'])
+                    entry['no_email_range'] = (copy_range(old_no_email, no_email, entry['no_email_range'])
+                                               if old_no_email else [no_email.tell(), 0])
+                else:
+                    batches[batch_file.name] = write_batch(batch_file, master_writer, no_email_writer)
+    finally:
+        for f in (old_master, old_no_email):
+            if f:
+                f.close()
+    publish(output_file, has_rows(batches))
+    publish(no_email_file, has_no_email_rows(batches))
+
+def publish(output_file, keep):
+    """Move a rebuilt output into place, or drop it if it has no rows"""
+    if keep:
+        os.replace(output_file + '.tmp', output_file)
     else:
+        os.remove(output_file + '.tmp')
+
+def print_summary(batches, output_file, no_email_file):
+    total_faculty = sum(entry['rows'] for entry in batches.values())
+    with_emails = sum(entry['with_emails'] for entry in batches.values())
+    universities_processed = sum(1 for entry in batches.values() if entry['rows'] > 0)
+
+    if not total_faculty:
         print("No faculty data found to merge!")
+        return
+
+    print("=" * 60)
+    print(f"MERGE COMPLETE!")
+    print(f"Universities with faculty: {universities_processed}")
+    print(f"Total faculty found: {total_faculty}")
+    print(f"Output file: {output_file}")
+
+    print(f"\nEmail Statistics:")
+    print(f"  Faculty WITH emails: {with_emails}")
+    print(f"  Faculty WITHOUT emails: {total_faculty - with_emails}")
+
+    if total_faculty - with_emails:
+        print(f"  Faculty without emails saved to: {no_email_file}")
 
 if __name__ == "__main__":
-    merge_batches()
\ No newline at end of file
+    merge_batches(incremental='--incremental' in sys.argv)
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Multi-instrument single-crawl mode - one visit per university for several instruments
+
+Instead of each instrument folder (piano-faculty/, violin-faculty/, ...)
+crawling all 202 universities on its own, the agent finds the music
+faculty directory once and records faculty for every requested instrument
+in a single combined batch (results/multi/batches/uni_XXX.csv, with an
+Instrument column). When a university finishes, the combined batch is
+split into each instrument folder's results/batches/uni_XXX.csv and the
+URL log is copied alongside, so the usual merge_with_urls.py in each
+folder produces its master unchanged. The university is also marked done
+in each folder's progress.db so a later single-instrument run skips it.
+
+Usage:
+  python3 parallel_scraper.py --instruments trombone,piano,violin [--workers N]
+  python3 multi_instrument.py split <idx> trombone,piano,violin   # re-split one batch
+"""
+
+import csv
+import shutil
+import sys
+from pathlib import Path
+
+import parallel_scraper
+from instrument_profile import get_profile
+from parallel_scraper import ScrapeJob, log_message, run_parallel
+from progress_store import ProgressStore, MULTI_PASS, SCRAPE_PASS
+from url_log import last_url
+
+MULTI_DIR = Path("results/multi")
+BATCH_HEADERS = ['University', 'Faculty Name', 'Title', 'Email', 'Phone', 'Profile URL', 'Notes']
+MULTI_HEADERS = ['University', 'Instrument'] + BATCH_HEADERS[1:]
+
+def instrument_folder(instrument):
+    """Folder created by setup_instrument_search.sh for an instrument"""
+    return get_profile(instrument).folder
+
+def build_multi_prompt(idx, uni, instruments, batch_file, url_log_file, progress_file):
+    """Prompt asking for every instrument's faculty in one crawl of university #idx"""
+    profiles = [get_profile(instrument) for instrument in instruments]
+    names = ", ".join(profile.title for profile in profiles)
+    allowed = ", ".join(profile.name for profile in profiles)
+    aliases = "".join(f"\n   - {profile.title} also covers: {', '.join(profile.aliases)}"
+                      for profile in profiles if profile.aliases)
+
+    resume_url = None
+    if url_log_file.exists() and url_log_file.stat().st_size > 0:
+        resume_url = last_url(url_log_file)
+
+    if resume_url:
+        return f"""RESUMING university #{idx}: {uni['University Name']}
+
+Last URL visited: {resume_url}
+Continue from there and find remaining faculty for: {names}
+
+CRITICAL: EMAIL ADDRESSES ARE REQUIRED!
+- Only save faculty WITH email addresses
+- Click into profile pages to find emails
+- If no email after thorough search, skip that person
+
+RESUME STEPS:
+1. APPEND to existing: {batch_file}
+   One row per instrument a person teaches; Instrument must be one of: {allowed}
+2. Track new URLs in: {url_log_file}
+3. Update {progress_file} - REPLACE the entire file with exactly these 2 lines:
+   LAST_PROCESSED={idx}
+   TOTAL_UNIVERSITIES=202
+4. Say only: "Done #{idx}"
+"""
+
+    return f"""Process university #{idx}: {uni['University Name']}
+URL: {uni['URL']}
+
+Find faculty for ALL of these instruments in ONE pass: {names}
+
+CRITICAL: EMAIL ADDRESSES ARE REQUIRED - Without emails, the data is useless!
+
+STEPS:
+1. Navigate to URL
+2. IMMEDIATELY write this URL to: {url_log_file}
+3. FIND THE MUSIC FACULTY DIRECTORY ONCE:
+   - First: Look for search bar (usually upper right of page) - type "music faculty"
+   - If no search bar: Navigate to School of Music or Faculty pages
+   - Use the applied/studio faculty listing if there is one
+4. Go through that directory once and pick out everyone who teaches
+   any of: {names}{aliases}
+5. For EACH faculty member found:
+   - Click on their profile/bio page
+   - Look for email on their individual page
+   - Check faculty directory and department contact pages
+6. For EVERY new page/URL you visit, append it to: {url_log_file}
+7. Write results to: {batch_file}
+   Headers: {','.join(MULTI_HEADERS)}
+   One row per instrument a person teaches; Instrument must be one of: {allowed}
+
+ESSENTIAL:
+- DO NOT save faculty without email addresses
+- Do not visit the same page twice for different instruments
+
+8. Update {progress_file} - REPLACE the entire file with exactly these 2 lines:
+   LAST_PROCESSED={idx}
+   TOTAL_UNIVERSITIES=202
+9. Say only: "Done #{idx}"
+"""
+
+def split_batch(idx, instruments, batch_file=None, url_log=None):
+    """Split a combined batch into each instrument folder's batch file
+
+    A row goes to the instrument its Instrument column names (case-insensitive).
+    Rows naming none of the requested instruments are logged and skipped.
+    Returns {instrument: rows written}.
+    """
+    batch_file = batch_file or MULTI_DIR / "batches" / f"uni_{idx:03d}.csv"
+    url_log = url_log or MULTI_DIR / "url_logs" / f"uni_{idx:03d}_urls.txt"
+    by_name = {get_profile(instrument).name: instrument for instrument in instruments}
+    counts = {instrument: 0 for instrument in instruments}
+    files, writers = {}, {}
+
+    try:
+        if batch_file.exists():
+            with open(batch_file, 'r', encoding='utf-8') as f:
+                for row in csv.DictReader(f):
+                    taught = row.get('Instrument') or ''
+                    instrument = by_name.get(taught.strip().lower())
+                    if instrument is None:
+                        log_message(f"  #{idx}: skipping {row.get('Faculty Name') or 'unnamed row'} - "
+                                    f"Instrument {taught!r} is not one of {', '.join(by_name)}")
+                        continue
+                    if instrument not in writers:
+                        out_dir = instrument_folder(instrument) / "results" / "batches"
+                        out_dir.mkdir(parents=True, exist_ok=True)
+                        files[instrument] = open(out_dir / f"uni_{idx:03d}.csv", 'w', newline='',
+                                                 encoding='utf-8')
+                        writers[instrument] = csv.DictWriter(files[instrument], fieldnames=BATCH_HEADERS,
+                                                             extrasaction='ignore')
+                        writers[instrument].writeheader()
+                    writers[instrument].writerow(row)
+                    counts[instrument] += 1
+    finally:
+        for f in files.values():
+            f.close()
+
+    for instrument in instruments:
+        folder = instrument_folder(instrument)
+        if not counts[instrument]:
+            # Drop output from an earlier split that no longer has rows
+            stale = folder / "results" / "batches" / f"uni_{idx:03d}.csv"
+            if stale.exists():
+                stale.unlink()
+        if url_log.exists():
+            log_dir = folder / "results" / "url_logs"
+            log_dir.mkdir(parents=True, exist_ok=True)
+            shutil.copy(url_log, log_dir / f"uni_{idx:03d}_urls.txt")
+    return counts
+
+def mark_instruments_done(idx, instruments):
+    """Mark #idx done in each instrument folder's own progress.db"""
+    for instrument in instruments:
+        folder = instrument_folder(instrument)
+        source = folder / "music_schools_wikipedia.csv"
+        if not source.exists():
+            continue  # folder not set up with setup_instrument_search.sh
+        store = ProgressStore(folder / "progress.db")
+        store.seed(SCRAPE_PASS, source, folder / "progress_tracker.txt")
+        batch = folder / "results" / "batches" / f"uni_{idx:03d}.csv"
+        store.mark_done(SCRAPE_PASS, idx, str(batch) if batch.exists() else None,
+                        str(folder / "results" / "url_logs" / f"uni_{idx:03d}_urls.txt"))
+
+class MultiScrapeJob(ScrapeJob):
+    """One crawl of a university that collects faculty for several instruments"""
+
+    jobs_dir = parallel_scraper.JOBS_DIR / "multi"
+    batch_dir = MULTI_DIR / "batches"
+    tmp_dir = parallel_scraper.TMP_DIR / "multi"
+    url_log_dir = MULTI_DIR / "url_logs"
+    instruments = ()
+
+    def build_prompt(self):
+        return build_multi_prompt(self.idx, self.uni, self.instruments, self.batch_file,
+                                  self.url_log, self.progress_file)
+
+    def finish(self):
+        super().finish()
+        counts = split_batch(self.idx, self.instruments, self.batch_file, self.perm_url_log)
+        mark_instruments_done(self.idx, self.instruments)
+        log_message(f"  #{self.idx} split: " + ", ".join(f"{i} {n}" for i, n in counts.items()))
+
+def run_multi(instruments, workers=parallel_scraper.DEFAULT_WORKERS, agent_cmd=parallel_scraper.DEFAULT_AGENT_CMD,
+              max_wait_minutes=parallel_scraper.MAX_WAIT_MINUTES):
+    instruments = tuple(dict.fromkeys(i.strip().lower() for i in instruments if i.strip()))
+    for instrument in instruments:
+        if not (instrument_folder(instrument) / "music_schools_wikipedia.csv").exists():
+            print(f"Note: {instrument_folder(instrument)}/ is not set up - "
+                  f"run ./setup_instrument_search.sh {instrument} to merge its results")
+
+    MultiScrapeJob.instruments = instruments
+    run_parallel(workers, agent_cmd, max_wait_minutes, pass_name=MULTI_PASS, make_job=MultiScrapeJob)
+
+if __name__ == "__main__":
+    if len(sys.argv) != 4 or sys.argv[1] != 'split':
+        print(__doc__)
+        sys.exit(1)
+
+    idx = int(sys.argv[2])
+    instruments = [i.strip().lower() for i in sys.argv[3].split(',') if i.strip()]
+    counts = split_batch(idx, instruments)
+    mark_instruments_done(idx, instruments)
+    for instrument, n in counts.items():
+        print(f"{instrument}: {n} faculty -> {instrument_folder(instrument)}/results/batches/uni_{idx:03d}.csv")
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Persistent MX record cache shared by every instrument folder
+
+quick_email_check.py and old/validate_emails.py look domains up here before
+going to DNS. Answers are kept in a small SQLite file until their record TTL
+runs out, and negative answers (NXDOMAIN / no MX) are cached too, for the
+zone's SOA minimum when the response carries one. Timeouts and other
+transient failures are never cached.
+
+The cache lives outside the instrument folders (~/.cache/faculty-scraper/
+by default, or $MX_CACHE_DB), so validating piano, violin and trombone
+masters that share university domains only resolves each domain once.
+
+Usage:
+  python3 mx_cache.py stats    # entries, live vs expired
+  python3 mx_cache.py purge    # drop expired entries
+  python3 mx_cache.py clear    # drop everything
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import time
+from contextlib import closing
+from pathlib import Path
+
+DB_FILE = Path(os.environ.get('MX_CACHE_DB', Path.home() / ".cache" / "faculty-scraper" / "mx_cache.db"))
+
+MIN_TTL = 60                 # never trust an answer for less than a minute
+MAX_TTL = 7 * 24 * 3600      # or for more than a week
+NEGATIVE_TTL = 3600          # NXDOMAIN / no MX when the response has no SOA
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS mx (
+    domain     TEXT PRIMARY KEY,
+    has_mx     INTEGER NOT NULL,
+    hosts      TEXT    NOT NULL,
+    expires_at REAL    NOT NULL
+)
+"""
+
+def clamp_ttl(ttl):
+    return max(MIN_TTL, min(MAX_TTL, int(ttl)))
+
+def negative_ttl(exc, default=NEGATIVE_TTL):
+    """TTL for a negative answer: the SOA minimum from the response, if it has one"""
+    try:
+        responses = exc.responses().values() if hasattr(exc, 'responses') else [exc.kwargs['response']]
+        for response in responses:
+            for rrset in response.authority:
+                for rdata in rrset:
+                    if hasattr(rdata, 'minimum'):
+                        return min(rrset.ttl, rdata.minimum)
+    except (AttributeError, KeyError, TypeError):
+        pass
+    return default
+
+class MXCache:
+    def __init__(self, db_file=DB_FILE):
+        self.db_file = Path(db_file)
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute(SCHEMA)
+
+    def _connect(self):
+        # Short-lived connections, same as progress_store.py - several folders may validate at once
+        conn = sqlite3.connect(self.db_file, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def get_many(self, domains):
+        """{domain: (has_mx, hosts)} for the domains with a live entry"""
+        domains = [d.lower() for d in domains]
+        found = {}
+        now = time.time()
+        with closing(self._connect()) as conn:
+            # Stay well under SQLite's bound-parameter limit
+            for start in range(0, len(domains), 500):
+                chunk = domains[start:start + 500]
+                rows = conn.execute(
+                    f"SELECT domain, has_mx, hosts FROM mx WHERE expires_at > ? "
+                    f"AND domain IN ({','.join('?' * len(chunk))})", [now, *chunk]).fetchall()
+                for domain, has_mx, hosts in rows:
+                    found[domain] = (bool(has_mx), json.loads(hosts))
+        return found
+
+    def get(self, domain):
+        """(has_mx, hosts) if cached and not expired, else None"""
+        return self.get_many([domain]).get(domain.lower())
+
+    def put_many(self, entries):
+        """Store [(domain, has_mx, hosts, ttl), ...] in one transaction"""
+        now = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                "INSERT OR REPLACE INTO mx (domain, has_mx, hosts, expires_at) VALUES (?, ?, ?, ?)",
+                [(domain.lower(), int(has_mx), json.dumps(list(hosts)), now + clamp_ttl(ttl))
+                 for domain, has_mx, hosts, ttl in entries])
+            conn.execute("COMMIT")
+
+    def put(self, domain, has_mx, hosts, ttl):
+        self.put_many([(domain, has_mx, hosts, ttl)])
+
+    def purge(self):
+        """Delete expired entries; returns how many were removed"""
+        with closing(self._connect()) as conn:
+            return conn.execute("DELETE FROM mx WHERE expires_at <= ?", (time.time(),)).rowcount
+
+    def clear(self):
+        with closing(self._connect()) as conn:
+            conn.execute("DELETE FROM mx")
+
+    def stats(self):
+        now = time.time()
+        with closing(self._connect()) as conn:
+            total, live, negative = conn.execute(
+                "SELECT COUNT(*), SUM(expires_at > ?), SUM(expires_at > ? AND has_mx = 0) FROM mx",
+                (now, now)).fetchone()
+        return {'total': total, 'live': live or 0, 'negative': negative or 0}
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else 'stats'
+    cache = MXCache()
+
+    if command == 'stats':
+        stats = cache.stats()
+        print(f"{cache.db_file}: {stats['total']} domains, {stats['live']} live "
+              f"({stats['negative']} negative), {stats['total'] - stats['live']} expired")
+    elif command == 'purge':
+        print(f"Removed {cache.purge()} expired entries")
+    elif command == 'clear':
+        cache.clear()
+        print("Cache cleared")
+    else:
+        print(f"Unknown command: {command}")
+        print(__doc__)
+        sys.exit(1)
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Pool of headless Chrome browsers for JavaScript search
+
+The robust scraper used to drive one Chrome instance, so a run with
+--selenium had to crawl one university at a time, and every step of a
+search waited a fixed time.sleep() whether the page needed it or not.
+
+BrowserPool starts up to `size` browsers on demand and lends them out with
+`with pool.browser() as driver:` - a worker that finds every browser busy
+waits in the queue for the next one returned. A returned browser is reset
+(cookies cleared, about:blank) so the next site starts clean; one that has
+crashed is quit and replaced by a fresh one on a later borrow.
+
+The wait_* helpers poll for the event a step is actually waiting for -
+document ready, a search box becoming visible, a clicked popup going away,
+the results page arriving - and return as soon as it happens. Search
+results count as arrived when the page navigates away or the text of a
+results container changes; the term showing up in the search box, an
+autocomplete list or an echoed "results for ..." line is not enough.
+"""
+
+import os
+import queue
+import threading
+from contextlib import contextmanager
+
+try:
+    from selenium import webdriver
+    from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, WebDriverException
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    SELENIUM_AVAILABLE = True
+except ImportError:
+    SELENIUM_AVAILABLE = False
+
+READY_TIMEOUT = 15     # seconds for document.readyState to reach 'complete'
+ELEMENT_TIMEOUT = 3    # seconds for a revealed element to show up / a popup to close
+RESULTS_TIMEOUT = 10   # seconds for search results after submitting
+POLL_INTERVAL = 0.1
+
+# Containers that hold the results of an in-place (JavaScript) search
+RESULTS_SELECTORS = [
+    "[class*='search-result' i]",
+    "[id*='search-result' i]",
+    "[class*='results' i]",
+    "[id*='results' i]",
+    "[role='main'] [class*='result' i]",
+]
+
+# Text of the results containers, leaving out ones inside the search form or an autocomplete list
+RESULTS_TEXT_SCRIPT = """
+return Array.from(document.querySelectorAll(arguments[0]))
+    .filter(e => !e.closest('form, [role=listbox], [class*=autocomplete], [class*=suggest]'))
+    .map(e => e.innerText).join('\\n');
+"""
+
+def default_size(workers):
+    """Browsers for a run with this many workers - one per CPU at most"""
+    return max(1, min(workers, os.cpu_count() or 1))
+
+def headless_chrome():
+    options = Options()
+    options.add_argument('--headless')  # Run in background
+    options.add_argument('--disable-gpu')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--window-size=1920,1080')  # Set window size
+    return webdriver.Chrome(options=options)
+
+class BrowserPool:
+    """Up to `size` reusable browsers shared by the worker threads"""
+
+    def __init__(self, size=1, make_driver=None):
+        self.size = max(1, size)
+        self.make_driver = make_driver or headless_chrome
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+        self._drivers = []
+        self._started = 0
+        self._closed = False
+
+    def start(self):
+        """Start one browser now, so a missing Chrome/driver shows up before the crawl"""
+        with self.browser():
+            pass
+
+    @contextmanager
+    def browser(self):
+        driver = self._checkout()
+        try:
+            yield driver
+        finally:
+            self._checkin(driver)
+
+    def _checkout(self):
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+            with self._lock:
+                start_new = self._started < self.size
+                if start_new:
+                    self._started += 1
+            if start_new:
+                break
+            try:
+                return self._idle.get(timeout=1)
+            except queue.Empty:
+                continue  # a browser may have crashed or failed to start - look again
+        try:
+            driver = self.make_driver()
+        except Exception:
+            with self._lock:
+                self._started -= 1
+            raise
+        with self._lock:
+            self._drivers.append(driver)
+        return driver
+
+    def _checkin(self, driver):
+        try:
+            driver.delete_all_cookies()
+            driver.get('about:blank')
+        except Exception:  # crashed or hung up - don't lend it out again
+            self._discard(driver)
+            return
+        if self._closed:
+            self._discard(driver)
+        else:
+            self._idle.put(driver)
+
+    def _discard(self, driver):
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+                self._started -= 1
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close(self):
+        """Quit every idle browser; ones still lent out are quit when returned"""
+        self._closed = True
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver)
+
+def _wait(driver, timeout, condition):
+    """condition's first truthy value, or None on timeout"""
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(condition)
+    except TimeoutException:
+        return None
+
+def is_gone(element):
+    """True once element is hidden or no longer in the document"""
+    try:
+        return not element.is_displayed()
+    except StaleElementReferenceException:
+        return True
+
+def is_stale(element):
+    """True once element has been removed from the document (e.g. the page navigated)"""
+    try:
+        element.is_enabled()
+        return False
+    except StaleElementReferenceException:
+        return True
+
+def wait_ready(driver, timeout=READY_TIMEOUT):
+    """Wait until the document has finished loading"""
+    return bool(_wait(driver, timeout,
+                      lambda d: d.execute_script('return document.readyState') == 'complete'))
+
+def wait_for_visible(driver, selectors, timeout=ELEMENT_TIMEOUT):
+    """First displayed, enabled element matching any of the CSS selectors (None on timeout)"""
+    def find(d):
+        for selector in selectors:
+            try:
+                elements = d.find_elements(By.CSS_SELECTOR, selector)
+            except WebDriverException:
+                continue  # selector the browser doesn't support
+            for element in elements:
+                try:
+                    if element.is_displayed() and element.is_enabled():
+                        return element
+                except StaleElementReferenceException:
+                    continue
+        return False
+    return _wait(driver, timeout, find)
+
+def wait_until_gone(driver, element, timeout=ELEMENT_TIMEOUT):
+    """Wait for a clicked popup or overlay to close"""
+    return bool(_wait(driver, timeout, lambda d: is_gone(element)))
+
+def results_text(driver):
+    """Text of the page's results containers ('' while the page is changing)"""
+    try:
+        return driver.execute_script(RESULTS_TEXT_SCRIPT, ', '.join(RESULTS_SELECTORS)) or ''
+    except WebDriverException:
+        return ''
+
+def wait_for_results(driver, before_url, search_box, results_before, timeout=RESULTS_TIMEOUT):
+    """Wait for a submitted search to produce results; results_before is
+    results_text() from just before submitting
+
+    Navigation (the search box left the document) waits for the new
+    document to load. A URL change alone may be history.pushState ahead of
+    an in-place load, so it waits up to ELEMENT_TIMEOUT more for the page
+    to navigate or the results to change.
+    """
+    def results_changed(d):
+        text = results_text(d)
+        return bool(text.strip()) and text != results_before
+
+    def arrived(d):
+        if is_stale(search_box):
+            return 'navigated'
+        if results_changed(d):
+            return 'in place'
+        return 'url' if d.current_url != before_url else False
+
+    how = _wait(driver, timeout, arrived)
+    if how == 'url':
+        _wait(driver, ELEMENT_TIMEOUT, lambda d: is_stale(search_box) or results_changed(d))
+    return bool(how) and wait_ready(driver)
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Shared crawl engine for the requests-based scrapers
+
+The scrapers used to fetch one URL at a time with time.sleep(1)/(2)
+between pages and universities. Instead:
+
+- make_session() gives every scraper a requests.Session mounted on one
+  shared transport adapter, so all of them draw on one connection pool
+  (kept per host, POOL_HOSTS hosts at a time).
+- That adapter spends a per-host politeness budget before each request
+  goes to the network: at most MAX_PER_HOST requests in flight to a host,
+  starting at least HOST_INTERVAL seconds apart. Answers from the HTTP
+  cache never touch the network, so they cost nothing.
+- Crawler works a frontier queue of jobs (universities) with a pool of
+  worker threads. A handler may return follow-up jobs, which go to the
+  back of the queue.
+- canonical_url() is the key for "have we fetched this page": tracking
+  parameters, fragments, default ports and trailing slashes don't make a
+  page new.
+- googlesearch lookups (find_university_url) send their own requests, so
+  they don't go through that adapter: they take a google_slot() instead -
+  one lookup at a time across all workers, GOOGLE_INTERVAL apart.
+- Inside cancel_when(event), a request still waiting for its host's turn
+  is abandoned (Cancelled) once the event is set - e.g. the other search
+  probes once one of them found results.
+
+Different universities are different hosts, so many are crawled at once
+while each site still sees the same gentle traffic as before.
+"""
+
+import queue
+import re
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import parse_qsl, urlencode, urlparse, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from http_cache import CachingAdapter
+
+try:
+    import tldextract
+    # Bundled public suffix list snapshot - never fetch it at run time
+    _extract_domain = tldextract.TLDExtract(suffix_list_urls=())
+except ImportError:
+    _extract_domain = None
+
+DEFAULT_WORKERS = 16
+HOST_INTERVAL = 0.5    # seconds between request starts to one host
+MAX_PER_HOST = 4       # requests in flight to one host
+POOL_HOSTS = 256       # per-host connection pools kept open
+POOL_SIZE = 8          # connections kept per host
+CANCEL_POLL = 0.1      # seconds between cancellation checks while waiting for a host
+GOOGLE_INTERVAL = 2.0  # seconds between googlesearch lookups, the old per-university pause
+GOOGLE_URL = 'https://www.google.com/'
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+TRACKING_PARAMS = {'gclid', 'fbclid', 'msclkid', 'mc_cid', 'mc_eid', '_ga', '_gl'}
+
+# Second-level labels under country codes that are public suffixes themselves
+# (ox.ac.uk, sydney.edu.au, kyoto-u.ac.jp) - used when tldextract isn't installed
+COUNTRY_SECOND_LEVELS = {'ac', 'co', 'com', 'edu', 'gov', 'net', 'org', 'sch', 'ne', 'or', 'go', 'mil'}
+
+def canonical_url(url):
+    """Key a URL by the page it names: lowercase host, no fragment, default port,
+    tracking parameters or trailing slash, and sorted query parameters"""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    netloc = host if port in (None, DEFAULT_PORTS.get(scheme)) else f"{host}:{port}"
+    path = re.sub(r'/{2,}', '/', parts.path)
+    if path.endswith('/'):
+        path = path.rstrip('/')
+    query = urlencode(sorted((name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+                             if not name.lower().startswith('utm_') and name.lower() not in TRACKING_PARAMS))
+    return urlunsplit((scheme, netloc, path or '/', query, ''))
+
+def site_of(url):
+    """Registrable domain of the host - music.example.edu and www.example.edu are one
+    site, but music.ox.ac.uk and www.cam.ac.uk are not"""
+    host = (urlparse(url).hostname or '').lower()
+    if not host or host.replace('.', '').isdigit() or ':' in host:
+        return host  # IP address
+    if _extract_domain:
+        parts = _extract_domain(host)
+        return '.'.join(part for part in (parts.domain, parts.suffix) if part)
+    labels = host.split('.')
+    if len(labels) >= 3 and len(labels[-1]) == 2 and labels[-2] in COUNTRY_SECOND_LEVELS:
+        return '.'.join(labels[-3:])
+    return '.'.join(labels[-2:])
+
+class Cancelled(requests.RequestException):
+    """The caller gave up on a request before it reached the network"""
+
+_cancel = threading.local()
+
+@contextmanager
+def cancel_when(event):
+    """Abandon this thread's requests that are still waiting for their host once event is set"""
+    previous = getattr(_cancel, 'event', None)
+    _cancel.event = event
+    try:
+        yield
+    finally:
+        _cancel.event = previous
+
+class HostBudget:
+    """Per-host concurrency and request spacing, shared by every thread"""
+
+    def __init__(self, interval=HOST_INTERVAL, max_in_flight=MAX_PER_HOST):
+        self.interval = interval
+        self.max_in_flight = max_in_flight
+        self._cond = threading.Condition()
+        self._next_start = {}
+        self._in_flight = {}
+
+    @contextmanager
+    def slot(self, url):
+        """Wait for the host's turn, then hold one of its in-flight slots"""
+        host = urlparse(url).netloc.lower()
+        stop = getattr(_cancel, 'event', None)
+        with self._cond:
+            while True:
+                if stop is not None and stop.is_set():
+                    raise Cancelled(f"Cancelled before sending: {url}")
+                wait = self._next_start.get(host, 0) - time.monotonic()
+                if self._in_flight.get(host, 0) < self.max_in_flight and wait <= 0:
+                    break
+                timeout = wait if wait > 0 else None
+                if stop is not None:
+                    timeout = min(timeout or CANCEL_POLL, CANCEL_POLL)
+                self._cond.wait(timeout=timeout)
+            self._in_flight[host] = self._in_flight.get(host, 0) + 1
+            self._next_start[host] = time.monotonic() + self.interval
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._in_flight[host] -= 1
+                self._cond.notify_all()
+
+BUDGET = HostBudget()
+GOOGLE_BUDGET = HostBudget(interval=GOOGLE_INTERVAL, max_in_flight=1)
+
+def google_slot():
+    """Hold Google's turn for one googlesearch lookup (it bypasses make_session)"""
+    return GOOGLE_BUDGET.slot(GOOGLE_URL)
+
+class PoliteAdapter(HTTPAdapter):
+    """HTTPAdapter that takes a HostBudget slot for every request it sends"""
+
+    def __init__(self, budget=None, **kwargs):
+        kwargs.setdefault('pool_connections', POOL_HOSTS)
+        kwargs.setdefault('pool_maxsize', POOL_SIZE)
+        super().__init__(**kwargs)
+        self.budget = budget or BUDGET
+
+    def send(self, request, **kwargs):
+        with self.budget.slot(request.url):
+            return super().send(request, **kwargs)
+
+class PoliteCachingAdapter(CachingAdapter, PoliteAdapter):
+    """Cache first; only requests that reach the network spend the budget"""
+
+_adapters = {}
+_adapters_lock = threading.Lock()
+
+def shared_adapter(use_http_cache=True):
+    with _adapters_lock:
+        if use_http_cache not in _adapters:
+            _adapters[use_http_cache] = PoliteCachingAdapter() if use_http_cache else PoliteAdapter()
+        return _adapters[use_http_cache]
+
+def make_session(use_http_cache=True):
+    """requests.Session on the shared pool and politeness budget (and HTTP cache)"""
+    session = requests.Session()
+    adapter = shared_adapter(use_http_cache)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+def workers_from_argv(argv, default=DEFAULT_WORKERS):
+    """Remove "--workers N" from argv and return N"""
+    if '--workers' not in argv:
+        return default
+    i = argv.index('--workers')
+    try:
+        workers = int(argv[i + 1])
+    except (IndexError, ValueError):
+        print("Usage: --workers N")
+        raise SystemExit(1)
+    del argv[i:i + 2]
+    return max(1, workers)
+
+class Crawler:
+    """Frontier queue of jobs worked by a pool of threads"""
+
+    def __init__(self, workers=DEFAULT_WORKERS):
+        self.workers = workers
+        self._frontier = queue.Queue()
+        self._stopping = threading.Event()
+
+    def _work(self, handler):
+        while True:
+            job = self._frontier.get()
+            try:
+                if job is None:
+                    return
+                if self._stopping.is_set():
+                    continue
+                follow_ups = handler(job)
+                for follow_up in follow_ups or ():
+                    self._frontier.put(follow_up)
+            except Exception as e:
+                print(f"  Error processing {job!r}: {e}")
+            finally:
+                self._frontier.task_done()
+
+    def run(self, jobs, handler):
+        """Call handler(job) for every job (and every job it returns) until the frontier is empty
+
+        Ctrl+C stops handing out new jobs and re-raises KeyboardInterrupt once
+        the jobs in progress finish.
+        """
+        for job in jobs:
+            self._frontier.put(job)
+
+        threads = [threading.Thread(target=self._work, args=(handler,), daemon=True)
+                   for _ in range(self.workers)]
+        for thread in threads:
+            thread.start()
+
+        try:
+            while self._frontier.unfinished_tasks:
+                time.sleep(0.2)  # join() can't be interrupted by Ctrl+C
+        except KeyboardInterrupt:
+            self._stopping.set()
+            self._frontier.join()
+            raise
+        finally:
+            for _ in threads:
+                self._frontier.put(None)
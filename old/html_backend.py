@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+HTML parsing backend for the scrapers
+
+make_soup() builds the BeautifulSoup tree with lxml when it is installed and
+falls back to the pure-Python html.parser otherwise ($HTML_PARSER forces
+one). Page wraps a downloaded body for code that often only needs the
+page text - the probe loops in search_website and find_faculty_pages throw
+most pages away after a keyword check. With selectolax installed that text
+comes from its C parser and a soup is only built for pages that pass. It
+has the same words as get_text(); only the whitespace between tags can
+differ, which the single-word keyword checks don't see.
+
+Usage:
+  python3 html_backend.py [page.html|dir ...]   # benchmark the backends on saved pages
+                                                # (default: tests/fixtures/pages)
+  python3 html_backend.py --cache               # ... on the bodies in the HTTP cache
+"""
+
+import os
+import sys
+import time
+from functools import cached_property
+from pathlib import Path
+
+from bs4 import BeautifulSoup, FeatureNotFound
+
+from page_model import PageModel
+
+try:
+    import lxml  # noqa: F401 - only needed as a BeautifulSoup tree builder
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+    print("Note: lxml not installed. Using the slower html.parser.")
+    print("      Install with: pip install lxml")
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser  # selectolax < 1.0
+        SELECTOLAX_AVAILABLE = True
+    except ImportError:
+        SELECTOLAX_AVAILABLE = False
+
+# Saved faculty-directory pages the benchmark runs on by default
+FIXTURE_PAGES = Path(__file__).resolve().parent.parent / 'tests' / 'fixtures' / 'pages'
+
+FALLBACK_PARSER = 'html.parser'
+DEFAULT_PARSER = os.environ.get('HTML_PARSER') or ('lxml' if LXML_AVAILABLE else FALLBACK_PARSER)
+
+def make_soup(content, parser=None):
+    """BeautifulSoup tree for an HTML body using the fastest available parser"""
+    try:
+        return BeautifulSoup(content, parser or DEFAULT_PARSER)
+    except FeatureNotFound:
+        return BeautifulSoup(content, FALLBACK_PARSER)
+
+def fast_text(content):
+    """Page text via selectolax, without <script>/<style> like get_text(); None if unavailable
+
+    Same words in the same order as get_text(); whitespace between tags may differ.
+    """
+    if not SELECTOLAX_AVAILABLE:
+        return None
+    tree = HTMLParser(content)
+    tree.strip_tags(['script', 'style'])
+    return tree.root.text(separator='') if tree.root else ''
+
+class Page:
+    """A downloaded page whose text, soup, PageModel and keyword hits are built on first use"""
+
+    def __init__(self, content, parser=None, matcher=None):
+        self.content = content
+        self.parser = parser
+        self.matcher = matcher
+
+    @cached_property
+    def soup(self):
+        return make_soup(self.content, self.parser)
+
+    @cached_property
+    def model(self):
+        return PageModel(self.soup, self.matcher)
+
+    @cached_property
+    def text(self):
+        if 'soup' not in self.__dict__ and self.parser is None:
+            text = fast_text(self.content)
+            if text is not None:
+                return text
+        return self.model.text
+
+    @cached_property
+    def lower(self):
+        return self.text.lower()
+
+    @cached_property
+    def hits(self):
+        """KeywordHits for the page text (needs a matcher)"""
+        if 'model' in self.__dict__:
+            return self.model.hits
+        return self.matcher.scan(self.lower)
+
+def benchmark(bodies, repeat=3):
+    """Seconds per pass over bodies for each available backend"""
+    backends = {'html.parser': lambda body: make_soup(body, FALLBACK_PARSER).get_text()}
+    if LXML_AVAILABLE:
+        backends['lxml'] = lambda body: make_soup(body, 'lxml').get_text()
+    if SELECTOLAX_AVAILABLE:
+        backends['selectolax (text only)'] = fast_text
+    timings = {}
+    for name, parse in backends.items():
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for body in bodies:
+                parse(body)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        timings[name] = best
+    return timings
+
+def load_pages(paths):
+    """Bodies of the given .html files and of the .html files in the given directories"""
+    files = []
+    for path in map(Path, paths):
+        files.extend(sorted(path.glob('*.html')) if path.is_dir() else [path])
+    return [file.read_bytes() for file in files]
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ['--cache']:
+        from http_cache import HTTPCache
+        cache = HTTPCache()
+        bodies = [body for body in cache.bodies() if body.lstrip()[:1] == b'<']
+    else:
+        bodies = load_pages(sys.argv[1:] or [FIXTURE_PAGES])
+
+    if not bodies:
+        print("No pages to benchmark - pass saved .html files, or --cache after a scraper has filled the HTTP cache")
+        sys.exit(1)
+
+    total = sum(len(body) for body in bodies)
+    print(f"{len(bodies)} pages, {total / 1024 / 1024:.1f} MB (default parser: {DEFAULT_PARSER})")
+    timings = benchmark(bodies)
+    baseline = timings['html.parser']
+    for name, seconds in timings.items():
+        print(f"  {name:24} {seconds:7.3f}s  {baseline / seconds:5.1f}x")
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+On-disk HTTP cache for the requests.Session scrapers
+
+CachingAdapter is the transport adapter behind crawler.make_session().
+GET responses are stored in SQLite (~/.cache/faculty-scraper/http_cache.db
+or $HTTP_CACHE_DB), keyed by URL plus the request headers named in the
+response's Vary header. A fresh entry is answered locally. A stale one is
+revalidated with If-None-Match / If-Modified-Since, and a 304 reuses the
+stored body. Freshness follows Cache-Control / Expires, falling back to
+10% of the Last-Modified age. A response with none of those headers counts
+as fresh for MIN_FRESH_SECONDS so a page isn't downloaded twice in one run;
+no-cache and max-age=0 responses are always revalidated. no-store and
+Vary: * responses are never stored.
+
+The cache is size bounded: once the bodies exceed MAX_CACHE_BYTES the least
+recently used entries are evicted down to EVICT_TO_FRACTION of it. The
+running total is kept in memory, so a store doesn't rescan the table.
+
+Usage:
+  python3 http_cache.py            # entries and total size
+  python3 http_cache.py clear
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import closing
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+
+from requests.adapters import HTTPAdapter
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+DB_FILE = Path(os.environ.get('HTTP_CACHE_DB', Path.home() / ".cache" / "faculty-scraper" / "http_cache.db"))
+
+MAX_CACHE_BYTES = 200 * 1024 * 1024
+EVICT_TO_FRACTION = 0.9             # evict below the limit so the next stores don't evict again
+MIN_FRESH_SECONDS = 5 * 60           # within-run repeats of pages with no caching headers
+MAX_HEURISTIC_SECONDS = 24 * 3600    # cap on Last-Modified based freshness
+CACHEABLE_STATUS = {200, 203, 301, 308}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url         TEXT    NOT NULL,
+    vary_key    TEXT    NOT NULL,
+    vary        TEXT    NOT NULL,
+    status      INTEGER NOT NULL,
+    reason      TEXT,
+    headers     TEXT    NOT NULL,
+    body        BLOB    NOT NULL,
+    size        INTEGER NOT NULL,
+    fresh_until REAL    NOT NULL,
+    accessed_at REAL    NOT NULL,
+    PRIMARY KEY (url, vary_key)
+)
+"""
+
+def parse_cache_control(value):
+    directives = {}
+    for part in (value or '').split(','):
+        name, _, arg = part.strip().partition('=')
+        if name:
+            directives[name.lower()] = arg.strip('"') if arg else True
+    return directives
+
+def _http_date(value):
+    try:
+        return parsedate_to_datetime(value).timestamp() if value else None
+    except (TypeError, ValueError):
+        return None
+
+def freshness_lifetime(headers, now):
+    """Seconds a response may be served without revalidation"""
+    cc = parse_cache_control(headers.get('Cache-Control'))
+    if 'no-cache' in cc:
+        return 0
+    date = _http_date(headers.get('Date')) or now
+    if 'max-age' in cc:
+        try:
+            lifetime = int(cc['max-age']) - int(headers.get('Age', 0))
+        except (TypeError, ValueError):
+            lifetime = 0
+    elif _http_date(headers.get('Expires')) is not None:
+        lifetime = _http_date(headers['Expires']) - date
+    elif _http_date(headers.get('Last-Modified')) is not None:
+        lifetime = min(MAX_HEURISTIC_SECONDS, (date - _http_date(headers['Last-Modified'])) / 10)
+    else:
+        # No caching headers at all - keep within-run repeats off the network
+        lifetime = MIN_FRESH_SECONDS
+    return max(lifetime, 0)
+
+class _CachedBody:
+    """Stand-in for the urllib3 response so Session code that drains raw works"""
+    def read(self, *args, **kwargs):
+        return b''
+    def release_conn(self):
+        pass
+    def close(self):
+        pass
+
+class HTTPCache:
+    def __init__(self, db_file=DB_FILE, max_bytes=MAX_CACHE_BYTES):
+        self.db_file = Path(db_file)
+        self.max_bytes = max_bytes
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute(SCHEMA)
+            self._total = self._stored_bytes(conn)
+        self._total_lock = threading.Lock()
+
+    def _connect(self):
+        # Short-lived connections - scrapers probe from several threads at once
+        conn = sqlite3.connect(self.db_file, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    @staticmethod
+    def _stored_bytes(conn):
+        return conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    @staticmethod
+    def _vary_key(request_headers, vary_names):
+        return json.dumps([request_headers.get(name, '') for name in vary_names])
+
+    def lookup(self, request):
+        """Stored entry matching the request's URL and Vary headers, or None"""
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT * FROM responses WHERE url = ?", (request.url,)).fetchall()
+            for row in rows:
+                vary_names = json.loads(row['vary'])
+                if self._vary_key(request.headers, vary_names) == row['vary_key']:
+                    conn.execute("UPDATE responses SET accessed_at = ? WHERE url = ? AND vary_key = ?",
+                                 (time.time(), row['url'], row['vary_key']))
+                    entry = dict(row)
+                    entry['headers'] = CaseInsensitiveDict(json.loads(row['headers']))
+                    return entry
+        return None
+
+    def store(self, request, status, reason, headers, body):
+        """Save a response if it may be cached; returns the stored entry or None"""
+        if status not in CACHEABLE_STATUS:
+            return None
+        if 'no-store' in parse_cache_control(headers.get('Cache-Control')):
+            return None
+        vary_names = [name.strip() for name in headers.get('Vary', '').split(',') if name.strip()]
+        if '*' in vary_names:
+            return None
+
+        now = time.time()
+        entry = {
+            'url': request.url,
+            'vary_key': self._vary_key(request.headers, vary_names),
+            'vary': json.dumps(vary_names),
+            'status': status,
+            'reason': reason,
+            'headers': CaseInsensitiveDict(headers),
+            'body': body,
+            'size': len(body),
+            'fresh_until': now + freshness_lifetime(headers, now),
+            'accessed_at': now,
+        }
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            replaced = conn.execute("SELECT size FROM responses WHERE url = ? AND vary_key = ?",
+                                    (entry['url'], entry['vary_key'])).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (entry['url'], entry['vary_key'], entry['vary'], status, reason, json.dumps(dict(headers)),
+                 sqlite3.Binary(body), entry['size'], entry['fresh_until'], now))
+            conn.execute("COMMIT")
+        with self._total_lock:
+            self._total += entry['size'] - (replaced['size'] if replaced else 0)
+            over = self._total > self.max_bytes
+        if over:
+            self.evict()
+        return entry
+
+    def evict(self):
+        """Drop least recently used entries until the bodies fit in EVICT_TO_FRACTION of max_bytes"""
+        target = self.max_bytes * EVICT_TO_FRACTION
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            # Recount - other scraper processes share the database
+            total = self._stored_bytes(conn)
+            if total > self.max_bytes:
+                for row in conn.execute("SELECT url, vary_key, size FROM responses ORDER BY accessed_at").fetchall():
+                    if total <= target:
+                        break
+                    conn.execute("DELETE FROM responses WHERE url = ? AND vary_key = ?",
+                                 (row['url'], row['vary_key']))
+                    total -= row['size']
+            conn.execute("COMMIT")
+        with self._total_lock:
+            self._total = total
+
+    def stats(self):
+        with closing(self._connect()) as conn:
+            count, size, fresh = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(fresh_until > ?), 0) FROM responses",
+                (time.time(),)).fetchone()
+        return {'entries': count, 'bytes': size, 'fresh': fresh}
+
+    def clear(self):
+        with closing(self._connect()) as conn:
+            conn.execute("DELETE FROM responses")
+        with self._total_lock:
+            self._total = 0
+
+    def bodies(self, status=200):
+        """Stored response bodies, e.g. saved pages for html_backend.py's benchmark"""
+        with closing(self._connect()) as conn:
+            return [bytes(row[0]) for row in conn.execute("SELECT body FROM responses WHERE status = ?", (status,))]
+
+class CachingAdapter(HTTPAdapter):
+    """HTTPAdapter that answers GETs from HTTPCache and revalidates stale entries"""
+
+    def __init__(self, cache=None, **kwargs):
+        super().__init__(**kwargs)
+        self.cache = cache or HTTPCache()
+
+    def _cached_response(self, request, entry):
+        response = Response()
+        response.status_code = entry['status']
+        response.reason = entry['reason']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = entry['body']
+        response._content_consumed = True
+        response.raw = _CachedBody()
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.from_cache = True
+        return response
+
+    def send(self, request, stream=False, **kwargs):
+        if request.method != 'GET' or stream:
+            return super().send(request, stream=stream, **kwargs)
+
+        entry = self.cache.lookup(request)
+        if entry and entry['fresh_until'] > time.time():
+            return self._cached_response(request, entry)
+
+        if entry:
+            if entry['headers'].get('ETag'):
+                request.headers['If-None-Match'] = entry['headers']['ETag']
+            if entry['headers'].get('Last-Modified'):
+                request.headers['If-Modified-Since'] = entry['headers']['Last-Modified']
+
+        response = super().send(request, stream=stream, **kwargs)
+
+        if response.status_code == 304 and entry:
+            # Still valid - keep the body, take the new validators and freshness headers
+            headers = CaseInsensitiveDict(entry['headers'])
+            headers.update(response.headers)
+            response.close()
+            stored = self.cache.store(request, entry['status'], entry['reason'], headers, entry['body'])
+            return self._cached_response(request, stored or dict(entry, headers=headers))
+
+        response.from_cache = False
+        self.cache.store(request, response.status_code, response.reason, response.headers, response.content)
+        return response
+
+if __name__ == "__main__":
+    cache = HTTPCache()
+    if len(sys.argv) > 1 and sys.argv[1] == 'clear':
+        cache.clear()
+        print("Cache cleared")
+    else:
+        stats = cache.stats()
+        print(f"{cache.db_file}: {stats['entries']} responses ({stats['fresh']} fresh), "
+              f"{stats['bytes'] / 1024 / 1024:.1f} MB of {cache.max_bytes / 1024 / 1024:.0f} MB")
@@ -1,11 +1,12 @@
-import requests
-from bs4 import BeautifulSoup
 import csv
-import time
 import re
 import json
 from urllib.parse import urljoin, urlparse
 from pathlib import Path
+
+from crawler import Crawler, google_slot, make_session, workers_from_argv
+from html_backend import make_soup
+
 try:
     from googlesearch import search
     GOOGLE_SEARCH_AVAILABLE = True
@@ -14,8 +15,9 @@ except ImportError:
     print("Warning: googlesearch-python not installed. Auto URL discovery disabled.")
 
 class ImprovedTromboneScraper:
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, use_http_cache=True):
+        # Shared connection pool, per-host politeness budget and on-disk HTTP cache (crawler.py)
+        self.session = make_session(use_http_cache)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         })
@@ -89,9 +91,10 @@ class ImprovedTromboneScraper:
             
         try:
             query = f"{university_name} official website"
-            for url in search(query, num_results=3):
-                if '.edu' in url or '.ac.' in url:
-                    return url
+            with google_slot():
+                for url in search(query, num_results=3):
+                    if '.edu' in url or '.ac.' in url:
+                        return url
         except Exception as e:
             print(f"  Could not find URL for {university_name}: {e}")
         return None
@@ -221,7 +224,7 @@ class ImprovedTromboneScraper:
                 url = urljoin(base_url, path)
                 response = self.session.get(url, timeout=10, allow_redirects=True)
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.content, 'html.parser')
+                    soup = make_soup(response.content)
                     page_text = soup.get_text().lower()
                     
                     # Check if this looks like a faculty page
@@ -242,7 +245,7 @@ class ImprovedTromboneScraper:
         """Scrape a specific page for trombone faculty"""
         try:
             response = self.session.get(url, timeout=15)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(response.content)
             soup.url = response.url  # Store URL for reference
             page_text = soup.get_text()
             
@@ -301,13 +304,10 @@ class ImprovedTromboneScraper:
                 if result.get('email'):
                     print(f"    Email: {result['email']}")
                 break
-            time.sleep(1)  # Small delay between page requests
         
         if not result:
             print(f"  ✗ No trombone teacher found")
             self.failed_universities.append(name)
-        
-        time.sleep(2)  # Delay between universities
     
     def save_results(self, filename='trombone_teachers.csv'):
         """Save results to CSV file"""
@@ -365,6 +365,7 @@ University of Southern California,,University"""
 if __name__ == "__main__":
     import sys
     
+    workers = workers_from_argv(sys.argv)
     scraper = ImprovedTromboneScraper()
     
     if len(sys.argv) > 1:
@@ -403,12 +404,11 @@ if __name__ == "__main__":
         print("No universities to process. Exiting.")
         sys.exit(1)
     
-    print(f"\nStarting to scrape {len(universities)} universities...")
+    print(f"\nStarting to scrape {len(universities)} universities ({workers} at a time)...")
     print("Press Ctrl+C to stop at any time.\n")
     
     try:
-        for uni_info in universities:
-            scraper.scrape_university(uni_info)
+        Crawler(workers).run(universities, scraper.scrape_university)
     except KeyboardInterrupt:
         print("\n\nScraping interrupted by user.")
     
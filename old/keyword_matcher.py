@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Precompiled multi-keyword matcher for relevance checks
+
+KeywordMatcher.scan() finds every occurrence of a fixed set of keywords
+(instrument, role, directory words) in a lowercased text and returns a
+KeywordHits table of sorted offsets. Every relevance test on a page -
+"mentions trombone and faculty", "trombone within this element", "professor
+near this name" - is then a lookup or a binary search in that table rather
+than another scan of the text.
+
+With pyahocorasick installed the scan is a single Aho-Corasick pass over
+the text for all keywords. Without it each keyword is located with
+str.find, which for a dozen keywords is still faster than any
+pure-Python automaton.
+"""
+
+from bisect import bisect_left
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+class KeywordHits:
+    """Sorted start offsets of each keyword found in one text"""
+
+    def __init__(self, offsets):
+        self._offsets = offsets
+
+    def __contains__(self, keyword):
+        return bool(self._offsets.get(keyword))
+
+    def offsets(self, keyword):
+        return self._offsets.get(keyword, [])
+
+    def has(self, keyword, start=0, end=None):
+        """True if keyword occurs entirely inside text[start:end]"""
+        positions = self._offsets.get(keyword)
+        if not positions:
+            return False
+        i = bisect_left(positions, max(start, 0))
+        return i < len(positions) and (end is None or positions[i] + len(keyword) <= end)
+
+    def any(self, keywords, start=0, end=None):
+        return any(self.has(keyword, start, end) for keyword in keywords)
+
+class KeywordMatcher:
+    def __init__(self, keywords):
+        self.keywords = tuple(sorted({keyword.lower() for keyword in keywords if keyword}))
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                self._automaton.add_word(keyword, keyword)
+            self._automaton.make_automaton()
+
+    def __contains__(self, keyword):
+        return keyword in self.keywords
+
+    def scan(self, text):
+        """KeywordHits for a lowercased text"""
+        offsets = {keyword: [] for keyword in self.keywords}
+        if self._automaton is not None:
+            for end, keyword in self._automaton.iter(text):
+                offsets[keyword].append(end - len(keyword) + 1)
+        else:
+            for keyword in self.keywords:
+                index = text.find(keyword)
+                while index != -1:
+                    offsets[keyword].append(index)
+                    index = text.find(keyword, index + 1)
+        return KeywordHits(offsets)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Person-name classifier for scraped candidate strings
+
+A directory page produces the same candidates over and over - a link text
+is checked in strategy 1b, again as a heading inside a faculty card, and
+again in the final dedup pass. The vocabularies are built once here, and
+classification is memoized on the whitespace-normalized string (the rules
+only look at the words, so "John\\n  Smith" and "John Smith" share an
+entry). valid_names() scores a whole page's candidates in one call, each
+distinct string once. name_key() is the normalized form results are
+deduplicated on.
+"""
+
+from functools import lru_cache
+
+MIN_LENGTH = 5
+MAX_LENGTH = 50
+MEMO_SIZE = 65536
+
+# Words that make up headings and navigation, not names
+NON_NAME_WORDS = frozenset({
+    'faculty', 'staff', 'department', 'school', 'college', 'university',
+    'music', 'brass', 'professor', 'instructor', 'lecturer',
+    'search', 'filter', 'results', 'loading', 'welcome', 'percussion',
+    'undergraduate', 'graduate', 'diploma', 'degree', 'bachelor', 'master',
+    'performance', 'ensemble', 'orchestra', 'symphony', 'philharmonic',
+    'endowed', 'chair', 'position', 'program', 'studio', 'class',
+    'concert', 'recital', 'audition', 'admission', 'apply', 'application',
+    'curriculum', 'course', 'lesson', 'workshop', 'masterclass', 'seminar',
+    'summer', 'institute', 'spotlight', 'main', 'navigation', 'level'
+})
+
+# Instrument names that shouldn't be part of a person's name (matched as substrings)
+INSTRUMENT_WORDS = ('saxophone', 'trumpet', 'tuba', 'horn', 'jazz', 'tenor', 'alto', 'soprano', 'baritone', 'bass')
+
+@lru_cache(maxsize=MEMO_SIZE)
+def _classify(normalized):
+    parts = normalized.split(' ')
+    if len(parts) < 2 or len(parts) > 5:
+        return False
+
+    # Check if ALL words are non-names (reject things like "Main Navigation")
+    # Don't reject "Saxophone Jazz" style here - that's the instrument check
+    if all(part.lower() in NON_NAME_WORDS for part in parts):
+        return False
+
+    text_lower = normalized.lower()
+    if any(word in text_lower for word in INSTRUMENT_WORDS):
+        return False
+
+    # Must have at least one uppercase word (for last names)
+    return any(part[0].isupper() for part in parts)
+
+def is_valid_name(text):
+    """Check if text is likely a person's name"""
+    if not text or len(text) < MIN_LENGTH or len(text) > MAX_LENGTH:
+        return False
+    return _classify(' '.join(text.split()))
+
+def valid_names(candidates):
+    """The set of candidates that look like names; each distinct string is classified once"""
+    return {candidate for candidate in set(candidates) if is_valid_name(candidate)}
+
+def name_key(name):
+    """Dedup key for a name: whitespace collapsed and case folded"""
+    return ' '.join(name.split()).casefold()
+
+def memo_info():
+    return _classify.cache_info()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Single-pass text model of a parsed page
+
+Calling get_text() on every div/li/section of a page re-walks overlapping
+subtrees, which is roughly quadratic in the size of the DOM. PageModel walks
+the tree once, concatenating its strings into one text (identical to
+soup.get_text()) and recording each element's [start, end) span in it.
+After that, the text of any subtree is a slice of the page text, and
+"does this element mention <keyword>" is a binary search over the
+keyword's precomputed offsets. The same walk lists the tags in document
+order, so find_all() over the page or inside an element is a slice of that
+list instead of another tree traversal.
+
+Given a KeywordMatcher, the page's keyword offsets come from one scan of
+the text up front, and every element-level check reuses them.
+
+Only strings soup.get_text() would include are counted, so <script> and
+<style> contents are left out of every span.
+"""
+
+from bisect import bisect_left
+
+from bs4.element import NavigableString, Tag
+
+class PageModel:
+    def __init__(self, soup, matcher=None):
+        self.soup = soup
+        types = soup.interesting_string_types or Tag.MAIN_CONTENT_STRING_TYPES
+        pieces = []
+        spans = {}       # id(tag) -> [text start, text end, first descendant index, end index]
+        elements = []    # every tag below the root, in document order
+        position = 0
+
+        # Iterative DFS - deep pages would blow the recursion limit
+        spans[id(soup)] = [0, 0, 0, 0]
+        stack = [(soup, iter(soup.children))]
+        while stack:
+            node, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                span = spans[id(node)]
+                span[1] = position
+                span[3] = len(elements)
+                stack.pop()
+            elif isinstance(child, NavigableString):
+                if type(child) in types:
+                    pieces.append(child)
+                    position += len(child)
+            elif isinstance(child, Tag):
+                elements.append(child)
+                spans[id(child)] = [position, position, len(elements), len(elements)]
+                stack.append((child, iter(child.children)))
+
+        self.text = ''.join(pieces)
+        self.lower = self.text.lower()
+        if len(self.lower) != len(self.text):
+            # A few characters (e.g. 'İ') lower to two - keep offsets aligned with self.text
+            self.lower = ''.join(c.lower() if len(c.lower()) == 1 else c for c in self.text)
+        self.elements = elements
+        self._spans = spans
+        self.hits = matcher.scan(self.lower) if matcher else None
+        self._occurrences = {keyword: self.hits.offsets(keyword) for keyword in matcher.keywords} if matcher else {}
+
+    def span(self, element):
+        """(start, end) of an element's text within self.text"""
+        return tuple(self._spans[id(element)][:2])
+
+    def text_of(self, element):
+        """Same as element.get_text() for elements inside the page"""
+        start, end = self._spans[id(element)][:2]
+        return self.text[start:end]
+
+    def lower_text_of(self, element):
+        start, end = self._spans[id(element)][:2]
+        return self.lower[start:end]
+
+    def find_all(self, names, within=None, class_=None):
+        """Tags named in names below within (default: the whole page), in document order
+
+        class_ is an optional compiled regex that one of the tag's classes must match,
+        like soup.find_all(names, class_=re.compile(...)).
+        """
+        names = {names} if isinstance(names, str) else set(names)
+        first, end = self._spans[id(within if within is not None else self.soup)][2:]
+        found = [tag for tag in self.elements[first:end] if tag.name in names]
+        if class_ is not None:
+            found = [tag for tag in found if any(class_.search(c) for c in tag.get('class') or ())]
+        return found
+
+    def occurrences(self, keyword):
+        """Sorted start offsets of a (case-insensitive) keyword in the page text"""
+        keyword = keyword.lower()
+        if keyword not in self._occurrences:
+            found = []
+            index = self.lower.find(keyword)
+            while index != -1:
+                found.append(index)
+                index = self.lower.find(keyword, index + 1)
+            self._occurrences[keyword] = found
+        return self._occurrences[keyword]
+
+    def contains(self, element, keyword):
+        """True if the element's text contains keyword (case-insensitive)"""
+        start, end = self._spans[id(element)][:2]
+        positions = self.occurrences(keyword)
+        i = bisect_left(positions, start)
+        return i < len(positions) and positions[i] + len(keyword) <= end
+
+    def contains_any(self, element, keywords):
+        return any(self.contains(element, keyword) for keyword in keywords)
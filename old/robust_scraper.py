@@ -1,12 +1,21 @@
-import requests
-from bs4 import BeautifulSoup
 import csv
-import time
 import re
 import json
+import threading
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urljoin, urlparse, quote
 from pathlib import Path
 
+from browser_pool import (BrowserPool, default_size, results_text, wait_for_results, wait_for_visible,
+                          wait_ready, wait_until_gone)
+from crawler import MAX_PER_HOST, Crawler, cancel_when, google_slot, make_session, workers_from_argv
+from html_backend import Page
+from keyword_matcher import KeywordMatcher
+from name_classifier import is_valid_name, name_key, valid_names
+from page_model import PageModel
+from search_endpoint_cache import SearchEndpointCache, SEARCH, FACULTY
+
 # Optional imports for enhanced functionality
 try:
     from googlesearch import search
@@ -16,48 +25,149 @@ except ImportError:
     print("Note: googlesearch-python not installed. Auto URL discovery disabled.")
 
 try:
-    from selenium import webdriver
     from selenium.webdriver.common.by import By
     from selenium.webdriver.common.keys import Keys
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    from selenium.webdriver.chrome.options import Options
-    from selenium.common.exceptions import ElementNotInteractableException, InvalidElementStateException, TimeoutException
+    from selenium.common.exceptions import ElementNotInteractableException, InvalidElementStateException
     SELENIUM_AVAILABLE = True
 except ImportError:
     SELENIUM_AVAILABLE = False
     print("Note: Selenium not installed. JavaScript search disabled.")
     print("      Install with: pip install selenium")
 
+SEARCH_TERMS = ["trombone faculty", "trombone professor", "trombone"]
+
+# Search inputs tried by search_with_selenium, best guesses first
+SEARCH_BOX_SELECTORS = [
+    "input[type='text'][placeholder*='search' i]",
+    "input[type='search']",
+    "input[name='s']",
+    "input[name='q']",
+    "input[name='search']",
+    "input[name='query']",
+    "input[placeholder*='earch' i]",
+    "input.search",
+    "input#search",
+    ".search-input input",
+    "#search-input",
+    "input[aria-label*='earch' i]",
+    "input[id*='search' i]",
+    "input[class*='search' i]",
+    "form[role='search'] input[type='text']",
+    "form[class*='search'] input[type='text']"
+]
+
+# Common site-search URL patterns; {term} is the quoted search term
+SEARCH_URL_TEMPLATES = [
+    "/?s={term}",
+    "/search?q={term}",
+    "/search?search={term}",
+    "/search?query={term}",
+    "/search?keyword={term}",
+    "/search?keywords={term}",
+    "/search/{term}",
+    "/search-results?q={term}",
+    "/site-search?q={term}",
+]
+
+PROBE_WORKERS_PER_HOST = MAX_PER_HOST   # search URLs in flight at once against one site
+PROBE_TIMEOUT = 10
+
+# Relevance keywords - every page is scanned for all of them once (see keyword_matcher.py)
+INSTRUMENT_TERMS = ['trombone', 'brass']
+SEARCH_RESULT_TERMS = ['faculty', 'professor', 'music', 'school']
+ENTRY_TERMS = ['faculty', 'professor', 'music']
+FACULTY_PAGE_TERMS = ['faculty', 'people', 'staff', 'instructor', 'professor']
+DIRECTORY_LINK_TERMS = ['faculty', 'people', 'directory', 'staff']
+KEYWORDS = KeywordMatcher(INSTRUMENT_TERMS + SEARCH_RESULT_TERMS + FACULTY_PAGE_TERMS + DIRECTORY_LINK_TERMS)
+
+# Pattern bank - compiled once, matched with finditer so offsets are kept
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+IGNORED_EMAIL_PARTS = ['example', 'domain', 'email', 'your', 'info@', 'admin@', 'webmaster@']
+WHITESPACE_PATTERN = re.compile(r'\s+')
+FACULTY_CLASS_PATTERN = re.compile('faculty|staff|people|profile|member|person|instructor', re.I)
+
+# "Name | Institution" in search results
+NAME_INSTITUTION_PATTERN = re.compile(r'([A-Z][a-z]+ [A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s*\|\s*[^|]+')
+
+# Name next to the instrument; group 1 is the name
+INSTRUMENT_NAME_PATTERNS = [re.compile(pattern) for pattern in [
+    # "Name, bass trombone" or "Name, trombone"
+    r'([A-Z][a-z]+ (?:[A-Z]\. )?[A-Z][a-z]+(?:-[A-Z][a-z]+)?),?\s*(?:bass\s+)?trombone',
+    # "trombone: Name" or "bass trombone: Name"
+    r'(?:bass\s+)?[Tt]rombone\s*(?:–|-|:|,)\s*([A-Z][a-z]+ (?:[A-Z]\. )?[A-Z][a-z]+(?:-[A-Z][a-z]+)?)',
+    # "Name (trombone)" or "Name (bass trombone)"
+    r'([A-Z][a-z]+ (?:[A-Z]\. )?[A-Z][a-z]+(?:-[A-Z][a-z]+)?)\s*\((?:bass\s+)?[Tt]rombone\)',
+    # "Name Trombone Faculty" or "Name Professor of Trombone"
+    r'([A-Z][a-z]+ [A-Z][a-z]+)\s+(?:[Tt]rombone\s+[Ff]aculty|[Pp]rofessor\s+of\s+[Tt]rombone)',
+    # For entries like "Dylan Halliday, bass trombone"
+    r'([A-Z][a-z]+\s+[A-Z][a-z]+),\s*bass\s+trombone',
+    # For entries like "Andrew Ng, bass trombone"
+    r'([A-Z][a-z]+\s+[A-Z][a-z]+),\s*(?:bass\s+)?trombone\s*[^.|;]',
+]]
+
+class ResultStore:
+    """Results in insertion order, deduplicated in O(1) on (university, normalized name)
+    
+    Safe to share between the crawl's worker threads.
+    """
+    
+    def __init__(self):
+        self._by_key = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def key(result):
+        return result.get('university'), name_key(result['name'])
+    
+    def add(self, result):
+        """Store result unless that person is already known; True if it was added"""
+        key = self.key(result)
+        with self._lock:
+            if key in self._by_key:
+                return False
+            self._by_key[key] = result
+            return True
+    
+    def has_name(self, name, university=None):
+        return (university, name_key(name)) in self._by_key
+    
+    def __iter__(self):
+        with self._lock:
+            return iter(list(self._by_key.values()))
+    
+    def __len__(self):
+        return len(self._by_key)
+
 class RobustTromboneScraper:
-    def __init__(self, use_selenium=False):
-        self.session = requests.Session()
+    def __init__(self, use_selenium=False, use_endpoint_cache=True, use_http_cache=True, browsers=1):
+        # Shared connection pool, per-host politeness budget and on-disk HTTP cache (crawler.py)
+        self.session = make_session(use_http_cache)
+        # Remembers each site's working search pattern / faculty path across runs
+        self.endpoint_cache = SearchEndpointCache() if use_endpoint_cache else None
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         })
-        self.results = []
+        self.results = ResultStore()
         self.failed_universities = []
+        self._failed_lock = threading.Lock()
         self.use_selenium = use_selenium and SELENIUM_AVAILABLE
-        self.driver = None
+        # Headless browsers for JavaScript search, started as workers need them (browser_pool.py)
+        self.browsers = None
         
         if self.use_selenium:
             try:
-                chrome_options = Options()
-                chrome_options.add_argument('--headless')  # Run in background
-                chrome_options.add_argument('--disable-gpu')
-                chrome_options.add_argument('--no-sandbox')
-                chrome_options.add_argument('--disable-dev-shm-usage')
-                chrome_options.add_argument('--window-size=1920,1080')  # Set window size
-                self.driver = webdriver.Chrome(options=chrome_options)
-                print("✓ Selenium initialized for JavaScript search support")
+                self.browsers = BrowserPool(browsers)
+                self.browsers.start()
+                print(f"✓ Selenium initialized for JavaScript search support (up to {browsers} browsers)")
             except Exception as e:
                 print(f"Warning: Could not initialize Selenium: {e}")
+                self.browsers = None
                 self.use_selenium = False
     
     def __del__(self):
-        if self.driver:
+        if getattr(self, 'browsers', None):
             try:
-                self.driver.quit()
+                self.browsers.close()
             except:
                 pass
     
@@ -99,47 +209,90 @@ class RobustTromboneScraper:
             
         try:
             query = f"{university_name} official website"
-            for url in search(query, num_results=3):
-                if '.edu' in url or '.ac.' in url:
-                    return url
+            with google_slot():
+                for url in search(query, num_results=3):
+                    if '.edu' in url or '.ac.' in url:
+                        return url
         except Exception as e:
             print(f"  Could not find URL for {university_name}: {e}")
         return None
     
+    def probe_search_url(self, search_url, stop=None):
+        """Fetch one candidate search URL; (Page, final_url) if it looks like trombone results
+        
+        Once stop is set the probe is skipped - or abandoned while it waits
+        for the site's request budget - and a response that arrives anyway
+        is closed and discarded.
+        """
+        if stop is not None and stop.is_set():
+            return None
+        try:
+            with cancel_when(stop), \
+                    self.session.get(search_url, timeout=PROBE_TIMEOUT, allow_redirects=True) as response:
+                if response.status_code != 200 or (stop is not None and stop.is_set()):
+                    return None
+                page = Page(response.content, matcher=KEYWORDS)
+                
+                # Check if we got search results with relevant content
+                if 'trombone' in page.hits and page.hits.any(SEARCH_RESULT_TERMS):
+                    return page, response.url
+        except Exception:
+            pass
+        return None
+    
     def search_website(self, base_url, search_terms=None):
-        """Try to search the website using common search patterns"""
-        if search_terms is None:
-            search_terms = ["trombone faculty", "trombone professor", "trombone"]
+        """Try to search the website using common search patterns
         
-        for search_term in search_terms:
-            print(f"  Trying website search for '{search_term}'...")
-            
+        All term x template combinations are probed concurrently (at most
+        PROBE_WORKERS_PER_HOST in flight against the site). The first
+        relevant page wins: queued probes are dropped, running ones that
+        haven't reached the network give up, and the responses of ones that
+        did are closed and discarded.
+        
+        The winning template (or the fact that none worked) is cached per
+        site, so the next run tries just that template.
+        """
+        if search_terms is None:
+            search_terms = SEARCH_TERMS
+        base = base_url.rstrip('/')
+        
+        cached = self.endpoint_cache.get(base_url, SEARCH) if self.endpoint_cache else None
+        if cached and cached[0]:
+            template = cached[1]
+            print(f"  Using cached search pattern {template}")
+            for search_term in search_terms:
+                found = self.probe_search_url(base + template.format(term=quote(search_term)))
+                if found:
+                    print(f"    ✓ Found search results at: {found[1]}")
+                    return found
+            # Stopped working (or nothing for these terms) - probe everything again
+            self.endpoint_cache.forget(base_url, SEARCH)
+        elif cached:
+            print(f"  No working search pattern last time - skipping URL probes")
+        
+        if not cached or cached[0]:
             # Method 1: Try common search URL patterns
-            search_urls = [
-                f"{base_url}/?s={quote(search_term)}",
-                f"{base_url}/search?q={quote(search_term)}",
-                f"{base_url}/search?search={quote(search_term)}",
-                f"{base_url}/search?query={quote(search_term)}",
-                f"{base_url}/search?keyword={quote(search_term)}",
-                f"{base_url}/search?keywords={quote(search_term)}",
-                f"{base_url}/search/{quote(search_term)}",
-                f"{base_url}/search-results?q={quote(search_term)}",
-                f"{base_url}/site-search?q={quote(search_term)}"
-            ]
+            candidates = [(base + template.format(term=quote(search_term)), template)
+                          for search_term in search_terms for template in SEARCH_URL_TEMPLATES]
+            print(f"  Probing {len(candidates)} search URLs for {', '.join(repr(t) for t in search_terms)}...")
             
-            for search_url in search_urls:
-                try:
-                    response = self.session.get(search_url, timeout=10, allow_redirects=True)
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.content, 'html.parser')
-                        page_text = soup.get_text().lower()
-                        
-                        # Check if we got search results with relevant content
-                        if 'trombone' in page_text and any(word in page_text for word in ['faculty', 'professor', 'music', 'school']):
-                            print(f"    ✓ Found search results at: {response.url}")
-                            return soup, response.url
-                except:
-                    continue
+            pool = ThreadPoolExecutor(max_workers=PROBE_WORKERS_PER_HOST)
+            stop = threading.Event()
+            try:
+                futures = {pool.submit(self.probe_search_url, url, stop): template for url, template in candidates}
+                for future in as_completed(futures):
+                    found = future.result()
+                    if found:
+                        print(f"    ✓ Found search results at: {found[1]}")
+                        if self.endpoint_cache:
+                            self.endpoint_cache.record_hit(base_url, SEARCH, futures[future])
+                        return found
+            finally:
+                stop.set()
+                pool.shutdown(wait=False, cancel_futures=True)
+            
+            if self.endpoint_cache:
+                self.endpoint_cache.record_miss(base_url, SEARCH)
         
         # Method 2: Use Selenium if available and no results found
         if self.use_selenium:
@@ -149,22 +302,32 @@ class RobustTromboneScraper:
         return None, None
     
     def search_with_selenium(self, url, search_term="trombone"):
-        """Use Selenium to interact with JavaScript search"""
-        if not self.driver:
+        """Use Selenium to interact with JavaScript search
+
+        Borrows a browser from the pool, so each worker can search a
+        different site at once. Every step waits for the page event it
+        needs (document ready, element shown or closed, results arrived)
+        instead of sleeping a fixed time.
+        """
+        if not self.browsers:
             return None, None
         
         print(f"    Using Selenium to search...")
-        max_retries = 3
+        with self.browsers.browser() as driver:
+            return self._search_in_browser(driver, url, search_term)
+    
+    def _search_in_browser(self, driver, url, search_term):
+        max_retries = 2
         
         for attempt in range(max_retries):
             try:
-                self.driver.get(url)
-                time.sleep(3)  # Let page load completely
+                driver.get(url)
+                wait_ready(driver)
                 
                 # Try to handle popups/cookies/overlays
                 try:
                     # Scroll to top
-                    self.driver.execute_script("window.scrollTo(0, 0);")
+                    driver.execute_script("window.scrollTo(0, 0);")
                     
                     # Try to close common popup/cookie elements
                     popup_selectors = [
@@ -179,11 +342,11 @@ class RobustTromboneScraper:
                     
                     for selector in popup_selectors:
                         try:
-                            elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                            elements = driver.find_elements(By.CSS_SELECTOR, selector)
                             for elem in elements[:2]:  # Only try first 2 to avoid over-clicking
                                 if elem.is_displayed() and elem.is_enabled():
                                     elem.click()
-                                    time.sleep(1)
+                                    wait_until_gone(driver, elem)
                                     break
                         except:
                             pass
@@ -219,7 +382,7 @@ class RobustTromboneScraper:
                             # Skip CSS4 selectors for now
                             continue
                             
-                        icons = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                        icons = driver.find_elements(By.CSS_SELECTOR, selector)
                         for icon in icons[:3]:  # Try first 3 matches
                             if icon.is_displayed() and icon.is_enabled():
                                 try:
@@ -230,7 +393,7 @@ class RobustTromboneScraper:
                                     if 'search' in parent_class.lower() or 'search' in parent_label.lower():
                                         print(f"      Clicking search icon: {selector}")
                                         icon.click()
-                                        time.sleep(2)  # Wait for search box to appear
+                                        wait_for_visible(driver, SEARCH_BOX_SELECTORS)  # Wait for search box to appear
                                         search_revealed = True
                                         break
                                 except:
@@ -242,38 +405,18 @@ class RobustTromboneScraper:
                         continue
                 
                 # STEP 2: Now try to find the search input box
-                search_selectors = [
-                    "input[type='search']:visible",  # Visible search inputs
-                    "input[type='text'][placeholder*='search' i]",
-                    "input[type='search']",
-                    "input[name='s']",
-                    "input[name='q']",
-                    "input[name='search']",
-                    "input[name='query']",
-                    "input[placeholder*='earch' i]",
-                    "input.search",
-                    "input#search",
-                    ".search-input input",
-                    "#search-input",
-                    "input[aria-label*='earch' i]",
-                    "input[id*='search' i]",
-                    "input[class*='search' i]",
-                    "form[role='search'] input[type='text']",
-                    "form[class*='search'] input[type='text']"
-                ]
                 
                 search_box = None
                 successful_selector = None
                 
-                for selector in search_selectors:
+                for selector in SEARCH_BOX_SELECTORS:
                     try:
-                        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                        elements = driver.find_elements(By.CSS_SELECTOR, selector)
                         for elem in elements:
                             if elem.is_displayed() and elem.is_enabled():
                                 # Try to click on it first to make it active
                                 try:
                                     elem.click()
-                                    time.sleep(0.5)
                                 except:
                                     pass
                                 
@@ -297,7 +440,7 @@ class RobustTromboneScraper:
                 if not search_box:
                     # Try JavaScript to find and focus search input
                     try:
-                        self.driver.execute_script("""
+                        driver.execute_script("""
                             var inputs = document.querySelectorAll('input');
                             for(var i = 0; i < inputs.length; i++) {
                                 var input = inputs[i];
@@ -312,9 +455,8 @@ class RobustTromboneScraper:
                             }
                             return false;
                         """)
-                        time.sleep(1)
                         # Try to find the focused element
-                        search_box = self.driver.switch_to.active_element
+                        search_box = driver.switch_to.active_element
                     except:
                         pass
                 
@@ -322,6 +464,7 @@ class RobustTromboneScraper:
                     print(f"      Found search box using: {successful_selector or 'JavaScript focus'}")
                     
                     # Clear and type search term
+                    before_url, results_before = driver.current_url, results_text(driver)
                     search_box.clear()
                     search_box.send_keys(search_term)
                     
@@ -340,7 +483,7 @@ class RobustTromboneScraper:
                     
                     for selector in submit_selectors:
                         try:
-                            submit_buttons = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                            submit_buttons = driver.find_elements(By.CSS_SELECTOR, selector)
                             for btn in submit_buttons:
                                 if btn.is_displayed() and btn.is_enabled():
                                     print(f"      Clicking search submit button")
@@ -358,24 +501,17 @@ class RobustTromboneScraper:
                         search_box.send_keys(Keys.RETURN)
                     
                     # Wait for results to load
-                    time.sleep(3)
-                    
-                    # Check if results loaded
-                    try:
-                        WebDriverWait(self.driver, 5).until(
-                            lambda d: search_term.lower() in d.page_source.lower()
-                        )
-                    except TimeoutException:
+                    if not wait_for_results(driver, before_url, search_box, results_before):
                         print(f"      Warning: Search may not have returned results")
                     
-                    soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-                    current_url = self.driver.current_url
+                    page = Page(driver.page_source, matcher=KEYWORDS)
+                    current_url = driver.current_url
                     print(f"      ✓ Search completed via Selenium")
-                    return soup, current_url
+                    return page, current_url
                 else:
-                    print(f"      Attempt {attempt + 1}: Could not find search box")
-                    if attempt < max_retries - 1:
-                        print(f"      Retrying...")
+                    # The page was fully loaded and waited on, so reloading won't help
+                    print(f"      Could not find search box")
+                    return None, None
                         
             except ElementNotInteractableException as e:
                 print(f"      Search box found but not interactable (attempt {attempt + 1})")
@@ -383,12 +519,12 @@ class RobustTromboneScraper:
                 
                 # Try to find and click a search button/icon that might reveal the search box
                 try:
-                    search_buttons = self.driver.find_elements(By.CSS_SELECTOR, 
+                    search_buttons = driver.find_elements(By.CSS_SELECTOR, 
                         "button[aria-label*='search' i], a[href*='search'], button[class*='search' i]")
                     for btn in search_buttons[:3]:
                         if btn.is_displayed():
                             btn.click()
-                            time.sleep(2)
+                            wait_for_visible(driver, SEARCH_BOX_SELECTORS)
                             break
                 except:
                     pass
@@ -405,70 +541,45 @@ class RobustTromboneScraper:
     
     def extract_emails(self, text):
         """Extract email addresses from text"""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        return [e for e in emails if not any(x in e.lower() for x in ['example', 'domain', 'email', 'your', 'info@', 'admin@', 'webmaster@'])]
+        emails = EMAIL_PATTERN.findall(text)
+        return [e for e in emails if not any(x in e.lower() for x in IGNORED_EMAIL_PARTS)]
+    
+    def index_emails(self, text):
+        """(start, end, email) for every usable email in text, in order"""
+        return [(m.start(), m.end(), m.group()) for m in EMAIL_PATTERN.finditer(text)
+                if not any(x in m.group().lower() for x in IGNORED_EMAIL_PARTS)]
+    
+    def emails_between(self, email_index, start, end):
+        """Emails from index_emails() lying entirely inside text[start:end]"""
+        i = bisect_left(email_index, (max(start, 0),))
+        emails = []
+        while i < len(email_index) and email_index[i][1] <= end:
+            emails.append(email_index[i][2])
+            i += 1
+        return emails
     
     def is_valid_name(self, text):
-        """Check if text is likely a person's name"""
-        if not text or len(text) < 5 or len(text) > 50:
-            return False
-        
-        parts = text.split()
-        if len(parts) < 2 or len(parts) > 5:
-            return False
-        
-        # Expanded list of non-names
-        non_name_words = {
-            'faculty', 'staff', 'department', 'school', 'college', 'university',
-            'music', 'brass', 'professor', 'instructor', 'lecturer',
-            'search', 'filter', 'results', 'loading', 'welcome', 'percussion',
-            'undergraduate', 'graduate', 'diploma', 'degree', 'bachelor', 'master',
-            'performance', 'ensemble', 'orchestra', 'symphony', 'philharmonic',
-            'endowed', 'chair', 'position', 'program', 'studio', 'class',
-            'concert', 'recital', 'audition', 'admission', 'apply', 'application',
-            'curriculum', 'course', 'lesson', 'workshop', 'masterclass', 'seminar',
-            'summer', 'institute', 'spotlight', 'main', 'navigation', 'level'
-        }
-        
-        # Don't reject "Saxophone Jazz" style - check individual words
-        text_lower = text.lower()
-        
-        # Check if ALL words are non-names (reject things like "Main Navigation")
-        all_non_names = all(part.lower() in non_name_words for part in parts)
-        if all_non_names:
-            return False
-        
-        # Check for instrument names that shouldn't be part of a person's name
-        instrument_words = {'saxophone', 'trumpet', 'tuba', 'horn', 'jazz', 'tenor', 'alto', 'soprano', 'baritone', 'bass'}
-        for word in instrument_words:
-            if word in text_lower:
-                return False
-        
-        # Must have at least one uppercase word (for last names)
-        has_proper_name = any(p[0].isupper() for p in parts if p)
-        
-        # Check for common name patterns (First Last, First M. Last, etc.)
-        name_pattern = r'^[A-Z][a-z]+(\s+[A-Z]\.?)?\s+[A-Z][a-z]+(-[A-Z][a-z]+)?$'
-        if re.match(name_pattern, text):
-            return True
-        
-        return has_proper_name and len(parts) >= 2
+        """Check if text is likely a person's name (memoized, see name_classifier.py)"""
+        return is_valid_name(text)
     
-    def extract_trombone_faculty(self, soup, page_text):
-        """Extract trombone faculty from search results or faculty page"""
-        results = []
+    def extract_trombone_faculty(self, soup, model=None):
+        """Extract trombone faculty from search results or faculty page
+        
+        Element text and tag lookups come from a PageModel built once per
+        page rather than get_text()/find_all() on every nested div/li/section.
+        """
+        model = model or PageModel(soup, KEYWORDS)
+        page_text = model.text
+        results = ResultStore()
         
         # Strategy 1: Extract from search result headings and descriptions
         # Look for patterns like "Peter Ellefson: Current: Faculty: Jacobs School of Music"
-        result_entries = soup.find_all(['div', 'article', 'li', 'section', 'h3', 'h4'])
+        result_entries = model.find_all(['div', 'article', 'li', 'section', 'h3', 'h4'])
         
         for entry in result_entries:
-            entry_text = entry.get_text()
-            entry_lower = entry_text.lower()
-            
             # Check if this entry mentions trombone and faculty/professor
-            if 'trombone' in entry_lower and any(term in entry_lower for term in ['faculty', 'professor', 'music']):
+            if model.contains(entry, 'trombone') and model.contains_any(entry, ENTRY_TERMS):
+                entry_text = model.text_of(entry)
                 # Try to extract name from the beginning of the entry
                 # Often formatted as "Name: Title: Department"
                 lines = entry_text.split('\n')
@@ -481,7 +592,7 @@ class RobustTromboneScraper:
                         potential_name = line
                     
                     # Clean and validate the name
-                    potential_name = re.sub(r'\s+', ' ', potential_name)  # Normalize whitespace
+                    potential_name = WHITESPACE_PATTERN.sub(' ', potential_name)  # Normalize whitespace
                     potential_name = potential_name.strip()
                     
                     if self.is_valid_name(potential_name) and len(potential_name) > 5:
@@ -489,111 +600,87 @@ class RobustTromboneScraper:
                         emails = self.extract_emails(entry_text)
                         
                         # Make sure we're not duplicating
-                        if not any(r['name'] == potential_name for r in results):
-                            results.append({
-                                'name': potential_name,
-                                'email': emails[0] if emails else None
-                            })
+                        if results.add({
+                            'name': potential_name,
+                            'email': emails[0] if emails else None
+                        }):
                             break  # Found a name in this entry, move to next
         
         # Strategy 1b: Look for linked names in search results
-        # Find all links in the page that might be faculty names
-        all_links = soup.find_all('a')
-        for link in all_links:
-            link_text = link.get_text().strip()
-            # Check if the link's parent or nearby text mentions trombone
-            parent = link.parent
-            if parent:
-                parent_text = parent.get_text().lower()
-                if 'trombone' in parent_text and self.is_valid_name(link_text):
-                    if not any(r['name'] == link_text for r in results):
-                        results.append({
-                            'name': link_text,
-                            'email': None
-                        })
+        # Find all links in the page that might be faculty names:
+        # ones whose parent or nearby text mentions trombone
+        link_texts = [model.text_of(link).strip() for link in model.find_all('a')
+                      if link.parent and model.contains(link.parent, 'trombone')]
+        valid_links = valid_names(link_texts)
+        for link_text in link_texts:
+            if link_text in valid_links:
+                results.add({
+                    'name': link_text,
+                    'email': None
+                })
         
         # Strategy 2: Look for faculty cards/profiles containing "trombone"
-        faculty_containers = soup.find_all(['div', 'article', 'li', 'section'], 
-                                          class_=re.compile('faculty|staff|people|profile|member|person|instructor', re.I))
+        faculty_containers = model.find_all(['div', 'article', 'li', 'section'], 
+                                            class_=FACULTY_CLASS_PATTERN)
         
         for container in faculty_containers:
-            container_text = container.get_text()
-            if 'trombone' in container_text.lower():
+            if model.contains(container, 'trombone'):
+                container_text = model.text_of(container)
                 # Find name (usually in heading or link)
-                name_elems = container.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'a', 'strong'])
+                name_elems = model.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'a', 'strong'], within=container)
                 for name_elem in name_elems:
-                    name = name_elem.get_text().strip()
+                    name = model.text_of(name_elem).strip()
                     if self.is_valid_name(name):
-                        emails = self.extract_emails(container_text)
-                        if not any(r['name'] == name for r in results):
-                            results.append({
+                        if not results.has_name(name):
+                            emails = self.extract_emails(container_text)
+                            results.add({
                                 'name': name,
                                 'email': emails[0] if emails else None
                             })
                         break  # Only take first valid name per container
         
+        # Strategies 3 and 4 work on the whole page text; emails near a match
+        # come from one pass over the page, windowed by the match offset
+        email_index = self.index_emails(page_text)
+        
         # Strategy 3: Look for specific patterns in search results
         # Pattern: "Name | Institution" where text contains trombone and professor
-        name_institution_pattern = r'([A-Z][a-z]+ [A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s*\|\s*[^|]+'
-        matches = re.findall(name_institution_pattern, page_text)
-        for match in matches:
+        for m in NAME_INSTITUTION_PATTERN.finditer(page_text):
+            match = m.group(1)
             # Check if this match is near "trombone" and "professor"
-            match_index = page_text.find(match)
-            context = page_text[max(0, match_index-100):match_index+300].lower()
-            if 'trombone' in context and ('professor' in context or 'faculty' in context):
-                if self.is_valid_name(match):
-                    emails = self.extract_emails(context)
-                    if not any(r['name'] == match for r in results):
-                        results.append({
-                            'name': match,
-                            'email': emails[0] if emails else None
-                        })
+            start, end = max(0, m.start(1)-100), m.start(1)+300
+            if model.hits.has('trombone', start, end) and model.hits.any(['professor', 'faculty'], start, end):
+                if self.is_valid_name(match) and not results.has_name(match):
+                    emails = [e.lower() for e in self.emails_between(email_index, start, end)]
+                    results.add({
+                        'name': match,
+                        'email': emails[0] if emails else None
+                    })
         
         # Strategy 4: Pattern matching for various name formats
-        patterns = [
-            # "Name, bass trombone" or "Name, trombone"
-            r'([A-Z][a-z]+ (?:[A-Z]\. )?[A-Z][a-z]+(?:-[A-Z][a-z]+)?),?\s*(?:bass\s+)?trombone',
-            # "trombone: Name" or "bass trombone: Name"
-            r'(?:bass\s+)?[Tt]rombone\s*(?:–|-|:|,)\s*([A-Z][a-z]+ (?:[A-Z]\. )?[A-Z][a-z]+(?:-[A-Z][a-z]+)?)',
-            # "Name (trombone)" or "Name (bass trombone)"
-            r'([A-Z][a-z]+ (?:[A-Z]\. )?[A-Z][a-z]+(?:-[A-Z][a-z]+)?)\s*\((?:bass\s+)?[Tt]rombone\)',
-            # "Name Trombone Faculty" or "Name Professor of Trombone"
-            r'([A-Z][a-z]+ [A-Z][a-z]+)\s+(?:[Tt]rombone\s+[Ff]aculty|[Pp]rofessor\s+of\s+[Tt]rombone)',
-            # For entries like "Dylan Halliday, bass trombone"
-            r'([A-Z][a-z]+\s+[A-Z][a-z]+),\s*bass\s+trombone',
-            # For entries like "Andrew Ng, bass trombone"
-            r'([A-Z][a-z]+\s+[A-Z][a-z]+),\s*(?:bass\s+)?trombone\s*[^.|;]',
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, page_text)
-            for match in matches:
-                if self.is_valid_name(match):
+        for pattern in INSTRUMENT_NAME_PATTERNS:
+            found = list(pattern.finditer(page_text))
+            valid_matches = valid_names(m.group(1) for m in found)
+            for m in found:
+                match = m.group(1)
+                if match in valid_matches and not results.has_name(match):
                     # Find email near this name
-                    name_index = page_text.find(match)
-                    context = page_text[max(0, name_index-200):name_index+200]
-                    emails = self.extract_emails(context)
-                    
-                    if not any(r['name'] == match for r in results):
-                        results.append({
-                            'name': match,
-                            'email': emails[0] if emails else None
-                        })
-        
-        # Remove duplicates and invalid names
-        seen_names = set()
-        unique_results = []
-        for result in results:
-            name = result['name']
-            # Final validation
-            if name not in seen_names and self.is_valid_name(name):
-                seen_names.add(name)
-                unique_results.append(result)
-        
-        return unique_results
+                    emails = self.emails_between(email_index, m.start(1)-200, m.start(1)+200)
+                    results.add({
+                        'name': match,
+                        'email': emails[0] if emails else None
+                    })
+        
+        # Final validation (the store already dropped duplicates)
+        valid = valid_names(r['name'] for r in results)
+        return [result for result in results if result['name'] in valid]
     
     def find_faculty_pages(self, base_url, is_music_school=False):
-        """Find faculty pages with multiple strategies"""
+        """Find faculty pages with multiple strategies
+        
+        The direct path that worked last time is cached per site and tried
+        first; a site where none worked goes straight to the homepage links.
+        """
         found_pages = []
         
         # Strategy 1: Direct faculty page URLs
@@ -602,34 +689,51 @@ class RobustTromboneScraper:
         else:
             paths = ['/music/faculty', '/music/people', '/school-of-music/faculty', '/music/directory']
         
+        cached = self.endpoint_cache.get(base_url, FACULTY) if self.endpoint_cache else None
+        if cached and cached[0]:
+            # Known-good path first; the others only if it stopped working
+            paths = [cached[1]] + [path for path in paths if path != cached[1]]
+        elif cached:
+            paths = []
+        
+        first_hit = None
         for path in paths:
             try:
                 url = urljoin(base_url, path)
                 response = self.session.get(url, timeout=10, allow_redirects=True)
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    page_text = soup.get_text().lower()
+                    hits = Page(response.content, matcher=KEYWORDS).hits
                     
-                    if any(word in page_text for word in ['faculty', 'people', 'staff', 'instructor', 'professor']):
+                    if hits.any(FACULTY_PAGE_TERMS):
                         found_pages.append(response.url)
-                        if 'trombone' in page_text or 'brass' in page_text:
+                        first_hit = first_hit or path
+                        if hits.any(INSTRUMENT_TERMS):
+                            if self.endpoint_cache:
+                                self.endpoint_cache.record_hit(base_url, FACULTY, path)
                             return [response.url]  # Priority page
+                        if cached and path == cached[1]:
+                            break  # Cached path still serves the faculty listing
             except:
                 continue
         
+        if self.endpoint_cache and paths:
+            if first_hit:
+                self.endpoint_cache.record_hit(base_url, FACULTY, first_hit)
+            else:
+                self.endpoint_cache.record_miss(base_url, FACULTY)
+        
         # Strategy 2: Search homepage for faculty links
         if not found_pages:
             try:
                 response = self.session.get(base_url, timeout=10)
-                soup = BeautifulSoup(response.content, 'html.parser')
+                model = Page(response.content, matcher=KEYWORDS).model
                 
                 # Find all links that might lead to faculty
-                links = soup.find_all('a', href=True)
+                links = [link for link in model.find_all('a') if link.has_attr('href')]
                 for link in links:
-                    link_text = link.get_text().lower()
                     link_href = link['href'].lower()
                     
-                    if any(word in link_text or word in link_href for word in ['faculty', 'people', 'directory', 'staff']):
+                    if model.contains_any(link, DIRECTORY_LINK_TERMS) or any(word in link_href for word in DIRECTORY_LINK_TERMS):
                         full_url = urljoin(base_url, link['href'])
                         if full_url not in found_pages:
                             found_pages.append(full_url)
@@ -657,24 +761,23 @@ class RobustTromboneScraper:
             base_url = self.find_university_url(name)
             if not base_url:
                 print(f"  ✗ Could not find URL")
-                self.failed_universities.append(name)
+                self.record_failure(name)
                 return
             print(f"  ✓ Found: {base_url}")
         
         # Strategy 1: Try website search with multiple search terms
-        search_soup, search_url = self.search_website(base_url)
+        search_page, search_url = self.search_website(base_url)
         
-        if search_soup:
-            results = self.extract_trombone_faculty(search_soup, search_soup.get_text())
+        if search_page:
+            results = self.extract_trombone_faculty(search_page.soup, model=search_page.model)
             if results:
                 # Take up to 3 results from search (might find multiple faculty)
                 for result in results[:3]:
-                    # Check if we already have this person
-                    if not any(r['university'] == name and r['name'] == result['name'] for r in self.results):
-                        result['university'] = name
-                        result['university_website'] = base_url
-                        result['source'] = 'Website Search'
-                        self.results.append(result)
+                    result['university'] = name
+                    result['university_website'] = base_url
+                    result['source'] = 'Website Search'
+                    # Skip people we already have for this university
+                    if self.results.add(result):
                         print(f"  ✓ Found via search: {result['name']}")
                         if result.get('email'):
                             print(f"    Email: {result['email']}")
@@ -690,31 +793,30 @@ class RobustTromboneScraper:
             for page_url in faculty_pages:
                 try:
                     response = self.session.get(page_url, timeout=15)
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    page_text = soup.get_text()
+                    page = Page(response.content, matcher=KEYWORDS)
                     
-                    if 'trombone' in page_text.lower():
+                    if 'trombone' in page.hits:
                         print(f"    Found 'trombone' at: {page_url}")
-                        results = self.extract_trombone_faculty(soup, page_text)
+                        results = self.extract_trombone_faculty(page.soup, model=page.model)
                         if results:
                             result = results[0]
                             result['university'] = name
                             result['university_website'] = base_url
                             result['source'] = 'Faculty Page'
-                            self.results.append(result)
+                            self.results.add(result)
                             print(f"  ✓ Found: {result['name']}")
                             if result.get('email'):
                                 print(f"    Email: {result['email']}")
                             return
                 except Exception as e:
                     print(f"    Error accessing {page_url}: {e}")
-                
-                time.sleep(1)
         
         print(f"  ✗ No trombone teacher found")
-        self.failed_universities.append(name)
-        
-        time.sleep(2)  # Delay between universities
+        self.record_failure(name)
+    
+    def record_failure(self, name):
+        with self._failed_lock:
+            self.failed_universities.append(name)
     
     def save_results(self, filename='trombone_teachers.csv'):
         """Save results to CSV file"""
@@ -758,8 +860,10 @@ if __name__ == "__main__":
     use_selenium = '--selenium' in sys.argv
     if use_selenium:
         sys.argv.remove('--selenium')
+    workers = workers_from_argv(sys.argv)
     
-    scraper = RobustTromboneScraper(use_selenium=use_selenium)
+    # Workers that need a browser share one per CPU at most
+    scraper = RobustTromboneScraper(use_selenium=use_selenium, browsers=default_size(workers))
     
     # Get input/output files
     if len(sys.argv) > 1:
@@ -777,6 +881,7 @@ if __name__ == "__main__":
         print("\nUsage:")
         print("  python robust_scraper.py [input.csv] [output.csv]")
         print("  python robust_scraper.py --selenium [input.csv]  # For JavaScript sites")
+        print("  python robust_scraper.py --workers N [input.csv]  # Universities crawled at once")
         print("")
         
         input_file = input("Enter input file (default: universities_sample.csv): ").strip()
@@ -794,12 +899,11 @@ if __name__ == "__main__":
         print("No universities to process.")
         sys.exit(1)
     
-    print(f"\nProcessing {len(universities)} universities...")
+    print(f"\nProcessing {len(universities)} universities ({workers} at a time)...")
     print("Press Ctrl+C to stop.\n")
     
     try:
-        for uni_info in universities:
-            scraper.scrape_university(uni_info)
+        Crawler(workers).run(universities, scraper.scrape_university)
     except KeyboardInterrupt:
         print("\n\nInterrupted by user.")
     
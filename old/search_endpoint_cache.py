@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Per-site cache of which search URL pattern and faculty path work
+
+robust_scraper.py probes up to 27 search URLs and several faculty paths per
+university. The winner for each site (e.g. "/search?query={term}" or
+"/music/faculty") is remembered here, and so is a miss, so later runs and
+other instruments go straight to the working endpoint - or skip probing a
+site that has none - with a single request.
+
+Stored in SQLite next to the MX cache (~/.cache/faculty-scraper/) or at
+$SEARCH_CACHE_DB. Hits are kept for 30 days, misses for 7.
+
+Usage:
+  python3 search_endpoint_cache.py            # list cached sites
+  python3 search_endpoint_cache.py clear      # forget everything
+"""
+
+import os
+import sqlite3
+import sys
+import time
+from contextlib import closing
+from pathlib import Path
+from urllib.parse import urlparse
+
+DB_FILE = Path(os.environ.get('SEARCH_CACHE_DB',
+                              Path.home() / ".cache" / "faculty-scraper" / "search_endpoints.db"))
+
+HIT_TTL = 30 * 24 * 3600
+MISS_TTL = 7 * 24 * 3600
+
+SEARCH = 'search'     # value is a SEARCH_URL_TEMPLATES entry
+FACULTY = 'faculty'   # value is a faculty page path
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS endpoints (
+    domain     TEXT NOT NULL,
+    kind       TEXT NOT NULL,
+    value      TEXT,
+    found      INTEGER NOT NULL,
+    checked_at REAL NOT NULL,
+    PRIMARY KEY (domain, kind)
+)
+"""
+
+def site_key(url):
+    """Cache key for a site: its host without a leading www."""
+    host = urlparse(url if '//' in url else f"//{url}").netloc.lower()
+    return host[4:] if host.startswith('www.') else host
+
+class SearchEndpointCache:
+    def __init__(self, db_file=DB_FILE):
+        self.db_file = Path(db_file)
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute(SCHEMA)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_file, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def get(self, url, kind):
+        """(found, value) for a site if known and not expired, else None"""
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT value, found, checked_at FROM endpoints WHERE domain = ? AND kind = ?",
+                               (site_key(url), kind)).fetchone()
+        if not row:
+            return None
+        value, found, checked_at = row
+        if time.time() - checked_at > (HIT_TTL if found else MISS_TTL):
+            return None
+        return bool(found), value
+
+    def _put(self, url, kind, value, found):
+        with closing(self._connect()) as conn:
+            conn.execute("INSERT OR REPLACE INTO endpoints (domain, kind, value, found, checked_at) "
+                         "VALUES (?, ?, ?, ?, ?)", (site_key(url), kind, value, int(found), time.time()))
+
+    def record_hit(self, url, kind, value):
+        self._put(url, kind, value, True)
+
+    def record_miss(self, url, kind):
+        self._put(url, kind, None, False)
+
+    def forget(self, url, kind):
+        """Drop a stale entry (the cached endpoint stopped working)"""
+        with closing(self._connect()) as conn:
+            conn.execute("DELETE FROM endpoints WHERE domain = ? AND kind = ?", (site_key(url), kind))
+
+    def clear(self):
+        with closing(self._connect()) as conn:
+            conn.execute("DELETE FROM endpoints")
+
+    def entries(self):
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT domain, kind, value, found, checked_at FROM endpoints "
+                                "ORDER BY domain, kind").fetchall()
+
+if __name__ == "__main__":
+    cache = SearchEndpointCache()
+    if len(sys.argv) > 1 and sys.argv[1] == 'clear':
+        cache.clear()
+        print("Cache cleared")
+    else:
+        for domain, kind, value, found, checked_at in cache.entries():
+            age_days = (time.time() - checked_at) / 86400
+            print(f"{domain:40} {kind:8} {value if found else '(none)':30} {age_days:.1f}d old")
@@ -1,13 +1,15 @@
-import requests
-from bs4 import BeautifulSoup
 import csv
-import time
 import re
+import sys
 from urllib.parse import urljoin, urlparse
 
+from crawler import Crawler, make_session, workers_from_argv
+from html_backend import make_soup
+
 class UniversityTromboneScraper:
     def __init__(self):
-        self.session = requests.Session()
+        # Shared connection pool and per-host politeness budget (crawler.py)
+        self.session = make_session(use_http_cache=False)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
@@ -46,7 +48,7 @@ class UniversityTromboneScraper:
         """Scrape a faculty/department page for trombone teachers"""
         try:
             response = self.session.get(url, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(response.content)
             
             # Convert to lowercase for searching
             page_text = soup.get_text().lower()
@@ -96,7 +98,7 @@ class UniversityTromboneScraper:
         """Scrape an individual faculty member's page"""
         try:
             response = self.session.get(url, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(response.content)
             
             # Extract name from title or h1
             name = None
@@ -142,9 +144,6 @@ class UniversityTromboneScraper:
                 print(f"No trombone teacher found at {university_name}")
         else:
             print(f"Could not find music department at {university_name}")
-        
-        # Be respectful - add delay between requests
-        time.sleep(2)
     
     def save_results(self, filename='trombone_teachers.csv'):
         """Save results to CSV file"""
@@ -176,9 +175,8 @@ if __name__ == "__main__":
         # Add more universities here
     ]
     
-    # Scrape each university
-    for name, url in universities:
-        scraper.scrape_university(name, url)
+    # Scrape the universities concurrently - each host still gets polite traffic
+    Crawler(workers_from_argv(sys.argv)).run(universities, lambda uni: scraper.scrape_university(*uni))
     
     # Save results
     scraper.save_results()
@@ -1,11 +1,14 @@
-import requests
-from bs4 import BeautifulSoup
 import csv
-import time
+import heapq
+import itertools
 import re
 import json
 from urllib.parse import urljoin, urlparse
 from pathlib import Path
+
+from crawler import Crawler, canonical_url, google_slot, make_session, site_of, workers_from_argv
+from html_backend import make_soup
+
 try:
     from googlesearch import search  # You'll need: pip install googlesearch-python
     GOOGLE_SEARCH_AVAILABLE = True
@@ -13,9 +16,26 @@ except ImportError:
     GOOGLE_SEARCH_AVAILABLE = False
     print("Warning: googlesearch-python not installed. Auto URL discovery disabled.")
 
+NAME_PATTERN = re.compile(r'\b([A-Z][a-z]+ [A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\b')
+
+# find_trombone_faculty's crawl of a music department
+PAGE_BUDGET = 12       # pages fetched per university
+MAX_DEPTH = 2          # links followed from the department page
+FRONTIER_SIZE = 40     # best-scoring links kept waiting
+LINK_KEYWORDS = {
+    'trombone': 10, 'brass': 6, 'faculty': 4, 'people': 3,
+    'staff': 2, 'wind': 2, 'instrumental': 2,
+}
+
+def score_link(link_text, link_href):
+    """Relevance of a link from the keywords in its (lowercased) text and URL"""
+    return sum(weight for keyword, weight in LINK_KEYWORDS.items()
+               if keyword in link_text or keyword in link_href)
+
 class EnhancedTromboneScraper:
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, use_http_cache=True):
+        # Shared connection pool, per-host politeness budget and on-disk HTTP cache (crawler.py)
+        self.session = make_session(use_http_cache)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
@@ -102,9 +122,10 @@ class EnhancedTromboneScraper:
         try:
             # Search for the university
             query = f"{university_name} official website"
-            for url in search(query, num_results=3):
-                if '.edu' in url or '.ac.' in url:  # Educational domains
-                    return url
+            with google_slot():
+                for url in search(query, num_results=3):
+                    if '.edu' in url or '.ac.' in url:  # Educational domains
+                        return url
         except Exception as e:
             print(f"  Could not find URL for {university_name}: {e}")
         return None
@@ -148,7 +169,7 @@ class EnhancedTromboneScraper:
                 response = self.session.get(url, timeout=10, allow_redirects=True)
                 if response.status_code == 200:
                     # Verify it's actually a music page
-                    soup = BeautifulSoup(response.content, 'html.parser')
+                    soup = make_soup(response.content)
                     page_text = soup.get_text().lower()
                     if 'music' in page_text or 'faculty' in page_text:
                         print(f"  ✓ Found music department at: {response.url}")
@@ -160,7 +181,7 @@ class EnhancedTromboneScraper:
         try:
             print(f"  Searching homepage for music links...")
             response = self.session.get(base_url, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(response.content)
             
             # Look for links containing "music"
             music_links = soup.find_all('a', href=True)
@@ -176,80 +197,101 @@ class EnhancedTromboneScraper:
         
         return None
     
-    def find_trombone_faculty(self, url, depth=0, visited=None):
-        """Recursively search for trombone faculty (with depth limit)"""
-        if depth > 2:  # Don't go too deep
+    def trombone_candidate(self, soup, url):
+        """Name (and email) found near a "trombone" mention on a page, or None
+        
+        Prefers a name whose surrounding text also has an email address.
+        """
+        all_text = soup.get_text()
+        if 'trombone' not in all_text.lower():
             return None
+        print(f"    Found 'trombone' mention at: {url}")
         
-        if visited is None:
-            visited = set()
+        # Filter out common non-names
+        non_names = ['School Music', 'University College', 'Department Music', 
+                    'Music Department', 'Associate Professor', 'Assistant Professor',
+                    'Music Building', 'Concert Hall', 'Bachelor Music', 'Master Music']
         
-        if url in visited:
-            return None
+        first = None
+        for m in re.finditer(r'trombone', all_text, re.I):
+            pos = m.start()
+            # Extract context around "trombone" (500 chars before and after)
+            context = all_text[max(0, pos-500):pos+500]
+            
+            # Look for names (capitalized words)
+            potential_names = [name for name in NAME_PATTERN.findall(context)
+                               if name not in non_names and len(name) > 5]
+            if not potential_names:
+                continue
+            
+            # Look for emails in the context
+            emails = self.extract_emails(context)
+            candidate = {
+                'name': potential_names[0],
+                'email': emails[0] if emails else None,
+                'source_url': url,
+                'context': context[:200]  # Save some context
+            }
+            if candidate['email']:
+                return candidate
+            first = first or candidate
+        return first
+    
+    def find_trombone_faculty(self, url, page_budget=PAGE_BUDGET):
+        """Best-first search from url for trombone faculty
         
-        visited.add(url)
+        Links are scored by the faculty/brass/trombone keywords in their text
+        and URL, and the most promising page is fetched next - up to
+        page_budget pages, MAX_DEPTH links from the start page, keeping the
+        FRONTIER_SIZE best links waiting. Pages are keyed by canonical URL, so
+        ?utm_..., #fragment and trailing-slash variants are fetched once.
+        Stops at the first trombone faculty member with an email; otherwise
+        returns the first one found without.
+        """
+        site = site_of(url)
+        order = itertools.count()
+        frontier = [(0, 0, next(order), url)]   # (-score, depth, tie-break, url)
+        seen = {canonical_url(url)}
+        fallback = None
+        fetched = 0
         
-        try:
-            response = self.session.get(url, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            page_text = soup.get_text().lower()
+        while frontier and fetched < page_budget:
+            _, depth, _, page_url = heapq.heappop(frontier)
+            fetched += 1
+            try:
+                response = self.session.get(page_url, timeout=10)
+                soup = make_soup(response.content)
+            except Exception as e:
+                print(f"    Error accessing {page_url}: {e}")
+                continue
             
-            # Check if this page mentions trombone
-            if 'trombone' in page_text:
-                print(f"    Found 'trombone' mention at: {url}")
-                
-                # Look for faculty information near "trombone"
-                all_text = soup.get_text()
-                
-                # Find the position of "trombone" in the text
-                trombone_positions = [m.start() for m in re.finditer(r'trombone', all_text, re.I)]
-                
-                for pos in trombone_positions:
-                    # Extract context around "trombone" (500 chars before and after)
-                    context = all_text[max(0, pos-500):pos+500]
-                    
-                    # Look for names (capitalized words)
-                    name_pattern = r'\b([A-Z][a-z]+ [A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\b'
-                    potential_names = re.findall(name_pattern, context)
-                    
-                    # Look for emails in the context
-                    emails = self.extract_emails(context)
-                    
-                    # Filter out common non-names
-                    non_names = ['School Music', 'University College', 'Department Music', 
-                                'Music Department', 'Associate Professor', 'Assistant Professor',
-                                'Music Building', 'Concert Hall', 'Bachelor Music', 'Master Music']
-                    
-                    for name in potential_names:
-                        if name not in non_names and len(name) > 5:
-                            return {
-                                'name': name,
-                                'email': emails[0] if emails else None,
-                                'source_url': url,
-                                'context': context[:200]  # Save some context
-                            }
+            candidate = self.trombone_candidate(soup, page_url)
+            if candidate:
+                if candidate['email']:
+                    return candidate
+                fallback = fallback or candidate
             
-            # If not found on this page, check linked pages (faculty, people, brass pages)
-            if depth == 0:
-                relevant_links = soup.find_all('a', href=True)
-                for link in relevant_links:
-                    link_text = link.get_text().lower()
-                    link_href = link['href'].lower()
-                    
-                    # Check if this might be a relevant faculty/brass page
-                    if any(keyword in link_text or keyword in link_href 
-                          for keyword in ['faculty', 'people', 'staff', 'brass', 'trombone', 'wind', 'instrumental']):
-                        full_url = urljoin(url, link['href'])
-                        if full_url != url:  # Don't revisit the same page
-                            result = self.find_trombone_faculty(full_url, depth + 1, visited)
-                            if result:
-                                return result
-                            time.sleep(0.5)  # Small delay between requests
+            if depth >= MAX_DEPTH:
+                continue
             
-        except Exception as e:
-            print(f"    Error accessing {url}: {e}")
+            # Queue linked faculty/brass pages on the same site by relevance
+            for link in soup.find_all('a', href=True):
+                score = score_link(link.get_text().lower(), link['href'].lower())
+                if not score:
+                    continue
+                full_url = urljoin(page_url, link['href'])
+                if not full_url.startswith(('http://', 'https://')) or site_of(full_url) != site:
+                    continue
+                key = canonical_url(full_url)
+                if key in seen:
+                    continue
+                seen.add(key)
+                heapq.heappush(frontier, (-score, depth + 1, next(order), full_url))
+            
+            if len(frontier) > FRONTIER_SIZE:
+                frontier = heapq.nsmallest(FRONTIER_SIZE, frontier)  # sorted, so still a heap
         
-        return None
+        return fallback
     
     def scrape_university(self, university_name, base_url=None):
         """Main method to scrape a university website"""
@@ -288,9 +330,6 @@ class EnhancedTromboneScraper:
         else:
             print(f"  ✗ Could not find music department")
             self.failed_universities.append(university_name)
-        
-        # Be respectful - add delay between universities
-        time.sleep(2)
     
     def save_results(self, filename='trombone_teachers.csv'):
         """Save results to CSV file"""
@@ -372,6 +411,7 @@ Curtis Institute of Music"""
 if __name__ == "__main__":
     import sys
     
+    workers = workers_from_argv(sys.argv)
     scraper = EnhancedTromboneScraper()
     
     # Check command line arguments
@@ -417,12 +457,11 @@ if __name__ == "__main__":
         sys.exit(1)
     
     # Process each university
-    print(f"\nStarting to scrape {len(universities)} universities...")
+    print(f"\nStarting to scrape {len(universities)} universities ({workers} at a time)...")
     print("This may take a while. Press Ctrl+C to stop at any time.\n")
     
     try:
-        for name, url in universities:
-            scraper.scrape_university(name, url)
+        Crawler(workers).run(universities, lambda uni: scraper.scrape_university(*uni))
     except KeyboardInterrupt:
         print("\n\nScraping interrupted by user.")
     
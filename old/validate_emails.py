@@ -1,20 +1,164 @@
 #!/usr/bin/env python3
 """
 Email validation script using multiple non-intrusive techniques
+
+--deep RCPT-checks every address instead of one sample per domain. It
+reuses one SMTP session per MX host for all of that host's addresses and
+works through hosts in parallel, rate limited per host.
+
+Usage:
+  python3 validate_emails.py [master.csv] [--deep] [--smtp-port N]
 """
 
 import csv
 import re
 import socket
 import smtplib
+import sys
 import dns.resolver
 from datetime import datetime
 from collections import defaultdict
+from pathlib import Path
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Shared on-disk MX cache lives in the top-level folder
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+try:
+    from mx_cache import MXCache, negative_ttl
+    MX_CACHE_AVAILABLE = True
+except ImportError:
+    MX_CACHE_AVAILABLE = False
+    print("Note: mx_cache.py not found. MX lookups will not be cached between runs.")
+
+MAIL_FROM = 'test@example.com'
+SMTP_PORT = 25
+MAX_PARALLEL_HOSTS = 8        # MX hosts verified at the same time
+HOST_INTERVAL = 0.5           # seconds between RCPT probes to the same host
+RCPTS_PER_TRANSACTION = 50    # RSET + new MAIL FROM after this many recipients
+
+class SMTPSessionVerifier:
+    """
+    Deep RCPT verification with one SMTP session per MX host
+
+    Addresses are grouped by MX host; each host gets a single connection
+    (HELO + MAIL FROM once) and all of its addresses are probed with RCPT TO
+    on it, never sending DATA. Hosts run in parallel, but each host only
+    sees one probe per host_interval seconds.
+    """
+    
+    def __init__(self, port=SMTP_PORT, timeout=10, max_hosts=MAX_PARALLEL_HOSTS,
+                 host_interval=HOST_INTERVAL, rcpts_per_transaction=RCPTS_PER_TRANSACTION,
+                 mail_from=MAIL_FROM):
+        self.port = port
+        self.timeout = timeout
+        self.max_hosts = max_hosts
+        self.host_interval = host_interval
+        self.rcpts_per_transaction = rcpts_per_transaction
+        self.mail_from = mail_from
+        self.lock = threading.Lock()
+    
+    @staticmethod
+    def classify(code, message):
+        if code in (250, 251):
+            return 'valid', 'RCPT accepted'
+        if code in (550, 551, 553):
+            return 'invalid', 'User does not exist'
+        # 4xx (greylisting, rate limits) and anything else can't be decided
+        return 'unknown', f'Response code: {code}'
+    
+    def _open(self, mx_host):
+        server = smtplib.SMTP(timeout=self.timeout)
+        server.connect(mx_host, self.port)
+        server.helo(server.local_hostname)
+        server.mail(self.mail_from)
+        return server
+    
+    @staticmethod
+    def _close(server):
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+    
+    @staticmethod
+    def describe(error):
+        """Same short reasons smtp_verify reports"""
+        if isinstance(error, smtplib.SMTPServerDisconnected):
+            return 'Server disconnected'
+        if isinstance(error, smtplib.SMTPConnectError):
+            return 'Could not connect'
+        if isinstance(error, socket.timeout):
+            return 'Connection timeout'
+        return str(error)[:50]
+    
+    def verify_host(self, mx_host, emails):
+        """Probe every address on one MX host over a reused session; returns {email: (status, details)}"""
+        results = {}
+        server = None
+        in_transaction = 0
+        last_probe = 0.0
+        
+        for i, email in enumerate(emails):
+            reason = None
+            for attempt in range(2):  # reconnect once if the server drops us mid-session
+                if server is None:
+                    try:
+                        server = self._open(mx_host)
+                        in_transaction = 0
+                    except (smtplib.SMTPException, OSError) as e:
+                        # Host unreachable or refusing us - don't retry it once per address
+                        reason = self.describe(e)
+                        for rest in emails[i:]:
+                            results[rest] = ('unknown', reason)
+                        return results
+                try:
+                    if in_transaction >= self.rcpts_per_transaction:
+                        server.rset()
+                        server.mail(self.mail_from)
+                        in_transaction = 0
+                    
+                    wait = last_probe + self.host_interval - time.monotonic()
+                    if wait > 0:
+                        time.sleep(wait)
+                    last_probe = time.monotonic()
+                    
+                    code, message = server.rcpt(email)
+                    in_transaction += 1
+                    results[email] = self.classify(code, message)
+                    break
+                except (smtplib.SMTPException, OSError) as e:
+                    server.close()
+                    server = None
+                    reason = self.describe(e)
+            else:
+                results[email] = ('unknown', reason)
+        
+        if server is not None:
+            self._close(server)
+        return results
+    
+    def verify_many(self, emails_by_host, progress=None):
+        """Verify {mx_host: [emails]} with hosts in parallel; returns {email: (status, details)}"""
+        results = {}
+        
+        def run(item):
+            mx_host, emails = item
+            host_results = self.verify_host(mx_host, emails)
+            with self.lock:
+                results.update(host_results)
+                if progress:
+                    progress(mx_host, host_results)
+        
+        with ThreadPoolExecutor(max_workers=self.max_hosts) as pool:
+            list(pool.map(run, emails_by_host.items()))
+        return results
 
 class EmailValidator:
-    def __init__(self):
+    def __init__(self, use_cache=True):
         self.results = []
+        self.mx_cache = MXCache() if use_cache and MX_CACHE_AVAILABLE else None
         
     def validate_syntax(self, email):
         """Check if email syntax is valid"""
@@ -22,12 +166,25 @@ class EmailValidator:
         return re.match(pattern, email) is not None
     
     def check_mx_records(self, domain):
-        """Check if domain has valid MX records"""
+        """Check if domain has valid MX records (cached on disk until the TTL runs out)"""
+        if self.mx_cache:
+            cached = self.mx_cache.get(domain)
+            if cached:
+                return cached
+        
         try:
             mx_records = dns.resolver.resolve(domain, 'MX')
-            return len(mx_records) > 0, [str(mx.exchange) for mx in mx_records]
+            result = (len(mx_records) > 0, [str(mx.exchange) for mx in mx_records])
+            ttl = mx_records.rrset.ttl
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer) as e:
+            result, ttl = (False, []), negative_ttl(e) if self.mx_cache else 0
         except Exception as e:
+            # Timeouts etc. - don't remember these
             return False, []
+        
+        if self.mx_cache:
+            self.mx_cache.put(domain, result[0], result[1], ttl)
+        return result
     
     def smtp_verify(self, email, mx_host, timeout=10):
         """
@@ -113,7 +270,11 @@ class EmailValidator:
             # Small delay to be respectful
             time.sleep(0.5)
         
-        # Determine likely validity
+        self.set_likely_valid(result)
+        return result
+    
+    def set_likely_valid(self, result):
+        """Determine likely validity from the MX and SMTP results"""
         if result['mx_exists']:
             if result['smtp_status'] == 'valid':
                 result['likely_valid'] = True
@@ -122,14 +283,49 @@ class EmailValidator:
             else:
                 # MX exists but SMTP unknown - probably valid
                 result['likely_valid'] = True
-        
-        return result
 
-def validate_faculty_emails():
-    """Validate emails from the master file"""
+def deep_validate(validator, domains, smtp_port=SMTP_PORT):
+    """MX-check every address, then RCPT-verify them all with one session per MX host"""
+    results = []
+    by_host = defaultdict(list)
+    by_email = {}
+    
+    for domain, items in domains.items():
+        for item in items:
+            result = validator.validate_email(item['email'], smtp_check=False)
+            result['name'] = item['name']
+            result['university'] = item['university']
+            results.append(result)
+            if result['mx_servers'] and domain not in ['gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com']:
+                by_host[result['mx_servers'][0].rstrip('.')].append(item['email'])
+                by_email[item['email']] = result
+    
+    print(f"RCPT-checking {len(by_email)} emails on {len(by_host)} mail servers...")
+    
+    def report(mx_host, host_results):
+        print(f"\n{mx_host} ({len(host_results)} emails)")
+        for email, (status, details) in host_results.items():
+            mark = '✗' if status == 'invalid' else '✓'
+            print(f"  {mark} {email} - {details}")
+    
+    verifier = SMTPSessionVerifier(port=smtp_port)
+    for email, (status, details) in verifier.verify_many(by_host, progress=report).items():
+        result = by_email[email]
+        result['smtp_status'] = status
+        result['smtp_details'] = details
+        validator.set_likely_valid(result)
+    
+    return results
+
+def validate_faculty_emails(master_file="trombone_faculty_master_FINAL_20250811.csv", deep=False,
+                            smtp_port=SMTP_PORT):
+    """Validate emails from the master file
+    
+    deep=True RCPT-checks every address through SMTPSessionVerifier
+    instead of sampling the first address per .edu domain.
+    """
     
     validator = EmailValidator()
-    master_file = "trombone_faculty_master_FINAL_20250811.csv"
     
     print("Reading master file...")
     emails_to_validate = []
@@ -160,6 +356,12 @@ def validate_faculty_emails():
     
     print(f"Checking {len(domains)} unique domains...")
     
+    if deep:
+        results = deep_validate(validator, domains, smtp_port)
+        stats['likely_valid'] = sum(1 for r in results if r['likely_valid'])
+        stats['likely_invalid'] = len(results) - stats['likely_valid']
+        domains = {}
+    
     for domain, items in domains.items():
         print(f"\nChecking {domain} ({len(items)} emails)...")
         
@@ -197,7 +399,7 @@ def validate_faculty_emails():
     with open(output_file, 'w', newline='', encoding='utf-8') as f:
         fieldnames = ['email', 'name', 'university', 'likely_valid', 'syntax_valid', 
                      'domain', 'mx_exists', 'smtp_status', 'smtp_details']
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
         writer.writeheader()
         
         for result in results:
@@ -219,7 +421,7 @@ def validate_faculty_emails():
     if invalid_emails:
         invalid_file = f"emails_needing_review_{datetime.now().strftime('%Y%m%d')}.csv"
         with open(invalid_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
             writer.writeheader()
             writer.writerows(invalid_emails)
         print(f"Emails needing review: {invalid_file}")
@@ -234,4 +436,16 @@ if __name__ == "__main__":
         subprocess.check_call(['pip', 'install', 'dnspython'])
         import dns.resolver
     
-    validate_faculty_emails()
\ No newline at end of file
+    args = sys.argv[1:]
+    deep = '--deep' in args
+    smtp_port = SMTP_PORT
+    if '--smtp-port' in args:
+        i = args.index('--smtp-port')
+        smtp_port = int(args[i + 1])
+        del args[i:i + 2]
+    args = [a for a in args if a != '--deep']
+    
+    if args:
+        validate_faculty_emails(args[0], deep, smtp_port)
+    else:
+        validate_faculty_emails(deep=deep, smtp_port=smtp_port)
\ No newline at end of file
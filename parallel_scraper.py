@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+Parallel scraping orchestrator - runs several university jobs at once
+
+Replaces the one-at-a-time loop in smart_automated_scraper_v2.sh. A shared
+scheduler hands out the next university index from music_schools_wikipedia.csv
+to N worker slots, claiming jobs atomically from progress.db
+(progress_store.py). Every job gets its own work directory (tmp/jobs/uni_XXX/)
+holding its prompt, agent output and progress file, plus its own batch file
+and URL log, so jobs never touch each other's files.
+
+Usage:
+  python3 parallel_scraper.py [--workers N] [--agent-cmd CMD] [--timeout MIN]
+  python3 parallel_scraper.py --instruments trombone,piano,violin [...]
+
+The agent command is run through the shell from the instrument folder.
+{prompt_file}, {workdir} and {idx} are filled in per job.
+
+Completion is event driven: with watchdog installed (inotify on Linux,
+FSEvents on macOS) a job wakes as soon as its batch or progress file
+changes, or its agent exits, instead of polling every second.
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+from generate_simple_resumable_prompt import build_prompt
+from progress_store import ProgressStore, SCRAPE_PASS, read_last_processed
+from university_catalog import get_catalog
+
+# Optional imports for enhanced functionality
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+    FileSystemEventHandler = object
+    print("Note: watchdog not installed. Falling back to polling for job completion.")
+    print("      Install with: pip install watchdog")
+
+LOG_DIR = Path("logs")
+BATCH_DIR = Path("results/batches")
+URL_LOG_DIR = Path("results/url_logs")
+TMP_DIR = Path("tmp")
+JOBS_DIR = TMP_DIR / "jobs"
+
+UNIVERSITIES_FILE = Path("music_schools_wikipedia.csv")
+TOTAL_UNIVERSITIES = 202
+
+DEFAULT_AGENT_CMD = 'claude -p < "{prompt_file}"'
+DEFAULT_WORKERS = 4
+MAX_WAIT_MINUTES = 3
+MAX_ATTEMPTS = 3
+POLL_SECONDS = 1
+
+_log_lock = threading.Lock()
+_log_file = None
+
+def log_message(message):
+    """Log to both file and terminal (same as log_message in the shell scripts)"""
+    with _log_lock:
+        print(message, flush=True)
+        if _log_file:
+            with open(_log_file, 'a') as f:
+                f.write(message + "\n")
+
+def write_progress(last_processed, progress_file):
+    """Write a job's progress file in the two-line format the prompt asks for"""
+    with open(progress_file, 'w') as f:
+        f.write(f"LAST_PROCESSED={last_processed}\n")
+        f.write(f"TOTAL_UNIVERSITIES={TOTAL_UNIVERSITIES}\n")
+
+class UniversityScheduler:
+    """Hands out university indices to workers from the shared progress store
+
+    Claims are atomic updates in progress.db, so two slots (or two
+    orchestrators) never get the same university and a restart picks up
+    exactly the jobs that were not finished.
+    """
+
+    def __init__(self, store=None, pass_name=SCRAPE_PASS):
+        self.store = store or ProgressStore()
+        self.pass_name = pass_name
+        self.max_attempts = self.store.max_attempts
+        # Loaded once for the whole run - prompt generation never re-reads the CSV
+        self.catalog = get_catalog(UNIVERSITIES_FILE)
+
+    def next_job(self, worker=None):
+        """Return (idx, university row) for the next job, or (None, None) when empty"""
+        job = self.store.claim_next(self.pass_name, worker)
+        if not job:
+            return None, None
+        return job['idx'], self.catalog.get(job['idx'])
+
+    def mark_done(self, idx, batch_file=None, url_log=None, worker=None):
+        """False if the job's lease expired and another worker has it now"""
+        return self.store.mark_done(self.pass_name, idx, batch_file, url_log, worker)
+
+    def mark_failed(self, idx, worker=None):
+        """Requeue a timed-out job so it resumes from its URL log, up to max_attempts
+
+        Returns the job's new state, or None if another worker has it now.
+        """
+        return self.store.mark_failed(self.pass_name, idx, worker)
+
+    def status(self):
+        counts = self.store.counts(self.pass_name)
+        finished = counts.get('done', 0) + counts.get('skipped', 0)
+        return f"{finished}/{sum(counts.values())}"
+
+class CompletionWatcher(FileSystemEventHandler):
+    """Wakes the job whose batch or progress file just changed
+
+    Jobs register the files they care about together with a threading.Event;
+    any create/modify/move touching one of those paths sets the event.
+    """
+
+    def __init__(self, batch_dir=BATCH_DIR):
+        super().__init__()
+        self.batch_dir = batch_dir
+        self.lock = threading.Lock()
+        self.watched = {}
+        self.observer = None
+
+    def start(self):
+        if not WATCHDOG_AVAILABLE:
+            return
+        self.observer = Observer()
+        self.observer.schedule(self, str(self.batch_dir), recursive=False)
+        self.observer.schedule(self, str(JOBS_DIR), recursive=True)
+        self.observer.start()
+
+    def stop(self):
+        if self.observer:
+            self.observer.stop()
+            self.observer.join()
+
+    def register(self, paths, wake):
+        with self.lock:
+            for path in paths:
+                self.watched[Path(path).resolve()] = wake
+
+    def unregister(self, paths):
+        with self.lock:
+            for path in paths:
+                self.watched.pop(Path(path).resolve(), None)
+
+    def on_any_event(self, event):
+        if event.is_directory:
+            return
+        for path in (event.src_path, getattr(event, 'dest_path', None)):
+            if not path:
+                continue
+            with self.lock:
+                wake = self.watched.get(Path(path).resolve())
+            if wake:
+                wake.set()
+
+class ScrapeJob:
+    """One university scraped by one agent process"""
+
+    # Overridden by jobs that keep their files elsewhere (multi_instrument.py)
+    jobs_dir = JOBS_DIR
+    batch_dir = BATCH_DIR
+    tmp_dir = TMP_DIR
+    url_log_dir = URL_LOG_DIR
+
+    def __init__(self, idx, uni, agent_cmd, max_wait_minutes=MAX_WAIT_MINUTES, watcher=None):
+        self.idx = idx
+        self.uni = uni
+        self.agent_cmd = agent_cmd
+        self.max_seconds = max_wait_minutes * 60
+        self.watcher = watcher
+
+        self.workdir = self.jobs_dir / f"uni_{idx:03d}"
+        self.prompt_file = self.workdir / "prompt.txt"
+        self.progress_file = self.workdir / "progress_tracker.txt"
+        self.agent_log = self.workdir / "agent.log"
+        self.batch_file = self.batch_dir / f"uni_{idx:03d}.csv"
+        self.url_log = self.tmp_dir / f"uni_{idx:03d}_urls.txt"
+
+    def build_prompt(self):
+        return build_prompt(self.idx, self.uni, progress_file=str(self.progress_file))
+
+    def prepare(self):
+        self.workdir.mkdir(parents=True, exist_ok=True)
+        write_progress(self.idx - 1, self.progress_file)
+
+        prompt = self.build_prompt()
+        with open(self.prompt_file, 'w') as f:
+            f.write(prompt)
+        shutil.copy(self.prompt_file, LOG_DIR / f"prompt_batch_{self.idx}.txt")
+
+    def is_complete(self):
+        """Same completion signals as the shell monitor loop"""
+        if read_last_processed(self.progress_file) >= self.idx:
+            return True
+        # Fresh run with a batch file (header + at least one row) = likely complete
+        if self.batch_file.exists() and not (self.url_log.exists() and self.url_log.stat().st_size > 0):
+            with open(self.batch_file, 'r', encoding='utf-8', errors='replace') as f:
+                if sum(1 for _ in f) > 1:
+                    return True
+        return False
+
+    def run(self):
+        """Launch the agent and wait for completion, exit or timeout. Returns True on success"""
+        self.prepare()
+        cmd = self.agent_cmd.format(prompt_file=self.prompt_file, workdir=self.workdir, idx=self.idx)
+
+        # Set by file events and by the agent exiting
+        wake = threading.Event()
+        watched = [self.batch_file, self.progress_file]
+        event_driven = self.watcher is not None and self.watcher.observer is not None
+        if event_driven:
+            self.watcher.register(watched, wake)
+
+        try:
+            with open(self.agent_log, 'a') as log:
+                proc = subprocess.Popen(cmd, shell=True, stdout=log, stderr=subprocess.STDOUT)
+                threading.Thread(target=lambda: (proc.wait(), wake.set()), daemon=True).start()
+                deadline = time.monotonic() + self.max_seconds
+                success = False
+
+                while True:
+                    wake.clear()
+                    if self.is_complete():
+                        success = True
+                        break
+                    if proc.poll() is not None:
+                        # Agent exited - last look at its output files
+                        success = self.is_complete()
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    wake.wait(remaining if event_driven else min(remaining, POLL_SECONDS))
+
+                if proc.poll() is None:
+                    proc.kill()
+                    proc.wait()
+        finally:
+            if event_driven:
+                self.watcher.unregister(watched)
+
+        if success:
+            self.finish()
+        return success
+
+    def finish(self):
+        """Move the URL log to permanent storage (mirrors the shell script)"""
+        self.perm_url_log = self.url_log_dir / f"uni_{self.idx:03d}_urls.txt"
+        if self.url_log.exists():
+            shutil.move(str(self.url_log), self.perm_url_log)
+        else:
+            with open(self.perm_url_log, 'w') as f:
+                f.write("No URL tracking from this run - completed in single session\n")
+
+def worker(slot, scheduler, agent_cmd, max_wait_minutes, watcher=None, make_job=ScrapeJob):
+    name = f"slot{slot}-{os.getpid()}"  # distinct from another orchestrator's slot
+    while True:
+        idx, uni = scheduler.next_job(name)
+        if idx is None:
+            return
+
+        job = make_job(idx, uni, agent_cmd, max_wait_minutes, watcher)
+        resuming = job.url_log.exists() and job.url_log.stat().st_size > 0
+        log_message(f"[slot {slot}] {'RESUMING' if resuming else 'Starting'} #{idx}: {uni['University Name']}")
+
+        try:
+            success = job.run()
+        except Exception as e:
+            log_message(f"[slot {slot}] Error running #{idx}: {e}")
+            success = False
+
+        if success:
+            if scheduler.mark_done(idx, str(job.batch_file), str(job.perm_url_log), name):
+                log_message(f"[slot {slot}] Done #{idx} (progress: {scheduler.status()})")
+            else:
+                log_message(f"[slot {slot}] Finished #{idx} after its lease expired - another worker has it now")
+            continue
+        state = scheduler.mark_failed(idx, name)
+        if state == 'pending':
+            log_message(f"[slot {slot}] No result for #{idx} - requeued for resume")
+        elif state == 'failed':
+            log_message(f"[slot {slot}] Giving up on #{idx} after {scheduler.max_attempts} attempts")
+        else:
+            log_message(f"[slot {slot}] No result for #{idx}, and its lease expired - another worker has it now")
+
+def run_parallel(workers=DEFAULT_WORKERS, agent_cmd=DEFAULT_AGENT_CMD, max_wait_minutes=MAX_WAIT_MINUTES,
+                 pass_name=SCRAPE_PASS, make_job=ScrapeJob):
+    global _log_file
+
+    for directory in (LOG_DIR, make_job.batch_dir, make_job.url_log_dir, make_job.tmp_dir, make_job.jobs_dir):
+        directory.mkdir(parents=True, exist_ok=True)
+    _log_file = LOG_DIR / f"parallel_scraper_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+
+    scheduler = UniversityScheduler(pass_name=pass_name)
+    watcher = CompletionWatcher(make_job.batch_dir)
+    watcher.start()
+    log_message(f"Starting PARALLEL scraping with {workers} workers")
+    log_message(f"Log file: {_log_file}")
+    log_message(f"Progress: {scheduler.status()} universities")
+    log_message(f"Completion detection: {'file events' if watcher.observer else 'polling'}")
+    log_message("=" * 50)
+
+    threads = [
+        threading.Thread(target=worker, args=(slot, scheduler, agent_cmd, max_wait_minutes, watcher, make_job),
+                         daemon=True)
+        for slot in range(1, workers + 1)
+    ]
+    for t in threads:
+        t.start()
+    try:
+        for t in threads:
+            t.join()
+    except KeyboardInterrupt:
+        log_message("\nInterrupted - running jobs will resume from their URL logs next time")
+        return
+    finally:
+        watcher.stop()
+
+    log_message("")
+    log_message("=" * 50)
+    log_message("SCRAPING COMPLETE!")
+    log_message(f"Batch files in: {make_job.batch_dir}")
+    log_message(f"Check logs in: {LOG_DIR}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scrape several universities at once")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help="number of agent slots")
+    parser.add_argument('--agent-cmd', default=DEFAULT_AGENT_CMD,
+                        help="shell command that runs one agent ({prompt_file}, {workdir}, {idx})")
+    parser.add_argument('--timeout', type=int, default=MAX_WAIT_MINUTES, help="minutes per university")
+    parser.add_argument('--instruments',
+                        help="comma-separated instruments to find in a single crawl (see multi_instrument.py)")
+    args = parser.parse_args()
+
+    if args.instruments:
+        from multi_instrument import run_multi
+        run_multi(args.instruments.split(','), args.workers, args.agent_cmd, args.timeout)
+    else:
+        run_parallel(args.workers, args.agent_cmd, args.timeout)
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+SQLite-backed progress store - replaces progress_tracker.txt and email_finder_progress.txt
+
+One row per university per pass ('scrape' for the first pass, 'email_pass2'
+for the email finder, 'multi_scrape' for multi-instrument crawls) holding its state, attempts, timings and output paths.
+Jobs are claimed with an atomic update, so several workers (or a restarted
+script) never pick up the same university twice.
+
+States: pending -> running -> done, or back to pending on failure until
+max_attempts is reached (then failed). A running job whose lease has
+expired is reclaimed the same way, so a university that keeps crashing its
+worker also ends up failed. Rows without a URL are skipped.
+
+A job reports back under the worker that claimed it. Once its lease has
+expired and another worker has reclaimed it, a late done/fail from the
+first worker is ignored.
+
+Each pass remembers the size/mtime of the CSV it was seeded from. When the
+CSV is regenerated (universities_missing_emails.csv after a merge), the
+jobs are reconciled with the new list on the next claim.
+
+Usage:
+  python3 progress_store.py claim <pass> [worker]     # prints claimed index, nothing if all finished
+  python3 progress_store.py done <pass> <idx> <worker> [batch_file] [url_log]
+  python3 progress_store.py fail <pass> <idx> <worker>
+  python3 progress_store.py status [pass]
+"""
+
+import os
+import socket
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+
+from university_catalog import load_catalog, normalize_name
+
+DB_FILE = Path("progress.db")
+
+SCRAPE_PASS = "scrape"
+EMAIL_PASS = "email_pass2"
+MULTI_PASS = "multi_scrape"   # one crawl per university for several instruments
+
+# Source list and legacy progress file for each pass
+PASS_SOURCES = {
+    SCRAPE_PASS: (Path("music_schools_wikipedia.csv"), Path("progress_tracker.txt")),
+    EMAIL_PASS: (Path("universities_missing_emails.csv"), Path("email_finder_progress.txt")),
+    MULTI_PASS: (Path("music_schools_wikipedia.csv"), None),
+}
+
+MAX_ATTEMPTS = 3
+LEASE_SECONDS = 15 * 60  # running jobs older than this are assumed dead and reclaimable
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    pass_name   TEXT    NOT NULL,
+    idx         INTEGER NOT NULL,
+    university  TEXT    NOT NULL,
+    url         TEXT,
+    state       TEXT    NOT NULL DEFAULT 'pending',
+    attempts    INTEGER NOT NULL DEFAULT 0,
+    worker      TEXT,
+    claimed_at  REAL,
+    finished_at REAL,
+    batch_file  TEXT,
+    url_log     TEXT,
+    PRIMARY KEY (pass_name, idx)
+);
+CREATE TABLE IF NOT EXISTS sources (
+    pass_name   TEXT PRIMARY KEY,
+    source      TEXT NOT NULL,
+    stamp       TEXT NOT NULL
+);
+"""
+
+# Job columns a university keeps when its row moves in a regenerated source list
+CARRIED_COLUMNS = ('state', 'attempts', 'worker', 'claimed_at', 'finished_at', 'batch_file', 'url_log')
+
+def default_worker():
+    """Name for a claim made without one - unique to this host, process and thread"""
+    return f"{socket.gethostname()}-{os.getpid()}-{threading.get_ident()}"
+
+def read_last_processed(progress_file):
+    """LAST_PROCESSED from a KEY=VALUE progress file, 0 if missing or corrupt"""
+    try:
+        with open(progress_file, 'r') as f:
+            for line in f:
+                if line.startswith('LAST_PROCESSED='):
+                    return int(line.split('=')[1].strip())
+    except (OSError, ValueError):
+        pass
+    return 0
+
+class ProgressStore:
+    def __init__(self, db_file=DB_FILE, max_attempts=MAX_ATTEMPTS, lease_seconds=LEASE_SECONDS):
+        self.db_file = db_file
+        self.max_attempts = max_attempts
+        self.lease_seconds = lease_seconds
+        self._seeded = {}   # pass -> source stamp the jobs were last checked against
+        with closing(self._connect()) as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        # One short-lived connection per operation keeps this safe across threads and processes
+        conn = sqlite3.connect(self.db_file, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    @staticmethod
+    def source_stamp(source_file):
+        """Size and mtime of a source list, or None if it is missing"""
+        try:
+            stat = os.stat(source_file)
+        except OSError:
+            return None
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+    def seed(self, pass_name, source_file=None, legacy_progress=None):
+        """Create the job rows for a pass, and reconcile them when its source list changes
+
+        On the first seed, universities at or below the legacy LAST_PROCESSED
+        mark are imported as done so an in-flight run carries over. After
+        that, a changed source stamp reconciles the jobs with the new list
+        (see _reconcile) - once no job is running, since a running job's
+        worker reports back by index.
+        """
+        default_source, default_legacy = PASS_SOURCES.get(pass_name, (None, None))
+        source_file = source_file or default_source
+        legacy_progress = legacy_progress or default_legacy
+        stamp = self.source_stamp(source_file)
+        if pass_name in self._seeded and self._seeded[pass_name] == stamp:
+            return
+
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            has_jobs = conn.execute("SELECT 1 FROM jobs WHERE pass_name = ? LIMIT 1", (pass_name,)).fetchone()
+            stored = conn.execute("SELECT stamp FROM sources WHERE pass_name = ?", (pass_name,)).fetchone()
+
+            if stamp is None:
+                conn.execute("COMMIT")
+                if not has_jobs:
+                    raise FileNotFoundError(f"{source_file} not found - cannot create the '{pass_name}' jobs")
+                # Source removed after seeding - carry on with the jobs we have
+                self._seeded[pass_name] = stamp
+                return
+
+            if has_jobs and stored and stored['stamp'] == stamp:
+                conn.execute("COMMIT")
+                self._seeded[pass_name] = stamp
+                return
+
+            if has_jobs and conn.execute(
+                    "SELECT 1 FROM jobs WHERE pass_name = ? AND state = 'running' AND claimed_at >= ? LIMIT 1",
+                    (pass_name, time.time() - self.lease_seconds)).fetchone():
+                conn.execute("COMMIT")
+                return  # try again on the next claim
+
+            rows = load_catalog(source_file).rows
+            if has_jobs:
+                self._reconcile(conn, pass_name, rows)
+            else:
+                last_processed = read_last_processed(legacy_progress) if legacy_progress else 0
+                for i, row in enumerate(rows, start=1):
+                    conn.execute(
+                        "INSERT INTO jobs (pass_name, idx, university, url, state) VALUES (?, ?, ?, ?, ?)",
+                        (pass_name, i, row.get('University Name', ''), self._url(row),
+                         self._initial_state(pass_name, row, 'done' if i <= last_processed else 'pending')))
+            conn.execute("INSERT OR REPLACE INTO sources (pass_name, source, stamp) VALUES (?, ?, ?)",
+                         (pass_name, str(source_file), stamp))
+            conn.execute("COMMIT")
+            self._seeded[pass_name] = stamp
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _url(row):
+        return (row.get('URL') or '').strip()
+
+    def _initial_state(self, pass_name, row, state='pending'):
+        if pass_name in (SCRAPE_PASS, MULTI_PASS) and not self._url(row):
+            return 'skipped'
+        return state
+
+    def _reconcile(self, conn, pass_name, rows):
+        """Renumber a pass's jobs to match a regenerated source list
+
+        Universities are matched by name and URL: a match keeps its state,
+        attempts and output paths under its new index, a university new to
+        the list starts pending, and jobs for universities no longer listed
+        are dropped.
+        """
+        previous = {}
+        for job in conn.execute("SELECT * FROM jobs WHERE pass_name = ? ORDER BY idx", (pass_name,)):
+            key = (normalize_name(job['university']), job['url'] or '')
+            previous.setdefault(key, []).append(dict(job))
+
+        conn.execute("DELETE FROM jobs WHERE pass_name = ?", (pass_name,))
+        for i, row in enumerate(rows, start=1):
+            university, url = row.get('University Name', ''), self._url(row)
+            matches = previous.get((normalize_name(university), url))
+            carried = matches.pop(0) if matches else {'state': self._initial_state(pass_name, row), 'attempts': 0}
+            conn.execute(
+                """INSERT INTO jobs (pass_name, idx, university, url, state, attempts, worker,
+                                     claimed_at, finished_at, batch_file, url_log)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (pass_name, i, university, url, *(carried.get(column) for column in CARRIED_COLUMNS)))
+
+    def claim_next(self, pass_name, worker=None):
+        """Atomically claim the lowest pending (or abandoned running) job
+
+        An abandoned job that has already used max_attempts is marked failed
+        instead of being claimed again. Returns the job row as a dict, or
+        None when nothing is left.
+        """
+        self.seed(pass_name)
+        worker = worker or default_worker()
+        now = time.time()
+        expired = now - self.lease_seconds
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                """UPDATE jobs SET state = 'failed', finished_at = ?
+                   WHERE pass_name = ? AND state = 'running' AND claimed_at < ? AND attempts >= ?""",
+                (now, pass_name, expired, self.max_attempts))
+            row = conn.execute(
+                """SELECT * FROM jobs
+                   WHERE pass_name = ?
+                     AND (state = 'pending' OR (state = 'running' AND claimed_at < ?))
+                   ORDER BY idx LIMIT 1""",
+                (pass_name, expired)).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            conn.execute(
+                """UPDATE jobs SET state = 'running', attempts = attempts + 1,
+                                   worker = ?, claimed_at = ?, finished_at = NULL
+                   WHERE pass_name = ? AND idx = ?""",
+                (worker, now, pass_name, row['idx']))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+        job = dict(row)
+        job.update(state='running', attempts=row['attempts'] + 1, worker=worker, claimed_at=now)
+        return job
+
+    @staticmethod
+    def _owned_by(worker):
+        """WHERE clause (and its parameters) limiting an update to worker's claim"""
+        if worker is None:
+            return "", ()
+        return " AND state = 'running' AND worker = ?", (worker,)
+
+    def mark_done(self, pass_name, idx, batch_file=None, url_log=None, worker=None):
+        """Mark a job done; with worker, only while that worker still holds the job
+
+        Without worker the job is marked done whatever its state (for jobs
+        finished outside a claim). Returns False if nothing was updated.
+        """
+        owned, owned_params = self._owned_by(worker)
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                """UPDATE jobs SET state = 'done', finished_at = ?,
+                                   batch_file = COALESCE(?, batch_file), url_log = COALESCE(?, url_log)
+                   WHERE pass_name = ? AND idx = ?""" + owned,
+                (time.time(), batch_file, url_log, pass_name, idx, *owned_params))
+        return cursor.rowcount > 0
+
+    def mark_failed(self, pass_name, idx, worker=None):
+        """Put a job back in the queue, or mark it failed after max_attempts
+
+        Returns the job's new state ('pending' or 'failed'), or None if
+        worker no longer holds the job.
+        """
+        owned, owned_params = self._owned_by(worker)
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            cursor = conn.execute(
+                """UPDATE jobs SET state = CASE WHEN attempts < ? THEN 'pending' ELSE 'failed' END,
+                                   finished_at = ?
+                   WHERE pass_name = ? AND idx = ?""" + owned,
+                (self.max_attempts, time.time(), pass_name, idx, *owned_params))
+            row = conn.execute("SELECT state FROM jobs WHERE pass_name = ? AND idx = ?",
+                               (pass_name, idx)).fetchone()
+            conn.execute("COMMIT")
+        return row['state'] if cursor.rowcount else None
+
+    def get_job(self, pass_name, idx):
+        self.seed(pass_name)
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE pass_name = ? AND idx = ?",
+                               (pass_name, idx)).fetchone()
+        return dict(row) if row else None
+
+    def counts(self, pass_name):
+        """Number of jobs in each state for a pass"""
+        self.seed(pass_name)
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT state, COUNT(*) AS n FROM jobs WHERE pass_name = ? GROUP BY state",
+                                (pass_name,)).fetchall()
+        return {row['state']: row['n'] for row in rows}
+
+def print_status(store, pass_names):
+    for pass_name in pass_names:
+        counts = store.counts(pass_name)
+        total = sum(counts.values())
+        finished = counts.get('done', 0) + counts.get('skipped', 0)
+        print(f"{pass_name}: {finished}/{total} finished", end='')
+        for state in ('running', 'pending', 'failed'):
+            if counts.get(state):
+                print(f", {counts[state]} {state}", end='')
+        print()
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+
+    store = ProgressStore()
+    command = sys.argv[1]
+
+    try:
+        if command == 'claim':
+            # Nothing printed (exit 0) means every job is finished; any error exits non-zero
+            job = store.claim_next(sys.argv[2], sys.argv[3] if len(sys.argv) > 3 else None)
+            if job:
+                print(job['idx'])
+        elif command == 'done':
+            if not store.mark_done(sys.argv[2], int(sys.argv[3]),
+                                   sys.argv[5] if len(sys.argv) > 5 else None,
+                                   sys.argv[6] if len(sys.argv) > 6 else None,
+                                   worker=sys.argv[4]):
+                print(f"Job {sys.argv[3]} is no longer held by {sys.argv[4]} - not marked done", file=sys.stderr)
+        elif command == 'fail':
+            if store.mark_failed(sys.argv[2], int(sys.argv[3]), worker=sys.argv[4]) is None:
+                print(f"Job {sys.argv[3]} is no longer held by {sys.argv[4]} - not marked failed", file=sys.stderr)
+        elif command == 'status':
+            print_status(store, sys.argv[2:] or [SCRAPE_PASS])
+        else:
+            print(f"Unknown command: {command}")
+            print(__doc__)
+            sys.exit(1)
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(2)
@@ -1,31 +1,122 @@
 #!/usr/bin/env python3
 """
 Quick email validation focusing on syntax and MX records only
+
+MX lookups run concurrently on asyncio (dnspython's async resolver) with a
+bounded number of queries in flight, a per-query timeout and retries, so
+one slow nameserver no longer stalls the whole run. Answers are cached on
+disk with their TTLs (mx_cache.py), so re-validating a master - or another
+instrument's master with the same domains - skips DNS for known domains.
+
+Usage:
+  python3 quick_email_check.py [master.csv] [--nameserver HOST[:PORT]] [--no-cache]
 """
 
+import asyncio
 import csv
 import re
+import sys
+import dns.asyncresolver
+import dns.exception
 import dns.resolver
 from datetime import datetime
 from collections import defaultdict
 
+from instrument_profile import current_profile
+from mx_cache import MXCache, negative_ttl
+
+COMMON_PROVIDERS = {'gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com',
+                    'aol.com', 'icloud.com', 'me.com', 'mac.com'}
+
+MAX_CONCURRENT_QUERIES = 50
+QUERY_TIMEOUT = 3.0   # seconds per attempt
+QUERY_RETRIES = 2     # extra attempts after a timeout
+
 def validate_syntax(email):
     """Check if email syntax is valid"""
     pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
     return re.match(pattern, email) is not None
 
+def make_resolver(nameservers=None, port=53):
+    """Async resolver using the system config, or explicit nameservers (e.g. a local stub)"""
+    resolver = dns.asyncresolver.Resolver(configure=not nameservers)
+    if nameservers:
+        resolver.nameservers = list(nameservers)
+        resolver.port = port
+    return resolver
+
+async def resolve_mx_async(domain, resolver, semaphore,
+                           timeout=QUERY_TIMEOUT, retries=QUERY_RETRIES):
+    """Look up MX for a domain, retrying only on timeouts
+
+    Returns (has_mx, hosts, ttl), or None if the lookup never got a
+    definitive answer (those are not cached).
+    """
+    async with semaphore:
+        for attempt in range(retries + 1):
+            try:
+                answer = await resolver.resolve(domain, 'MX', lifetime=timeout)
+                return True, [str(mx.exchange) for mx in answer], answer.rrset.ttl
+            except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer) as e:
+                return False, [], negative_ttl(e)  # Definitive answer - no point retrying
+            except dns.resolver.NoNameservers:
+                return None
+            except dns.exception.Timeout:
+                if attempt == retries:
+                    return None
+                await asyncio.sleep(0.2 * (2 ** attempt))
+            except dns.exception.DNSException:
+                return None
+    return None
+
+async def check_mx_records_async(domain, resolver, semaphore,
+                                 timeout=QUERY_TIMEOUT, retries=QUERY_RETRIES):
+    """Check if domain has valid MX records"""
+    result = await resolve_mx_async(domain, resolver, semaphore, timeout, retries)
+    return bool(result and result[0])
+
+async def check_domains_async(domains, resolver=None, max_concurrent=MAX_CONCURRENT_QUERIES,
+                              timeout=QUERY_TIMEOUT, retries=QUERY_RETRIES, cache=None):
+    """Resolve MX for many domains concurrently; returns {domain: bool}
+
+    Domains with a live entry in the MX cache are answered from it and
+    only the rest go to DNS.
+    """
+    domains = [domain.lower() for domain in domains]
+    checked = {domain: has_mx for domain, (has_mx, _) in (cache.get_many(domains) if cache else {}).items()}
+    to_resolve = [domain for domain in domains if domain not in checked]
+    if not to_resolve:
+        return checked
+
+    resolver = resolver or make_resolver()
+    semaphore = asyncio.Semaphore(max_concurrent)
+    results = await asyncio.gather(*(
+        resolve_mx_async(domain, resolver, semaphore, timeout, retries) for domain in to_resolve
+    ))
+    for domain, result in zip(to_resolve, results):
+        checked[domain] = bool(result and result[0])
+    if cache:
+        cache.put_many([(domain, *result) for domain, result in zip(to_resolve, results) if result])
+    return checked
+
+def check_domains(domains, nameservers=None, port=53, use_cache=True, **kwargs):
+    """Synchronous entry point for check_domains_async"""
+    cache = MXCache() if use_cache else None
+    async def run():
+        return await check_domains_async(domains, make_resolver(nameservers, port), cache=cache, **kwargs)
+    return asyncio.run(run())
+
 def check_mx_records(domain):
     """Check if domain has valid MX records"""
-    try:
-        mx_records = dns.resolver.resolve(domain, 'MX')
-        return True
-    except:
-        return False
-
-def quick_validate():
-    """Quick validation of emails"""
+    return check_domains([domain])[domain.lower()]
+
+def quick_validate(master_file=None, nameservers=None, port=53, use_cache=True):
+    """Quick validation of emails (defaults to the newest FINAL master for this instrument)"""
     
-    master_file = "trombone_faculty_master_FINAL_20250811.csv"
+    master_file = master_file or current_profile().latest_master(final=True)
+    if not master_file:
+        print(f"No {current_profile().master_prefix}FINAL_*.csv found - run merge_pass2_with_master.py first")
+        return [], []
     
     print("Reading master file...")
     emails = []
@@ -43,8 +134,15 @@ def quick_validate():
     
     print(f"Checking {len(emails)} emails...")
     
-    # Group by domain for efficiency
-    domains_checked = {}
+    # Collect unique domains first so every MX lookup runs once, concurrently
+    domains_to_check = {
+        item['email'].split('@')[1].lower() for item in emails if validate_syntax(item['email'])
+    } - COMMON_PROVIDERS
+    print(f"Resolving MX records for {len(domains_to_check)} domains...")
+    domains_checked = check_domains(domains_to_check, nameservers, port, use_cache)
+    # Common providers are always valid
+    domains_checked.update({domain: True for domain in COMMON_PROVIDERS})
+    
     results = []
     
     for item in emails:
@@ -55,17 +153,7 @@ def quick_validate():
             results.append({**item, 'status': 'invalid_syntax'})
             continue
         
-        domain = email.split('@')[1]
-        
-        # Check if we already validated this domain
-        if domain not in domains_checked:
-            # Common providers are always valid
-            if domain in ['gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com', 
-                         'aol.com', 'icloud.com', 'me.com', 'mac.com']:
-                domains_checked[domain] = True
-            else:
-                # Check MX records
-                domains_checked[domain] = check_mx_records(domain)
+        domain = email.split('@')[1].lower()
         
         if domains_checked[domain]:
             results.append({**item, 'status': 'valid'})
@@ -112,5 +200,23 @@ def quick_validate():
     
     return valid, invalid
 
+def parse_nameserver(value):
+    host, _, port = value.partition(':')
+    return host, int(port) if port else 53
+
 if __name__ == "__main__":
-    quick_validate()
\ No newline at end of file
+    args = sys.argv[1:]
+    nameservers, port = None, 53
+    use_cache = '--no-cache' not in args
+    if not use_cache:
+        args.remove('--no-cache')
+    if '--nameserver' in args:
+        i = args.index('--nameserver')
+        host, port = parse_nameserver(args[i + 1])
+        nameservers = [host]
+        del args[i:i + 2]
+    
+    if args:
+        quick_validate(args[0], nameservers, port, use_cache)
+    else:
+        quick_validate(nameservers=nameservers, port=port, use_cache=use_cache)
\ No newline at end of file
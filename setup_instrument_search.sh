@@ -13,7 +13,6 @@ fi
 
 INSTRUMENT="$1"
 INSTRUMENT_LOWER=$(echo "$INSTRUMENT" | tr '[:upper:]' '[:lower:]')
-INSTRUMENT_UPPER=$(echo "$INSTRUMENT" | tr '[:lower:]' '[:upper:]')
 INSTRUMENT_TITLE=$(echo "$INSTRUMENT" | awk '{print toupper(substr($0,1,1)) tolower(substr($0,2))}')
 
 FOLDER_NAME="${INSTRUMENT_LOWER}-faculty"
@@ -24,17 +23,24 @@ echo "Creating folder: $FOLDER_NAME"
 # Create the instrument folder
 mkdir -p "$FOLDER_NAME"
 
-# Copy necessary scripts (they already use relative paths now)
-echo "Copying scripts..."
-cp smart_automated_scraper_v2.sh "$FOLDER_NAME/"
-cp generate_simple_resumable_prompt.py "$FOLDER_NAME/"
-cp smart_email_finder.sh "$FOLDER_NAME/"
-cp generate_email_finder_prompt.py "$FOLDER_NAME/"
-cp merge_with_urls.py "$FOLDER_NAME/"
-cp merge_pass2_with_master.py "$FOLDER_NAME/"
-cp quick_email_check.py "$FOLDER_NAME/"
-cp identify_missing_emails.py "$FOLDER_NAME/" 2>/dev/null
-cp music_schools_wikipedia.csv "$FOLDER_NAME/"
+# Scripts are shared - they read the instrument profile from instruments.toml
+# and are run from inside the instrument folder, so nothing is copied or rewritten
+SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
+if ! grep -q "^\[${INSTRUMENT_LOWER}\]" "$SCRIPT_DIR/instruments.toml" 2>/dev/null; then
+    echo "Adding $INSTRUMENT_TITLE profile to instruments.toml (edit it to add aliases)..."
+    cat >> "$SCRIPT_DIR/instruments.toml" <<EOF
+
+[${INSTRUMENT_LOWER}]
+title = "${INSTRUMENT_TITLE}"
+keywords = ["${INSTRUMENT_LOWER}"]
+aliases = []
+search_phrase = "${INSTRUMENT_LOWER} faculty"
+output_name = "${INSTRUMENT_LOWER}_faculty"
+EOF
+fi
+
+# Input data for this folder's runs
+cp "$SCRIPT_DIR/music_schools_wikipedia.csv" "$FOLDER_NAME/"
 
 cd "$FOLDER_NAME"
 
@@ -50,24 +56,6 @@ mkdir -p debug_screenshots
 echo "LAST_PROCESSED=0" > progress_tracker.txt
 echo "TOTAL_UNIVERSITIES=202" >> progress_tracker.txt
 
-echo "Updating scripts for $INSTRUMENT_TITLE faculty..."
-
-# Update all Python and shell scripts using the variables we already have
-for file in *.py *.sh; do
-    if [ -f "$file" ]; then
-        # Single sed command with multiple replacements using our variables
-        sed -i '' \
-            -e "s/trombone faculty/${INSTRUMENT_LOWER} faculty/g" \
-            -e "s/\btrombone\b/${INSTRUMENT_LOWER}/g" \
-            -e "s/\bTrombone\b/${INSTRUMENT_TITLE}/g" \
-            -e "s/\bTROMBONE\b/${INSTRUMENT_UPPER}/g" \
-            -e "s/SEARCH FOR TROMBONE:/SEARCH FOR ${INSTRUMENT_UPPER}:/g" \
-            -e "s/no_trombone_found/no_${INSTRUMENT_LOWER}_found/g" \
-            -e "s/trombone_faculty_master/${INSTRUMENT_LOWER}_faculty_master/g" \
-            "$file"
-    fi
-done
-
 echo ""
 echo "=================================================="
 echo "Setup complete for $INSTRUMENT_TITLE faculty search!"
@@ -77,11 +65,14 @@ echo "Folder created: $FOLDER_NAME/"
 echo ""
 echo "To start searching for $INSTRUMENT_LOWER faculty:"
 echo "  cd $FOLDER_NAME"
-echo "  ./smart_automated_scraper_v2.sh"
+echo "  ../smart_automated_scraper_v2.sh"
+echo ""
+echo "Or run several universities at once:"
+echo "  python3 ../parallel_scraper.py --workers 4"
 echo ""
 echo "For second pass (finding missing emails):"
-echo "  1. After first pass, run: python3 identify_missing_emails.py"
-echo "  2. Then run: ./smart_email_finder.sh"
+echo "  1. After first pass, run: python3 ../merge_with_urls.py && python3 ../identify_missing_emails.py"
+echo "  2. Then run: ../smart_email_finder.sh"
 echo ""
 echo "Note: Different instruments have varying numbers of faculty."
 echo "Piano/violin typically have many (10-20+), while instruments"
@@ -1,5 +1,10 @@
 #!/bin/bash
 # Smart automated scraping V2 - with better resume logic
+# Run from an instrument folder: cd piano-faculty && ../smart_automated_scraper_v2.sh
+
+# Scripts live next to this file; data stays in the current folder
+SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
+INSTRUMENT_LOWER=$(python3 "$SCRIPT_DIR/instrument_profile.py" name)
 
 # Setup logging
 LOG_DIR="logs"
@@ -15,14 +20,18 @@ log_message() {
     echo "$1" | tee -a "$LOG_FILE"
 }
 
-log_message "Starting SMART AUTOMATED trombone faculty scraping V2"
+log_message "Starting SMART AUTOMATED $INSTRUMENT_LOWER faculty scraping V2"
 log_message "Log file: $LOG_FILE"
 log_message "=================================================="
 
 # Configuration
 MAX_WAIT_MINUTES=3   # 3 minutes for one university
 
-# Progress tracker should already exist from setup_instrument_search.sh
+# Progress is kept in progress.db (see progress_store.py). The agent still
+# writes progress_tracker.txt when it finishes - that is our completion signal.
+# Jobs are claimed as WORKER; a late done/fail after another worker has
+# reclaimed the job is ignored.
+WORKER="$(hostname)-$$"
 if [ ! -f progress_tracker.txt ]; then
     log_message "ERROR: progress_tracker.txt not found. Run setup script first."
     exit 1
@@ -42,39 +51,20 @@ kill_claude() {
 }
 
 while true; do
-    # Fix corrupted progress_tracker.txt if needed
-    if ! grep -q "^TOTAL_UNIVERSITIES=" progress_tracker.txt; then
-        log_message "WARNING: progress_tracker.txt appears corrupted, attempting to fix..."
-        LAST_VAL=$(grep -o "LAST_PROCESSED=[0-9]*" progress_tracker.txt | cut -d'=' -f2)
-        if [ -n "$LAST_VAL" ]; then
-            echo "LAST_PROCESSED=$LAST_VAL" > progress_tracker.txt
-            echo "TOTAL_UNIVERSITIES=202" >> progress_tracker.txt
-            log_message "Fixed progress_tracker.txt with LAST_PROCESSED=$LAST_VAL"
-        else
-            log_message "ERROR: Could not recover progress, resetting to 0"
-            echo "LAST_PROCESSED=0" > progress_tracker.txt
-            echo "TOTAL_UNIVERSITIES=202" >> progress_tracker.txt
-        fi
-    fi
-    
-    # Read current progress
-    LAST=$(grep "^LAST_PROCESSED=" progress_tracker.txt | cut -d'=' -f2 | tr -d ' ')
-    TOTAL=$(grep "^TOTAL_UNIVERSITIES=" progress_tracker.txt | cut -d'=' -f2 | tr -d ' ')
-    
-    # Default TOTAL if not found
-    if [ -z "$TOTAL" ]; then
-        TOTAL=202
-        echo "TOTAL_UNIVERSITIES=202" >> progress_tracker.txt
+    # Atomically claim the next university
+    # Empty output with exit 0 means everything is finished; a failed claim must not look like that
+    if ! NEXT_START=$(python3 "$SCRIPT_DIR/progress_store.py" claim scrape "$WORKER"); then
+        log_message "ERROR: could not claim the next university (progress_store.py failed). Stopping."
+        exit 1
     fi
-    
-    if [ "$LAST" -ge "$TOTAL" ]; then
+    if [ -z "$NEXT_START" ]; then
         log_message "All universities processed!"
         break
     fi
     
     log_message ""
     log_message "=========================================="
-    log_message "Progress: $LAST / $TOTAL universities"
+    log_message "Progress: $(python3 "$SCRIPT_DIR/progress_store.py" status scrape)"
     log_message "=========================================="
     
     # Kill Claude if running
@@ -83,8 +73,11 @@ while true; do
         kill_claude
     fi
     
-    # Determine which university to process
-    NEXT_START=$((LAST + 1))
+    # Reset the agent's completion signal for this university
+    echo "LAST_PROCESSED=$((NEXT_START - 1))" > progress_tracker.txt
+    echo "TOTAL_UNIVERSITIES=202" >> progress_tracker.txt
+    
+    # Paths for the claimed university
     BATCH_FILE="results/batches/uni_$(printf '%03d' $NEXT_START).csv"
     URL_LOG="tmp/uni_$(printf '%03d' $NEXT_START)_urls.txt"
     
@@ -100,7 +93,7 @@ while true; do
     log_message "Will monitor for: $BATCH_FILE"
     
     # Generate prompt
-    python3 generate_simple_resumable_prompt.py
+    python3 "$SCRIPT_DIR/generate_simple_resumable_prompt.py" "$NEXT_START"
     
     # Save prompt to logs
     cp current_prompt.txt "$LOG_DIR/prompt_batch_${NEXT_START}.txt"
@@ -225,7 +218,7 @@ except Exception as e:
         CURRENT_PROGRESS=$(grep "^LAST_PROCESSED=" progress_tracker.txt | cut -d'=' -f2 | tr -d ' ')
         
         # Validate that CURRENT_PROGRESS is a number
-        if [[ "$CURRENT_PROGRESS" =~ ^[0-9]+$ ]] && [ "$CURRENT_PROGRESS" -gt "$LAST" ]; then
+        if [[ "$CURRENT_PROGRESS" =~ ^[0-9]+$ ]] && [ "$CURRENT_PROGRESS" -ge "$NEXT_START" ]; then
             log_message "SUCCESS: Progress updated to $CURRENT_PROGRESS"
             SUCCESS=1
             break
@@ -243,8 +236,6 @@ except Exception as e:
                     # Fresh run with batch file = likely complete
                     log_message "Fresh run completed with batch file"
                     SUCCESS=1
-                    # Update progress manually
-                    sed -i '' "s/LAST_PROCESSED=.*/LAST_PROCESSED=$NEXT_START/" progress_tracker.txt
                     break
                 fi
             fi
@@ -286,6 +277,13 @@ except Exception as e:
         echo "No URL tracking from this run - completed in single session" > "$PERM_URL_LOG"
     fi
     
+    # Record the outcome in the progress store
+    if [ $SUCCESS -eq 1 ]; then
+        python3 "$SCRIPT_DIR/progress_store.py" done scrape "$NEXT_START" "$WORKER" "$BATCH_FILE" "$PERM_URL_LOG"
+    else
+        python3 "$SCRIPT_DIR/progress_store.py" fail scrape "$NEXT_START" "$WORKER"
+    fi
+    
     log_message "Waiting 2 seconds before next batch..."
     sleep 2
 done
@@ -1,5 +1,9 @@
 #!/bin/bash
 # Smart Email Finder - Second pass focusing on missing emails
+# Run from an instrument folder: cd piano-faculty && ../smart_email_finder.sh
+
+# Scripts live next to this file; data stays in the current folder
+SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
 
 # Setup logging
 LOG_DIR="logs"
@@ -25,13 +29,12 @@ log_message "=================================================="
 # Configuration
 MAX_WAIT_MINUTES=5   # More time for deeper searching
 
-# Initialize email finder progress tracker
-if [ ! -f email_finder_progress.txt ]; then
-    echo "LAST_PROCESSED=0" > email_finder_progress.txt
-    # Count lines in universities_missing_emails.csv minus header
-    TOTAL=$(tail -n +2 universities_missing_emails.csv | wc -l | tr -d ' ')
-    echo "TOTAL_UNIVERSITIES=$TOTAL" >> email_finder_progress.txt
-fi
+# Progress is kept in progress.db (see progress_store.py). The agent still
+# writes email_finder_progress.txt when it finishes - that is our completion signal.
+# Jobs are claimed as WORKER; a late done/fail after another worker has
+# reclaimed the job is ignored.
+WORKER="$(hostname)-$$"
+TOTAL=$(tail -n +2 universities_missing_emails.csv | wc -l | tr -d ' ')
 
 # Function to kill Claude Desktop
 kill_claude() {
@@ -47,18 +50,20 @@ kill_claude() {
 }
 
 while true; do
-    # Read current progress
-    LAST=$(grep LAST_PROCESSED email_finder_progress.txt | cut -d'=' -f2 | tr -d ' ')
-    TOTAL=$(grep TOTAL_UNIVERSITIES email_finder_progress.txt | cut -d'=' -f2 | tr -d ' ')
-    
-    if [ "$LAST" -ge "$TOTAL" ]; then
+    # Atomically claim the next university
+    # Empty output with exit 0 means everything is finished; a failed claim must not look like that
+    if ! NEXT_START=$(python3 "$SCRIPT_DIR/progress_store.py" claim email_pass2 "$WORKER"); then
+        log_message "ERROR: could not claim the next university (progress_store.py failed). Stopping."
+        exit 1
+    fi
+    if [ -z "$NEXT_START" ]; then
         log_message "All universities processed for missing emails!"
         break
     fi
     
     log_message ""
     log_message "=========================================="
-    log_message "Email Finder Progress: $LAST / $TOTAL universities"
+    log_message "Email Finder Progress: $(python3 "$SCRIPT_DIR/progress_store.py" status email_pass2)"
     log_message "=========================================="
     
     # Kill Claude if running
@@ -67,15 +72,18 @@ while true; do
         kill_claude
     fi
     
-    # Determine which university to process
-    NEXT_START=$((LAST + 1))
+    # Reset the agent's completion signal for this university
+    echo "LAST_PROCESSED=$((NEXT_START - 1))" > email_finder_progress.txt
+    echo "TOTAL_UNIVERSITIES=$TOTAL" >> email_finder_progress.txt
+    
+    # Paths for the claimed university
     BATCH_FILE="results/batches/email_pass2_$(printf '%03d' $NEXT_START).csv"
     URL_LOG="tmp/email_pass2_$(printf '%03d' $NEXT_START)_urls.txt"
     
     log_message "Will create: $BATCH_FILE"
     
     # Generate prompt for finding missing emails
-    python3 generate_email_finder_prompt.py
+    python3 "$SCRIPT_DIR/generate_email_finder_prompt.py" "$NEXT_START"
     
     # Save prompt to logs
     cp current_prompt.txt "$LOG_DIR/email_prompt_${NEXT_START}.txt"
@@ -139,7 +147,7 @@ while true; do
         # Check progress update
         CURRENT_PROGRESS=$(grep LAST_PROCESSED email_finder_progress.txt | cut -d'=' -f2 | tr -d ' ')
         
-        if [ "$CURRENT_PROGRESS" -gt "$LAST" ]; then
+        if [[ "$CURRENT_PROGRESS" =~ ^[0-9]+$ ]] && [ "$CURRENT_PROGRESS" -ge "$NEXT_START" ]; then
             log_message "SUCCESS: Progress updated to $CURRENT_PROGRESS"
             SUCCESS=1
             break
@@ -151,8 +159,6 @@ while true; do
             if [ $LINES -gt 0 ]; then
                 log_message "Batch file created with $LINES lines"
                 SUCCESS=1
-                # Update progress
-                sed -i '' "s/LAST_PROCESSED=.*/LAST_PROCESSED=$NEXT_START/" email_finder_progress.txt
                 break
             fi
         fi
@@ -174,12 +180,19 @@ while true; do
     kill_claude
     
     # Move URL log if exists
+    PERM_URL_LOG="$URL_LOG_DIR/email_pass2_$(printf '%03d' $NEXT_START)_urls.txt"
     if [ -f "$URL_LOG" ]; then
-        PERM_URL_LOG="$URL_LOG_DIR/email_pass2_$(printf '%03d' $NEXT_START)_urls.txt"
         mv "$URL_LOG" "$PERM_URL_LOG"
         log_message "URL log moved to: $PERM_URL_LOG"
     fi
     
+    # Record the outcome in the progress store
+    if [ $SUCCESS -eq 1 ]; then
+        python3 "$SCRIPT_DIR/progress_store.py" done email_pass2 "$NEXT_START" "$WORKER" "$BATCH_FILE" "$PERM_URL_LOG"
+    else
+        python3 "$SCRIPT_DIR/progress_store.py" fail email_pass2 "$NEXT_START" "$WORKER"
+    fi
+    
     log_message "Waiting 2 seconds before next university..."
     sleep 2
 done
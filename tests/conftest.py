@@ -0,0 +1,8 @@
+import sys
+from pathlib import Path
+
+# The scripts import their siblings directly, as they do when run from their folder
+ROOT = Path(__file__).resolve().parent.parent
+for folder in (ROOT, ROOT / "old"):
+    if str(folder) not in sys.path:
+        sys.path.insert(0, str(folder))
@@ -0,0 +1,190 @@
+"""BrowserPool and the search waits, with scripted stand-in browsers
+
+The end-to-end test at the bottom needs a local Chrome and is skipped
+without one.
+"""
+
+import http.server
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("selenium")
+from selenium.common.exceptions import StaleElementReferenceException, WebDriverException  # noqa: E402
+
+import browser_pool  # noqa: E402
+from browser_pool import BrowserPool, wait_for_results  # noqa: E402
+
+
+class StubDriver:
+    def __init__(self):
+        self.crashed = False
+        self.quit_called = False
+
+    def delete_all_cookies(self):
+        if self.crashed:
+            raise WebDriverException("chrome not reachable")
+
+    def get(self, url):
+        pass
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_pool_bounds_browsers_and_reuses_them():
+    started = []
+    pool = BrowserPool(3, make_driver=lambda: started.append(StubDriver()) or started[-1])
+    lock, active, peak = threading.Lock(), [0], [0]
+
+    def job():
+        with pool.browser():
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+
+    threads = [threading.Thread(target=job) for _ in range(12)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert peak[0] == 3
+    assert len(started) == 3
+
+    pool.close()
+    assert all(driver.quit_called for driver in started)
+
+
+def test_crashed_browser_is_replaced():
+    started = []
+    pool = BrowserPool(1, make_driver=lambda: started.append(StubDriver()) or started[-1])
+    with pool.browser() as driver:
+        driver.crashed = True
+    assert driver.quit_called
+    with pool.browser() as replacement:
+        assert replacement is not driver
+    assert len(started) == 2
+
+
+class ScriptedPage:
+    """Stand-in driver whose page changes at fixed times after the search is submitted
+
+    echo_at:     the term appears in the page (autocomplete / echoed query)
+    results_at:  the results container gets results (in-place search)
+    navigate_at: the document is replaced (search box goes stale), loading until ready_at
+    url_at:      the URL changes without navigating (history.pushState)
+    """
+
+    def __init__(self, echo_at=None, results_at=None, navigate_at=None, ready_at=None, url_at=None):
+        self.start = time.monotonic()
+        self.echo_at, self.results_at, self.url_at = echo_at, results_at, url_at
+        self.navigate_at, self.ready_at = navigate_at, ready_at
+        self.search_box = ScriptedElement(self)
+
+    def elapsed(self, at):
+        return at is not None and time.monotonic() - self.start >= at
+
+    @property
+    def page_source(self):
+        return "<ul class='autocomplete'><li>trombone</li></ul>" if self.elapsed(self.echo_at) else ""
+
+    @property
+    def current_url(self):
+        navigated = self.elapsed(self.url_at) or self.elapsed(self.navigate_at)
+        return "https://music.example.edu/search?q=trombone" if navigated else "https://music.example.edu/"
+
+    def execute_script(self, script, *args):
+        if "readyState" in script:
+            return "complete" if self.ready_at is None or self.elapsed(self.ready_at) else "loading"
+        return "Jane Doe, trombone" if self.elapsed(self.results_at) else ""
+
+
+class ScriptedElement:
+    def __init__(self, page):
+        self.page = page
+
+    def is_enabled(self):
+        if self.page.elapsed(self.page.navigate_at):
+            raise StaleElementReferenceException("element is not attached to the page document")
+        return True
+
+
+def timed_wait(page, timeout=2):
+    start = time.monotonic()
+    arrived = wait_for_results(page, "https://music.example.edu/", page.search_box, "", timeout=timeout)
+    return arrived, time.monotonic() - start
+
+
+def test_echoed_term_is_not_results():
+    arrived, elapsed = timed_wait(ScriptedPage(echo_at=0, results_at=0.4))
+    assert arrived and elapsed >= 0.4
+
+
+def test_navigation_waits_for_the_new_document():
+    arrived, elapsed = timed_wait(ScriptedPage(echo_at=0, navigate_at=0.2, ready_at=0.5))
+    assert arrived and elapsed >= 0.5
+
+
+def test_url_change_alone_waits_for_results(monkeypatch):
+    monkeypatch.setattr(browser_pool, "ELEMENT_TIMEOUT", 2)
+    arrived, elapsed = timed_wait(ScriptedPage(url_at=0.1, results_at=0.5))
+    assert arrived and elapsed >= 0.5
+
+
+def test_no_results_times_out():
+    arrived, elapsed = timed_wait(ScriptedPage(echo_at=0), timeout=0.5)
+    assert not arrived and elapsed >= 0.5
+
+
+SEARCH_PAGE = b"""<!doctype html>
+<html><body>
+<button class="search-toggle" aria-label="Search">Search</button>
+<form role="search" style="display:none"><input type="search" name="q"></form>
+<ul class="autocomplete"></ul>
+<div id="search-results"></div>
+<script>
+const form = document.querySelector('form'), box = form.querySelector('input');
+document.querySelector('.search-toggle').onclick = () => setTimeout(() => form.style.display = 'block', 300);
+box.oninput = () => document.querySelector('.autocomplete').innerHTML = '<li>' + box.value + ' faculty</li>';
+form.onsubmit = e => {
+    e.preventDefault();
+    setTimeout(() => document.getElementById('search-results').innerHTML =
+        '<p>Jane Doe, Professor of Trombone</p>', 1000);
+};
+</script>
+</body></html>"""
+
+
+class SearchPageHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.end_headers()
+        self.wfile.write(SEARCH_PAGE)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_javascript_search_in_real_chrome():
+    try:
+        driver = browser_pool.headless_chrome()
+    except Exception as e:
+        pytest.skip(f"no local Chrome: {type(e).__name__}")
+    driver.quit()
+
+    from robust_scraper import RobustTromboneScraper
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), SearchPageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    scraper = RobustTromboneScraper(use_selenium=True, use_endpoint_cache=False, use_http_cache=False)
+    try:
+        page, _ = scraper.search_with_selenium(f"http://127.0.0.1:{server.server_address[1]}/", "trombone")
+        assert page is not None and "Jane Doe" in page.text
+    finally:
+        scraper.browsers.close()
+        server.shutdown()
@@ -0,0 +1,114 @@
+"""URL keys and per-host politeness of the crawl engine"""
+
+import http.server
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from crawler import HOST_INTERVAL, Cancelled, HostBudget, cancel_when, canonical_url, site_of
+
+
+@pytest.mark.parametrize("url, site", [
+    ("https://music.example.edu/faculty", "example.edu"),
+    ("https://www.example.edu/", "example.edu"),
+    ("https://music.ox.ac.uk/people", "ox.ac.uk"),
+    ("https://www.cam.ac.uk/", "cam.ac.uk"),
+    ("https://music.sydney.edu.au/staff", "sydney.edu.au"),
+    ("https://www.rcm.co.uk/", "rcm.co.uk"),
+    ("http://127.0.0.1:8000/x", "127.0.0.1"),
+])
+def test_site_of(url, site):
+    assert site_of(url) == site
+
+
+def test_universities_under_one_public_suffix_are_different_sites():
+    assert site_of("https://music.ox.ac.uk/") != site_of("https://www.cam.ac.uk/")
+
+
+def test_canonical_url_ignores_presentation_differences():
+    assert (canonical_url("HTTPS://Music.Example.edu:443/faculty/?utm_source=x&b=2&a=1#top")
+            == canonical_url("https://music.example.edu/faculty?a=1&b=2"))
+
+
+def test_cancel_when_abandons_a_request_waiting_for_its_host():
+    budget = HostBudget(interval=5)
+    stop = threading.Event()
+    outcome = []
+
+    def second_request():
+        with cancel_when(stop):
+            try:
+                with budget.slot("https://music.example.edu/b"):
+                    outcome.append("sent")
+            except Cancelled:
+                outcome.append("cancelled")
+
+    with budget.slot("https://music.example.edu/a"):
+        pass  # the next request to this host may only start 5 seconds from now
+    waiter = threading.Thread(target=second_request)
+    waiter.start()
+    time.sleep(0.2)
+    stop.set()
+    waiter.join(timeout=1)
+    assert outcome == ["cancelled"]
+
+
+def test_search_probes_stop_after_the_first_hit():
+    from robust_scraper import RobustTromboneScraper
+
+    hits = []
+
+    class SearchSite(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits.append(self.path)
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.end_headers()
+            # Every search template works, so whichever probe takes the host's first slot wins
+            self.wfile.write(b"<p>Jane Doe, trombone faculty, School of Music</p>")
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), SearchSite)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        scraper = RobustTromboneScraper(use_endpoint_cache=False, use_http_cache=False)
+        page, url = scraper.search_website(f"http://127.0.0.1:{server.server_address[1]}")
+        assert page is not None
+        time.sleep(2 * HOST_INTERVAL)  # long enough for any probe that wasn't stopped to be sent
+        assert len(hits) == 1 and url.endswith(hits[0])
+    finally:
+        server.shutdown()
+
+
+def test_google_lookups_take_turns(monkeypatch):
+    import crawler
+    import robust_scraper
+
+    calls = []
+    lock = threading.Lock()
+
+    def fake_search(query, num_results):
+        with lock:
+            calls.append(("start", time.monotonic()))
+        time.sleep(0.05)
+        with lock:
+            calls.append(("end", time.monotonic()))
+        yield f"https://{query.split()[0].lower()}.edu/"
+
+    monkeypatch.setattr(robust_scraper, "GOOGLE_SEARCH_AVAILABLE", True)
+    monkeypatch.setattr(robust_scraper, "search", fake_search, raising=False)
+    monkeypatch.setattr(crawler, "GOOGLE_BUDGET", HostBudget(interval=0.2, max_in_flight=1))
+
+    scraper = robust_scraper.RobustTromboneScraper(use_endpoint_cache=False, use_http_cache=False)
+    names = [f"Uni{i} University" for i in range(4)]
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        assert sorted(pool.map(scraper.find_university_url, names)) == [f"https://uni{i}.edu/" for i in range(4)]
+
+    # One lookup at a time, starts at least the interval apart
+    assert [kind for kind, _ in calls] == ["start", "end"] * 4
+    starts = [at for kind, at in calls if kind == "start"]
+    assert all(later - earlier >= 0.2 for earlier, later in zip(starts, starts[1:]))
@@ -0,0 +1,40 @@
+"""selectolax page text against BeautifulSoup's get_text() on the saved directory pages"""
+
+import pytest
+
+from html_backend import (FALLBACK_PARSER, FIXTURE_PAGES, LXML_AVAILABLE, SELECTOLAX_AVAILABLE, Page,
+                          benchmark, fast_text, load_pages, make_soup)
+from robust_scraper import KEYWORDS
+
+PAGES = sorted(FIXTURE_PAGES.glob("*.html"))
+PARSERS = [FALLBACK_PARSER] + (["lxml"] if LXML_AVAILABLE else [])
+
+needs_selectolax = pytest.mark.skipif(not SELECTOLAX_AVAILABLE, reason="selectolax not installed")
+
+
+def words(text):
+    return text.split()
+
+
+@needs_selectolax
+@pytest.mark.parametrize("parser", PARSERS)
+@pytest.mark.parametrize("path", PAGES, ids=lambda path: path.stem)
+def test_fast_text_matches_get_text(path, parser):
+    body = path.read_bytes()
+    assert words(fast_text(body)) == words(make_soup(body, parser).get_text())
+
+
+@needs_selectolax
+@pytest.mark.parametrize("path", PAGES, ids=lambda path: path.stem)
+def test_fast_text_finds_the_same_keywords(path):
+    body = path.read_bytes()
+    fast, soup = Page(body, matcher=KEYWORDS), Page(body, parser=FALLBACK_PARSER, matcher=KEYWORDS)
+    assert ({keyword: len(fast.hits.offsets(keyword)) for keyword in KEYWORDS.keywords}
+            == {keyword: len(soup.hits.offsets(keyword)) for keyword in KEYWORDS.keywords})
+    assert "soup" not in fast.__dict__  # answered from the selectolax text
+
+
+def test_benchmark_runs_on_the_fixture_pages():
+    bodies = load_pages([FIXTURE_PAGES])
+    assert len(bodies) == len(PAGES) > 0
+    assert set(benchmark(bodies, repeat=1)) >= {"html.parser"}
@@ -0,0 +1,24 @@
+"""Splitting a combined multi-instrument batch into the instrument folders"""
+
+import csv
+
+from multi_instrument import MULTI_HEADERS, split_batch
+
+
+def test_rows_go_to_the_instrument_they_name(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    batch = tmp_path / "uni_007.csv"
+    with open(batch, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=MULTI_HEADERS, extrasaction="ignore")
+        writer.writeheader()
+        for name, instrument in [("Ann Slide", "Trombone"), ("Bo Keys", " piano "),
+                                 ("Cy Tuba", "Low Brass (Tuba, Euphonium)"), ("Di Harp", "Harpsichord / Early Keyboard")]:
+            writer.writerow({"University": "Test U", "Instrument": instrument, "Faculty Name": name,
+                             "Email": f"{name.split()[0].lower()}@test.edu"})
+
+    counts = split_batch(7, ["trombone", "piano"], batch, tmp_path / "no_log.txt")
+
+    assert counts == {"trombone": 1, "piano": 1}
+    for folder, name in [("trombone", "Ann Slide"), ("piano", "Bo Keys")]:
+        with open(tmp_path / f"{folder}-faculty" / "results" / "batches" / "uni_007.csv", encoding="utf-8") as f:
+            assert [row["Faculty Name"] for row in csv.DictReader(f)] == [name]
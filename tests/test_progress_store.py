@@ -0,0 +1,163 @@
+"""ProgressStore claims, leases and attempts, and reconciliation with the source CSV"""
+
+import csv
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from progress_store import EMAIL_PASS, ProgressStore
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def write_source(path, universities, mtime_ns):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["University Name", "URL"])
+        writer.writerows((name, f"https://{name.lower()}.edu") for name in universities)
+    os.utime(path, ns=(mtime_ns, mtime_ns))  # a distinct stamp even within one clock tick
+
+
+def jobs(store):
+    return [(job["university"], job["state"])
+            for job in (store.get_job(EMAIL_PASS, idx) for idx in range(1, 20)) if job]
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # legacy progress files and the catalog index live next to the source
+    return ProgressStore(tmp_path / "progress.db")
+
+
+def test_regenerated_source_is_reconciled(store, tmp_path):
+    source = tmp_path / "missing.csv"
+    write_source(source, ["Alpha", "Beta", "Gamma"], 1_000_000_000)
+    store.seed(EMAIL_PASS, source)
+    first = store.claim_next(EMAIL_PASS)
+    store.mark_done(EMAIL_PASS, first["idx"], "batch_alpha.csv")
+
+    # Alpha stays (now second), Beta is gone, Delta is new
+    write_source(source, ["Gamma", "Alpha", "Delta"], 2_000_000_000)
+    store.seed(EMAIL_PASS, source)
+    assert jobs(store) == [("Gamma", "pending"), ("Alpha", "done"), ("Delta", "pending")]
+    assert store.get_job(EMAIL_PASS, 2)["batch_file"] == "batch_alpha.csv"
+
+
+def test_reconcile_waits_for_running_jobs(store, tmp_path):
+    source = tmp_path / "missing.csv"
+    write_source(source, ["Alpha", "Beta"], 1_000_000_000)
+    store.seed(EMAIL_PASS, source)
+    store.claim_next(EMAIL_PASS)  # Alpha running under index 1
+
+    write_source(source, ["Beta", "Alpha"], 2_000_000_000)
+    store.seed(EMAIL_PASS, source)
+    assert jobs(store) == [("Alpha", "running"), ("Beta", "pending")]
+
+    store.mark_done(EMAIL_PASS, 1)
+    store.seed(EMAIL_PASS, source)
+    assert jobs(store) == [("Beta", "pending"), ("Alpha", "done")]
+
+
+def test_missing_source(store, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        store.seed(EMAIL_PASS, tmp_path / "missing.csv")
+
+    source = tmp_path / "missing.csv"
+    write_source(source, ["Alpha"], 1_000_000_000)
+    store.seed(EMAIL_PASS, source)
+    source.unlink()
+    store.seed(EMAIL_PASS, source)  # keeps the jobs it already has
+    assert jobs(store) == [("Alpha", "pending")]
+
+
+def test_claim_command_exit_status(tmp_path):
+    def claim():
+        return subprocess.run([sys.executable, os.path.join(ROOT, "progress_store.py"), "claim", EMAIL_PASS],
+                              cwd=tmp_path, capture_output=True, text=True)
+
+    missing = claim()
+    assert missing.returncode != 0 and missing.stdout == ""
+
+    write_source(tmp_path / "universities_missing_emails.csv", ["Alpha"], 1_000_000_000)
+    claimed = claim()
+    assert (claimed.returncode, claimed.stdout.strip()) == (0, "1")
+    finished = claim()
+    assert (finished.returncode, finished.stdout) == (0, "")
+
+
+def test_concurrent_claims_are_unique(store, tmp_path):
+    source = tmp_path / "missing.csv"
+    names = [f"Uni{i}" for i in range(40)]
+    write_source(source, names, 1_000_000_000)
+    store.seed(EMAIL_PASS, source)
+
+    claimed = []
+    lock = threading.Lock()
+
+    def work(worker):
+        worker_store = ProgressStore(tmp_path / "progress.db")  # own connections, like a separate process
+        worker_store.seed(EMAIL_PASS, source)
+        while (job := worker_store.claim_next(EMAIL_PASS, worker)):
+            with lock:
+                claimed.append(job["idx"])
+            assert worker_store.mark_done(EMAIL_PASS, job["idx"], worker=worker)
+
+    threads = [threading.Thread(target=work, args=(f"w{i}",)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(claimed) == list(range(1, len(names) + 1))
+    assert store.counts(EMAIL_PASS) == {"done": len(names)}
+
+
+def test_expired_lease_is_reclaimed(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    store = ProgressStore(tmp_path / "progress.db", lease_seconds=0.01)
+    source = tmp_path / "missing.csv"
+    write_source(source, ["Alpha", "Beta"], 1_000_000_000)
+    store.seed(EMAIL_PASS, source)
+
+    first = store.claim_next(EMAIL_PASS, "crashed")
+    time.sleep(0.05)
+    second = store.claim_next(EMAIL_PASS, "rescuer")
+    assert (second["idx"], second["attempts"]) == (first["idx"], 2)
+
+    # The first worker reporting late changes nothing
+    assert store.mark_failed(EMAIL_PASS, first["idx"], "crashed") is None
+    assert not store.mark_done(EMAIL_PASS, first["idx"], "late.csv", worker="crashed")
+    job = store.get_job(EMAIL_PASS, first["idx"])
+    assert (job["state"], job["worker"], job["batch_file"]) == ("running", "rescuer", None)
+    assert store.mark_done(EMAIL_PASS, first["idx"], "batch.csv", worker="rescuer")
+
+
+def test_crashing_job_fails_after_max_attempts(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    store = ProgressStore(tmp_path / "progress.db", max_attempts=3, lease_seconds=0.01)
+    source = tmp_path / "missing.csv"
+    write_source(source, ["Alpha"], 1_000_000_000)
+    store.seed(EMAIL_PASS, source)
+
+    # A worker that never reports back
+    claims = 0
+    while store.claim_next(EMAIL_PASS, f"w{claims}"):
+        claims += 1
+        assert claims <= 3
+        time.sleep(0.02)
+    job = store.get_job(EMAIL_PASS, 1)
+    assert (claims, job["state"], job["attempts"]) == (3, "failed", 3)
+
+
+def test_failed_job_requeued_until_max_attempts(store, tmp_path):
+    source = tmp_path / "missing.csv"
+    write_source(source, ["Alpha"], 1_000_000_000)
+    store.seed(EMAIL_PASS, source)
+
+    states = []
+    while (job := store.claim_next(EMAIL_PASS, "w")):
+        states.append(store.mark_failed(EMAIL_PASS, job["idx"], "w"))
+    assert states == ["pending", "pending", "failed"]
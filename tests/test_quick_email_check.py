@@ -0,0 +1,146 @@
+"""quick_email_check.py against a local stub DNS server"""
+
+import asyncio
+import socket
+import threading
+import time
+from collections import Counter
+
+import dns.flags
+import dns.message
+import dns.rcode
+import dns.rdatatype
+import dns.rrset
+import pytest
+
+import quick_email_check as qec
+
+SOA = "ns.example. hostmaster.example. 1 3600 600 86400 120"
+REPLY_DELAY = 0.05   # keeps several queries in flight at once
+
+
+class StubDNS:
+    """UDP nameserver with canned answers; names in `drop` are answered only
+    after `drop[name]` queries for them have been ignored"""
+
+    def __init__(self, drop=None):
+        self.drop = dict(drop or {})
+        self.queries = Counter()
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(("127.0.0.1", 0))
+        self.port = self.sock.getsockname()[1]
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def _serve(self):
+        while True:
+            try:
+                wire, addr = self.sock.recvfrom(4096)
+            except OSError:
+                return
+            query = dns.message.from_wire(wire)
+            name = query.question[0].name.to_text().lower()
+            with self._lock:
+                self.queries[name] += 1
+                if self.queries[name] <= self.drop.get(name, 0):
+                    continue  # let the client time out
+            threading.Timer(REPLY_DELAY, self._reply, (query, name, addr)).start()
+
+    def _reply(self, query, name, addr):
+        response = dns.message.make_response(query)
+        response.flags |= dns.flags.AA
+        zone = name.split(".", 1)[1]
+        if name.startswith("nx."):
+            response.set_rcode(dns.rcode.NXDOMAIN)
+            response.authority.append(dns.rrset.from_text(zone, 300, "IN", "SOA", SOA))
+        elif name.startswith("nomx."):
+            response.authority.append(dns.rrset.from_text(zone, 300, "IN", "SOA", SOA))
+        else:
+            response.answer.append(dns.rrset.from_text(name, 900, "IN", "MX", f"10 mail.{name}"))
+        try:
+            self.sock.sendto(response.to_wire(), addr)
+        except OSError:
+            pass
+
+    def close(self):
+        self.sock.close()
+
+
+class CountingResolver:
+    """Wraps a resolver and records the most queries it ever had in flight"""
+
+    def __init__(self, resolver):
+        self.resolver = resolver
+        self.in_flight = 0
+        self.peak = 0
+
+    async def resolve(self, *args, **kwargs):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            return await self.resolver.resolve(*args, **kwargs)
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def stub():
+    server = StubDNS(drop={"flaky.example.": 1, "dead.example.": 99})
+    yield server
+    server.close()
+
+
+def check(stub, domains, **kwargs):
+    kwargs.setdefault("timeout", 0.3)
+    return qec.check_domains(domains, ["127.0.0.1"], stub.port, use_cache=False, **kwargs)
+
+
+def test_classifies_answers(stub):
+    result = check(stub, ["mx.example", "nx.example", "nomx.example", "dead.example"], retries=1)
+    assert result == {"mx.example": True, "nx.example": False,
+                      "nomx.example": False, "dead.example": False}
+
+
+def test_negative_answers_carry_soa_ttl(stub):
+    async def run():
+        resolver = qec.make_resolver(["127.0.0.1"], stub.port)
+        semaphore = asyncio.Semaphore(5)
+        return await asyncio.gather(*(qec.resolve_mx_async(domain, resolver, semaphore, timeout=0.3)
+                                      for domain in ["mx.example", "nx.example", "nomx.example"]))
+    found, nxdomain, no_mx = asyncio.run(run())
+    assert found == (True, ["mail.mx.example."], 900)
+    assert nxdomain == (False, [], 120)  # SOA minimum
+    assert no_mx == (False, [], 120)
+
+
+def test_only_timeouts_are_retried(stub):
+    result = check(stub, ["mx.example", "nx.example", "nomx.example", "flaky.example", "dead.example"],
+                   retries=2)
+    assert result["flaky.example"] is True   # answered on the retry
+    assert result["dead.example"] is False   # timed out every attempt
+    assert stub.queries["mx.example."] == 1
+    assert stub.queries["nx.example."] == 1
+    assert stub.queries["nomx.example."] == 1
+    assert stub.queries["flaky.example."] == 2
+    assert stub.queries["dead.example."] == 3
+
+
+def test_timeouts_are_not_cached(stub, tmp_path):
+    cache = qec.MXCache(tmp_path / "mx.db")
+    resolver = qec.make_resolver(["127.0.0.1"], stub.port)
+    asyncio.run(qec.check_domains_async(["mx.example", "nx.example", "dead.example"], resolver,
+                                        timeout=0.3, retries=0, cache=cache))
+    assert set(cache.get_many(["mx.example", "nx.example", "dead.example"])) == {"mx.example", "nx.example"}
+
+
+def test_semaphore_bounds_queries_in_flight(stub):
+    domains = [f"host{i}.example" for i in range(30)]
+    resolver = CountingResolver(qec.make_resolver(["127.0.0.1"], stub.port))
+    start = time.monotonic()
+    result = asyncio.run(qec.check_domains_async(domains, resolver, max_concurrent=5, timeout=1.0))
+    elapsed = time.monotonic() - start
+    assert all(result.values())
+    assert resolver.peak == 5
+    # 30 replies delayed REPLY_DELAY each, five at a time - not one at a time
+    assert elapsed < len(domains) * REPLY_DELAY
@@ -0,0 +1,41 @@
+"""Behaviour of RobustTromboneScraper's page extraction"""
+
+import pytest
+
+from html_backend import make_soup
+from robust_scraper import RobustTromboneScraper
+
+
+@pytest.fixture(scope="module")
+def scraper():
+    return RobustTromboneScraper(use_endpoint_cache=False, use_http_cache=False)
+
+
+def extract(scraper, text):
+    # A bare <p> keeps the element-based strategies (1, 1b, 2) out of the way
+    return scraper.extract_trombone_faculty(make_soup(f"<html><body><p>{text}</p></body></html>"))
+
+
+def test_name_institution_match_uses_its_own_offset(scraper):
+    # The same name earlier on the page, far from any trombone mention, must
+    # not stand in for the occurrence that is next to one
+    filler = "lorem ipsum dolor " * 30
+    text = (f"Jane Doe | choir department | {filler}"
+            f"Jane Doe | school of music, professor of trombone, jdoe@music.state.edu")
+    assert extract(scraper, text) == [{"name": "Jane Doe", "email": "jdoe@music.state.edu"}]
+
+
+def test_email_cut_by_the_window_edge_is_not_returned(scraper):
+    # Strategy 4 takes emails within 200 characters of the name; one that
+    # starts inside the window but ends outside it is skipped, not truncated
+    head = "Tom Baker, trombone. "
+    email = "tbaker@music.state.edu"
+    text = head + "x" * (184 - len(head)) + " " + email
+    # A window ending at 200 would cut it to "tbaker@music.st", which still looks like an address
+    assert text[text.index(email):200] == "tbaker@music.st"
+    assert extract(scraper, text) == [{"name": "Tom Baker", "email": None}]
+
+
+def test_email_inside_the_window_is_returned(scraper):
+    text = "Tom Baker, trombone. Contact tbaker@music.state.edu for lessons."
+    assert extract(scraper, text) == [{"name": "Tom Baker", "email": "tbaker@music.state.edu"}]
@@ -0,0 +1,143 @@
+"""SMTPSessionVerifier against a local aiosmtpd server"""
+
+import socket
+import time
+
+import pytest
+
+aiosmtpd_controller = pytest.importorskip("aiosmtpd.controller")
+
+from validate_emails import SMTPSessionVerifier  # noqa: E402
+
+HOST = "127.0.0.1"
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind((HOST, 0))
+        return sock.getsockname()[1]
+
+
+class Mailbox:
+    """Accepts known recipients, rejects the rest with 550, and can drop the
+    connection the first time a given address is probed"""
+
+    def __init__(self, known, drop_on=()):
+        self.known = set(known)
+        self.drop_on = set(drop_on)
+        self.connections = 0
+        self.mail_froms = 0
+        self.rsets = 0
+        self.rcpts = []
+        self.rcpt_times = []
+
+    async def handle_HELO(self, server, session, envelope, hostname):
+        self.connections += 1
+        session.host_name = hostname
+        return f"250 {server.hostname}"
+
+    async def handle_MAIL(self, server, session, envelope, address, mail_options):
+        self.mail_froms += 1
+        envelope.mail_from = address
+        return "250 OK"
+
+    async def handle_RSET(self, server, session, envelope):
+        self.rsets += 1
+        return "250 OK"
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        self.rcpts.append(address)
+        self.rcpt_times.append(time.monotonic())
+        if address in self.drop_on:
+            self.drop_on.discard(address)
+            server.transport.close()
+            return "250 OK"  # never reaches the client
+        if address not in self.known:
+            return "550 No such user"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        raise AssertionError("the verifier must never send DATA")
+
+
+@pytest.fixture
+def smtp_server():
+    servers = []
+
+    def start(handler, host=HOST, port=None):
+        controller = aiosmtpd_controller.Controller(handler, hostname=host, port=port or free_port())
+        controller.start()
+        servers.append(controller)
+        return controller.port
+
+    yield start
+    for controller in servers:
+        controller.stop()
+
+
+def verifier(port, **kwargs):
+    kwargs.setdefault("host_interval", 0)
+    return SMTPSessionVerifier(port=port, timeout=5, **kwargs)
+
+
+def test_classifies_250_and_550_on_one_session(smtp_server):
+    mailbox = Mailbox(known={"ann@example.edu", "bob@example.edu"})
+    port = smtp_server(mailbox)
+    results = verifier(port).verify_host(HOST, ["ann@example.edu", "zed@example.edu", "bob@example.edu"])
+    assert results == {
+        "ann@example.edu": ("valid", "RCPT accepted"),
+        "zed@example.edu": ("invalid", "User does not exist"),
+        "bob@example.edu": ("valid", "RCPT accepted"),
+    }
+    assert mailbox.connections == 1
+    assert mailbox.mail_froms == 1
+
+
+def test_rset_after_rcpts_per_transaction(smtp_server):
+    emails = [f"user{i}@example.edu" for i in range(7)]
+    mailbox = Mailbox(known=emails)
+    port = smtp_server(mailbox)
+    results = verifier(port, rcpts_per_transaction=3).verify_host(HOST, emails)
+    assert all(status == "valid" for status, _ in results.values())
+    assert mailbox.connections == 1
+    assert mailbox.rsets == 2        # after recipients 3 and 6
+    assert mailbox.mail_froms == 3   # a new MAIL FROM opens each transaction
+
+
+def test_reconnects_once_after_the_server_drops_the_session(smtp_server):
+    emails = ["ann@example.edu", "bob@example.edu", "cat@example.edu"]
+    mailbox = Mailbox(known=emails, drop_on={"bob@example.edu"})
+    port = smtp_server(mailbox)
+    results = verifier(port).verify_host(HOST, emails)
+    assert all(status == "valid" for status, _ in results.values())
+    assert mailbox.connections == 2
+    assert mailbox.rcpts == ["ann@example.edu", "bob@example.edu", "bob@example.edu", "cat@example.edu"]
+
+
+def test_refused_host_is_unknown():
+    emails = ["ann@example.edu", "bob@example.edu"]
+    results = verifier(free_port()).verify_host(HOST, emails)
+    assert set(results) == set(emails)
+    assert all(status == "unknown" for status, _ in results.values())
+
+
+def test_hosts_run_in_parallel_each_rate_limited(smtp_server):
+    # Two MX hosts on the same port: 127.0.0.1 and 127.0.0.2 are both loopback
+    port = free_port()
+    hosts = {"127.0.0.1": Mailbox(known=[f"a{i}@one.edu" for i in range(4)]),
+             "127.0.0.2": Mailbox(known=[f"b{i}@two.edu" for i in range(4)])}
+    for host, mailbox in hosts.items():
+        smtp_server(mailbox, host=host, port=port)
+
+    interval = 0.2
+    results = verifier(port, host_interval=interval).verify_many(
+        {host: sorted(mailbox.known) for host, mailbox in hosts.items()})
+    assert len(results) == 8 and all(status == "valid" for status, _ in results.values())
+
+    for mailbox in hosts.values():
+        times = mailbox.rcpt_times
+        assert len(times) == 4 and mailbox.connections == 1
+        assert all(later - earlier >= interval * 0.95 for earlier, later in zip(times, times[1:]))
+    one, two = (mailbox.rcpt_times for mailbox in hosts.values())
+    assert max(one[0], two[0]) < min(one[-1], two[-1])  # the two hosts' probes overlap in time
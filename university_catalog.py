@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Indexed university catalog - parse music_schools_wikipedia.csv once and reuse it
+
+The first load parses the CSV and writes a pickled index next to it
+(music_schools_wikipedia.idx.pkl). Later loads read the pickle instead, as
+long as the CSV's size and mtime are unchanged. Rows are keyed by 1-based
+index and by normalized university name, so lookups are O(1).
+
+Long-lived processes (parallel_scraper.py) should call get_catalog() once
+and keep the result; it is also cached per process.
+
+Usage:
+  python3 university_catalog.py [csv_file]   # rebuild the index and print a summary
+"""
+
+import csv
+import pickle
+import re
+import sys
+from pathlib import Path
+
+UNIVERSITIES_FILE = Path("music_schools_wikipedia.csv")
+INDEX_VERSION = 1
+
+_catalogs = {}
+
+def normalize_name(name):
+    """Case- and whitespace-insensitive key for a university name"""
+    return re.sub(r'\s+', ' ', name or '').strip().lower()
+
+class UniversityCatalog:
+    def __init__(self, rows, source_stamp=None, by_name=None):
+        self.rows = rows
+        self.source_stamp = source_stamp
+        if by_name is None:
+            by_name = {}
+            for idx, row in enumerate(rows, start=1):
+                by_name.setdefault(normalize_name(row.get('University Name')), idx)
+        self.by_name = by_name
+
+    def __len__(self):
+        return len(self.rows)
+
+    def get(self, idx):
+        """Row for university #idx (1-based), or None if out of range"""
+        return self.rows[idx - 1] if 0 < idx <= len(self.rows) else None
+
+    def find(self, name):
+        """(idx, row) for a university name, or (None, None)"""
+        idx = self.by_name.get(normalize_name(name))
+        return (idx, self.rows[idx - 1]) if idx else (None, None)
+
+    def url_for(self, name):
+        _, row = self.find(name)
+        return row.get('URL', '') if row else ''
+
+def _stamp(csv_file):
+    stat = csv_file.stat()
+    return (INDEX_VERSION, stat.st_size, stat.st_mtime_ns)
+
+def _index_path(csv_file):
+    return csv_file.with_suffix('.idx.pkl')
+
+def build_index(csv_file=UNIVERSITIES_FILE):
+    """Parse the CSV and write the pickled index next to it"""
+    csv_file = Path(csv_file)
+    stamp = _stamp(csv_file)
+    with open(csv_file, 'r', encoding='utf-8') as f:
+        catalog = UniversityCatalog(list(csv.DictReader(f)), stamp)
+
+    try:
+        tmp_path = _index_path(csv_file).with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            # Plain containers only, so the pickle doesn't depend on how this module was imported
+            pickle.dump((catalog.source_stamp, catalog.rows, catalog.by_name), f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(_index_path(csv_file))
+    except OSError as e:
+        print(f"Warning: could not write catalog index: {e}")
+    return catalog
+
+def load_catalog(csv_file=UNIVERSITIES_FILE):
+    """Load from the pickled index if it is current, else rebuild it"""
+    csv_file = Path(csv_file)
+    index_file = _index_path(csv_file)
+    if index_file.exists():
+        try:
+            with open(index_file, 'rb') as f:
+                stamp, rows, by_name = pickle.load(f)
+            if stamp == _stamp(csv_file):
+                return UniversityCatalog(rows, stamp, by_name)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+            pass
+    return build_index(csv_file)
+
+def get_catalog(csv_file=UNIVERSITIES_FILE):
+    """Process-wide cached catalog for csv_file"""
+    key = str(Path(csv_file).resolve())
+    if key not in _catalogs:
+        _catalogs[key] = load_catalog(csv_file)
+    return _catalogs[key]
+
+if __name__ == "__main__":
+    csv_file = Path(sys.argv[1]) if len(sys.argv) > 1 else UNIVERSITIES_FILE
+    catalog = build_index(csv_file)
+    with_urls = sum(1 for row in catalog.rows if row.get('URL'))
+    print(f"Indexed {len(catalog)} universities ({with_urls} with URLs) -> {_index_path(csv_file)}")
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Helpers for the per-university URL logs (tmp/uni_XXX_urls.txt, results/url_logs/)
+
+The agent appends one URL per line, so the last visited URL is at the end
+of the file. last_url() seeks backwards from the end in fixed-size blocks,
+so finding it costs the same however long the crawl trail is.
+"""
+
+import os
+
+BLOCK_SIZE = 4096
+PLACEHOLDER_PREFIX = "No URL tracking"
+
+def iter_lines_reversed(path, block_size=BLOCK_SIZE):
+    """Yield the lines of a file (as bytes, without newlines) from last to first"""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        tail = b''
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            block = f.read(read_size) + tail
+            lines = block.split(b'\n')
+            # The first piece may be the end of a line that starts in an earlier block
+            tail = lines.pop(0)
+            for line in reversed(lines):
+                yield line
+        yield tail
+
+def last_url(path):
+    """Last non-empty URL in a URL log, or None if there isn't one"""
+    for line in iter_lines_reversed(path):
+        url = line.decode('utf-8', errors='replace').strip()
+        if url and not url.startswith(PLACEHOLDER_PREFIX):
+            return url
+    return None